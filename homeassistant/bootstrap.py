@@ -85,6 +85,7 @@ from .helpers import (
     recorder,
     restore_state,
     template,
+    template_bytecode,
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
@@ -435,6 +436,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template_bytecode.async_load(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -121,7 +121,7 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_read_only_executor_job(
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -38,7 +38,7 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES, MAX_POINTS
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +59,7 @@ class HistoryLiveStream:
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    websocket_api.async_register_command(hass, ws_get_downsampled_history_during_period)
     websocket_api.async_register_command(hass, ws_stream)
 
 
@@ -159,7 +160,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_only_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -174,6 +175,86 @@ async def ws_get_history_during_period(
     )
 
 
+def _ws_get_downsampled_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    points: int,
+) -> bytes:
+    """Fetch downsampled history and convert it to json in the executor."""
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            history.get_downsampled_states(
+                hass, start_time, end_time, entity_ids, points
+            ),
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/downsampled_history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Required("points"): vol.All(int, vol.Range(min=1, max=MAX_POINTS)),
+    }
+)
+@websocket_api.async_response
+async def ws_get_downsampled_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle downsampled history during period websocket command.
+
+    The numeric states of each entity are reduced to the min, max and
+    mean of points buckets and sent as columnar arrays, which keeps the
+    response small for long periods of frequently updated sensors.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str := msg.get("end_time"):
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    if start_time > dt_util.utcnow() or (end_time and end_time <= start_time):
+        connection.send_result(msg["id"], {})
+        return
+
+    entity_ids: list[str] = msg["entity_ids"]
+    for entity_id in entity_ids:
+        if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
+            connection.send_error(msg["id"], "invalid_entity_ids", "Invalid entity_ids")
+            return
+
+    if end_time and not has_states_before(hass, end_time):
+        connection.send_result(msg["id"], {})
+        return
+
+    connection.send_message(
+        await get_instance(hass).async_add_read_only_executor_job(
+            _ws_get_downsampled_states,
+            hass,
+            msg["id"],
+            start_time,
+            end_time,
+            entity_ids,
+            msg["points"],
+        )
+    )
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
@@ -282,7 +363,11 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    (
+        last_time_ts,
+        last_time_dt,
+        payload,
+    ) = await instance.async_add_read_only_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
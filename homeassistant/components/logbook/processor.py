@@ -6,11 +6,14 @@ from collections.abc import Callable, Generator, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import math
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -36,6 +39,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -81,6 +85,7 @@ from .models import (
 )
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.contexts import contexts_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -157,32 +162,147 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
+            return self.humanify(
+                execute_stmt_lambda_element(
+                    session,
+                    self._statement_for_request(session, start_day, end_day),
+                    orm_rows=False,
                 )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
+            )
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        cursor: float | None = None,
+    ) -> tuple[list[dict[str, Any]], float | None]:
+        """Get a page of the events for a period of time.
+
+        The page has the events of at most limit rows after cursor, the
+        cursor of the first page is None. The rows of a timestamp are
+        never split over pages, rows are dropped from the end of the
+        page until the page ends with a complete timestamp. A page of
+        a single timestamp has all rows of the timestamp.
+
+        Returns the events and the cursor of the next page,
+        which is None if this is the last page.
+        """
+        # The contexts of the rows of a page are resolved
+        # per page, only the contexts of one page are kept
+        self.logbook_run.context_lookup.clear()
+        self.logbook_run.context_lookup[None] = None
+        self.logbook_run.event_cache.clear()
+        after = start_day.timestamp() if cursor is None else cursor
+        with session_scope(hass=self.hass, read_only=True) as session:
+
+            def _rows(before: float | None, row_limit: int | None) -> Sequence[Row]:
+                return cast(
+                    Sequence[Row],
+                    execute_stmt_lambda_element(
+                        session,
+                        self._statement_for_request(
+                            session, start_day, end_day, after, before, row_limit
+                        ),
+                        orm_rows=False,
+                    ),
                 )
+
+            fetch_limit = limit + 1
+            next_cursor: float | None = None
+            while len(rows := _rows(None, fetch_limit)) == fetch_limit:
+                next_page_ts = rows[-1][TIME_FIRED_TS_POS]
+                page_rows = [
+                    row for row in rows if row[TIME_FIRED_TS_POS] < next_page_ts
+                ]
+                if page_rows and page_rows[-1][TIME_FIRED_TS_POS] > after:
+                    rows = page_rows
+                    next_cursor = page_rows[-1][TIME_FIRED_TS_POS]
+                    break
+                if page_ts := [
+                    row[TIME_FIRED_TS_POS]
+                    for row in rows
+                    if row[TIME_FIRED_TS_POS] > after
+                ]:
+                    # The rows after the cursor are all of one timestamp, which
+                    # cannot be split, the page has all rows of the timestamp
+                    rows = _rows(math.nextafter(page_ts[0], math.inf), None)
+                    next_cursor = page_ts[0]
+                    break
+                # The rows are all of contexts before the page
+                fetch_limit *= 2
+            if cursor is not None:
+                self._load_contexts(session, rows, start_day.timestamp(), cursor)
+            return self.humanify(rows), next_cursor
+
+    def _statement_for_request(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+        after: float | None = None,
+        before: float | None = None,
+        limit: int | None = None,
+    ) -> StatementLambdaElement:
+        """Generate the statement for the events of a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+            after,
+            before,
+            limit,
+        )
+
+    def _load_contexts(
+        self,
+        session: Session,
+        rows: Sequence[Row],
+        start_day: float,
+        end_day: float,
+    ) -> None:
+        """Load the first rows of the contexts of rows in start_day-end_day.
+
+        The first row of a context is the row that started the context,
+        the contexts that started before the page are in previous pages.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_id_bins = {
+            context_id_bin
+            for row in rows
+            for context_id_bin in (
+                row[CONTEXT_ID_BIN_POS],
+                row[CONTEXT_PARENT_ID_BIN_POS],
             )
+            if context_id_bin is not None
+        }
+        for context_id_bins_chunk in chunked_or_all(
+            context_id_bins, get_instance(self.hass).max_bind_vars
+        ):
+            for row in execute_stmt_lambda_element(
+                session,
+                contexts_stmt(start_day, end_day, list(context_id_bins_chunk)),
+                orm_rows=False,
+            ):
+                context_id_bin = row[CONTEXT_ID_BIN_POS]
+                if context_id_bin not in context_lookup:
+                    context_lookup[context_id_bin] = row
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -26,10 +26,44 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    after: float | None = None,
+    before: float | None = None,
+    limit: int | None = None,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
-    start_day = start_day_dt.timestamp()
-    end_day = end_day_dt.timestamp()
+    """Generate the logbook statement for a logbook request.
+
+    after is the timestamp of the last row of the previous page, the
+    rows of the page are the first limit rows after it. before ends
+    the page before end_day_dt.
+    """
+    start_day = start_day_dt.timestamp() if after is None else after
+    end_day = end_day_dt.timestamp() if before is None else before
+    stmt = _statement_for_period(
+        start_day,
+        end_day,
+        event_type_ids,
+        entity_ids,
+        states_metadata_ids,
+        device_ids,
+        filters,
+        context_id,
+    )
+    if limit is not None:
+        stmt += lambda s: s.limit(limit)
+    return stmt
+
+
+def _statement_for_period(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None,
+    states_metadata_ids: Collection[int] | None,
+    device_ids: list[str] | None,
+    filters: Filters | None,
+    context_id: str | None,
+) -> StatementLambdaElement:
+    """Generate the logbook statement for start_day-end_day."""
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
@@ -0,0 +1,56 @@
+"""Context queries for logbook."""
+
+from __future__ import annotations
+
+from sqlalchemy import lambda_stmt, union_all
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def contexts_stmt(
+    start_day: float, end_day: float, context_id_bins: list[bytes]
+) -> StatementLambdaElement:
+    """Generate a logbook query for the rows of contexts in start_day-end_day.
+
+    The rows are context only, they are only used to
+    link the rows of a page to the rows of their contexts.
+    """
+    return lambda_stmt(
+        lambda: union_all(
+            apply_events_context_hints(
+                select_events_context_only()
+                .where(
+                    (Events.time_fired_ts > start_day)
+                    & (Events.time_fired_ts <= end_day)
+                )
+                .where(Events.context_id_bin.in_(context_id_bins))
+                .outerjoin(
+                    EventTypes, (Events.event_type_id == EventTypes.event_type_id)
+                )
+                .outerjoin(EventData, (Events.data_id == EventData.data_id))
+            ),
+            apply_states_context_hints(
+                select_states_context_only()
+                .where(
+                    (States.last_updated_ts > start_day)
+                    & (States.last_updated_ts <= end_day)
+                )
+                .where(States.context_id_bin.in_(context_id_bins))
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            ),
+        ).order_by(Events.time_fired_ts)
+    )
@@ -35,6 +35,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# maximum number of rows of a page of logbook/get_events
+MAX_PAGE_SIZE = 10000
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -163,7 +165,7 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_only_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -441,6 +443,23 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    limit: int,
+    cursor: float | None,
+) -> bytes:
+    """Fetch a page of events and convert it to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
+    return json_bytes(
+        messages.result_message(msg_id, {"events": events, "next_cursor": next_cursor})
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -449,13 +468,21 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+        vol.Optional("cursor"): vol.Coerce(float),
     }
 )
 @websocket_api.async_response
 async def ws_get_events(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle logbook get events websocket command."""
+    """Handle logbook get events websocket command.
+
+    If limit is set the events are returned in pages, the
+    next_cursor of a page is the cursor of the next page.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
     utc_now = dt_util.utcnow()
@@ -474,8 +501,11 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    limit: int | None = msg.get("limit")
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(
+            msg["id"], [] if limit is None else {"events": [], "next_cursor": None}
+        )
         return
 
     device_ids = msg.get("device_ids")
@@ -485,7 +515,10 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(
+                msg["id"],
+                [] if limit is None else {"events": [], "next_cursor": None},
+            )
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -500,8 +533,22 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if limit is not None:
+        connection.send_message(
+            await get_instance(hass).async_add_read_only_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                limit,
+                msg.get("cursor"),
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_only_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -7,7 +7,7 @@ from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -82,6 +82,7 @@ from .models import (
     PublishMessage,
     PublishPayloadType,
     ReceiveMessage,
+    share_json_payloads,
 )
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
@@ -267,12 +268,108 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """A topic level in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Match topics against all wildcard subscriptions at once.
+
+    The subscriptions share a single trie keyed by topic level so matching
+    a topic only walks the levels of the topic instead of testing every
+    wildcard subscription. Nodes are pruned when their last subscription is
+    removed, so memory is bounded by the active subscriptions.
+    """
+
+    __slots__ = ("_root", "_order", "_next_order")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        # Matches are returned in the order the subscriptions were added
+        self._order: dict[Subscription, int] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions in the trie."""
+        return len(self._order)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._order[subscription] = self._next_order
+        self._next_order += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        del self._order[subscription]
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        matches: list[Subscription] = []
+        if not self._order:
+            return matches
+        levels = topic.split("/")
+        # Topics starting with $ are not matched by a wildcard at the first level
+        wildcards = topic[:1] != "$"
+        nodes = [self._root]
+        for level in levels:
+            next_nodes: list[_SubscriptionTrieNode] = []
+            for node in nodes:
+                if not (children := node.children):
+                    continue
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if not wildcards:
+                    continue
+                if (plus := children.get("+")) is not None and plus is not child:
+                    next_nodes.append(plus)
+                if (hash_ := children.get("#")) is not None and hash_ is not child:
+                    matches.extend(hash_.subscriptions)
+            if not (nodes := next_nodes):
+                break
+            wildcards = True
+        for node in nodes:
+            matches.extend(node.subscriptions)
+            # A multi-level wildcard also matches the parent level
+            if (hash_ := node.children.get("#")) is not None:
+                matches.extend(hash_.subscriptions)
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -379,6 +476,7 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_subscription_trie = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -411,6 +509,8 @@ class MQTT:
             )
         )
         self._socket_buffersize: int | None = None
+        # Messages received during the current socket read
+        self._pending_messages: list[mqtt.MQTTMessage] | None = None
 
     @callback
     def _async_ha_started(self, _hass: HomeAssistant) -> None:
@@ -498,7 +598,15 @@ class MQTT:
     @callback
     def _async_reader_callback(self, client: mqtt.Client) -> None:
         """Handle reading data from the socket."""
-        if (status := client.loop_read(MAX_PACKETS_TO_READ)) != 0:
+        pending_messages: list[mqtt.MQTTMessage] = []
+        self._pending_messages = pending_messages
+        try:
+            status = client.loop_read(MAX_PACKETS_TO_READ)
+        finally:
+            self._pending_messages = None
+        if pending_messages:
+            self._async_process_messages(pending_messages)
+        if status != 0:
             self._async_on_disconnect(status)
 
     @callback
@@ -743,28 +851,24 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscription_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -775,6 +879,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscription_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -845,11 +950,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -861,7 +964,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1054,24 +1156,38 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        subscriptions = self._wildcard_subscription_trie.match(topic)
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+            # Simple subscriptions come first
+            subscriptions[:0] = self._simple_subscriptions[topic]
         return subscriptions
 
     @callback
     def _async_mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
+        if (pending_messages := self._pending_messages) is not None:
+            # Messages that arrive in one socket read are delivered
+            # as a batch once the read is complete
+            pending_messages.append(msg)
+            return
+        self._async_process_messages((msg,))
+
+    @callback
+    def _async_process_messages(self, msgs: Iterable[mqtt.MQTTMessage]) -> None:
+        """Deliver a batch of received messages.
+
+        The subscribers of all messages in the batch share the parsed
+        JSON payloads.
+        """
+        with share_json_payloads():
+            for msg in msgs:
+                self._async_process_message(msg)
+
+    @callback
+    def _async_process_message(self, msg: mqtt.MQTTMessage) -> None:
+        """Deliver a received message to the matching subscriptions."""
         try:
             # msg.topic is a property that decodes the topic to a string
             # every time it is accessed. Save the result to avoid
@@ -1095,7 +1211,15 @@ class MQTT:
             msg.payload[0:8192],
         )
         subscriptions = self._matching_subscriptions(topic)
-        msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        # Decode the payload only once per encoding so all subscribers
+        # share the same payload object, which also lets them share
+        # the parsed JSON value.
+        payload_by_encoding: dict[str | None, SubscribePayloadType | None] = {
+            None: msg.payload
+        }
+        msg_cache_by_subscription_topic: dict[
+            tuple[str, str | None], ReceiveMessage
+        ] = {}
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1106,23 +1230,29 @@ class MQTT:
                 # Remember the subscription had an initial retained message
                 self._retained_topics[subscription].add(topic)
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+            encoding = subscription.encoding
+            if encoding in payload_by_encoding:
+                payload = payload_by_encoding[encoding]
+            else:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    payload = msg.payload.decode(encoding)
                 except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload[0:8192],
-                        topic,
-                        subscription.encoding,
-                        subscription.job,
-                    )
-                    continue
+                    payload = None
+                payload_by_encoding[encoding] = payload
+            if payload is None:
+                _LOGGER.warning(
+                    "Can't decode payload %s on %s with encoding %s (for %s)",
+                    msg.payload[0:8192],
+                    topic,
+                    encoding,
+                    subscription.job,
+                )
+                continue
             subscription_topic = subscription.topic
-            if subscription_topic not in msg_cache_by_subscription_topic:
+            cache_key = (subscription_topic, encoding)
+            if cache_key not in msg_cache_by_subscription_topic:
                 # Only make one copy of the message
-                # per topic so we avoid storing a separate
+                # per topic and encoding so we avoid storing a separate
                 # dataclass in memory for each subscriber
                 # to the same topic for retained messages
                 receive_msg = ReceiveMessage(
@@ -1133,9 +1263,9 @@ class MQTT:
                     subscription_topic,
                     msg.timestamp,
                 )
-                msg_cache_by_subscription_topic[subscription_topic] = receive_msg
+                msg_cache_by_subscription_topic[cache_key] = receive_msg
             else:
-                receive_msg = msg_cache_by_subscription_topic[subscription_topic]
+                receive_msg = msg_cache_by_subscription_topic[cache_key]
             job = subscription.job
             if job.job_type is HassJobType.Callback:
                 # We do not wrap Callback jobs in catch_log_exception since
@@ -1261,13 +1391,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
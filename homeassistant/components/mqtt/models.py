@@ -5,7 +5,9 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import StrEnum
 import logging
@@ -24,6 +26,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, JsonValueType, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -48,6 +51,11 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_THIS = "this"
 
+# The parsed JSON payloads of the message being delivered
+_json_payloads: ContextVar[
+    dict[ReceivePayloadType, JsonValueType | PayloadSentinel] | None
+] = ContextVar("mqtt_json_payloads", default=None)
+
 type PublishPayloadType = str | bytes | int | float | None
 
 
@@ -67,6 +75,58 @@ def convert_outgoing_mqtt_payload(
     return payload
 
 
+@contextmanager
+def share_json_payloads() -> Generator[None]:
+    """Share the parsed JSON payloads while messages are delivered.
+
+    All subscribers of the messages get the same parsed payload.
+    Templates can't mutate it, other consumers which keep parts of
+    it use copy_json_value.
+    """
+    token = _json_payloads.set({})
+    try:
+        yield
+    finally:
+        _json_payloads.reset(token)
+
+
+def async_json_loads_payload(
+    payload: ReceivePayloadType,
+) -> JsonValueType | PayloadSentinel:
+    """Parse a received payload as JSON.
+
+    Returns PayloadSentinel.NONE if the payload is not valid JSON.
+    The payload is only parsed once while messages are delivered and
+    the result must not be mutated.
+    """
+    if (json_payloads := _json_payloads.get()) is None or not isinstance(
+        payload, (str, bytes)
+    ):
+        return _json_loads_or_sentinel(payload)
+    if (value_json := json_payloads.get(payload)) is None:
+        value_json = json_payloads[payload] = _json_loads_or_sentinel(payload)
+    return value_json
+
+
+def copy_json_value(value: JsonValueType) -> JsonValueType:
+    """Return a copy of the lists and dicts of a parsed JSON value."""
+    if isinstance(value, dict):
+        return {key: copy_json_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json_value(item) for item in value]
+    return value
+
+
+def _json_loads_or_sentinel(
+    payload: ReceivePayloadType,
+) -> JsonValueType | PayloadSentinel:
+    """Parse a payload as JSON or return PayloadSentinel.NONE."""
+    try:
+        return json_loads(payload)
+    except JSON_DECODE_EXCEPTIONS:
+        return PayloadSentinel.NONE
+
+
 @dataclass
 class PublishMessage:
     """MQTT Message for publishing."""
@@ -291,6 +351,11 @@ class MqttValueTemplate:
         if self._config_attributes is not None:
             values.update(self._config_attributes)
 
+        if (value_json := async_json_loads_payload(payload)) is not (
+            PayloadSentinel.NONE
+        ):
+            values["value_json"] = value_json
+
         if self._entity:
             values[ATTR_ENTITY_ID] = self._entity.entity_id
             values[ATTR_NAME] = self._entity.name
@@ -310,7 +375,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, variables=values, parse_json=False
                     )
                 )
             except TEMPLATE_ERRORS as exc:
@@ -336,7 +401,7 @@ class MqttValueTemplate:
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
+                    payload, default, variables=values, parse_json=False
                 )
             )
         except TEMPLATE_ERRORS as exc:
@@ -23,10 +23,24 @@ from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_get_shared_template_render_stats,
+    async_track_time_interval,
+)
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template_profiler import (
+    async_get_template_stats,
+    async_start_template_profiling,
+    async_stop_template_profiling,
+)
 
-from .const import DOMAIN
+from . import websocket_api
+from .const import (
+    DEFAULT_MAX_JOBS,
+    DEFAULT_MAX_TEMPLATES,
+    DOMAIN,
+    TEMPLATE_STATS_SORT_KEYS,
+)
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -40,6 +54,10 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_JOB_STATS = "start_job_stats"
+SERVICE_STOP_JOB_STATS = "stop_job_stats"
+SERVICE_START_TEMPLATE_STATS = "start_template_stats"
+SERVICE_STOP_TEMPLATE_STATS = "stop_template_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +81,10 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_JOB_STATS,
+    SERVICE_STOP_JOB_STATS,
+    SERVICE_START_TEMPLATE_STATS,
+    SERVICE_STOP_TEMPLATE_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -72,6 +94,9 @@ DEFAULT_MAX_OBJECTS = 5
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_JOBS = "max_jobs"
+CONF_MAX_TEMPLATES = "max_templates"
+CONF_SORT_BY = "sort_by"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -260,6 +285,86 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    @callback
+    def _async_start_job_stats(call: ServiceCall) -> None:
+        """Start recording the event loop time used by jobs."""
+        if hass.async_get_job_stats() is not None:
+            raise HomeAssistantError("Job stats already started")
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Job stats recording has started. Stop it to log the jobs that"
+                " used the most event loop time to [the logs](/config/logs)."
+            ),
+            title="Job stats started",
+            notification_id="profile_job_stats",
+        )
+        hass.async_start_job_profiling()
+
+    @callback
+    def _async_stop_job_stats(call: ServiceCall) -> None:
+        """Stop recording job stats and log the jobs that used the most time."""
+        if (job_stats := hass.async_get_job_stats()) is None:
+            raise HomeAssistantError("Job stats not running")
+
+        hass.async_stop_job_profiling()
+        persistent_notification.async_dismiss(hass, "profile_job_stats")
+        for stats in websocket_api.top_job_stats(job_stats, call.data[CONF_MAX_JOBS]):
+            _LOGGER.critical(
+                "Job %s (%s): %s calls, %.6fs total, %.6fs max",
+                stats["name"],
+                stats["integration"] or "core",
+                stats["calls"],
+                stats["total_time"],
+                stats["max_time"],
+            )
+
+    @callback
+    def _async_start_template_stats(call: ServiceCall) -> None:
+        """Start recording the event loop time used by template renders."""
+        if async_get_template_stats(hass) is not None:
+            raise HomeAssistantError("Template stats already started")
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Template stats recording has started. Stop it to log the templates"
+                " that used the most event loop time to [the logs](/config/logs)."
+            ),
+            title="Template stats started",
+            notification_id="profile_template_stats",
+        )
+        async_start_template_profiling(hass)
+
+    @callback
+    def _async_stop_template_stats(call: ServiceCall) -> None:
+        """Stop recording template stats and log the slowest or most frequent."""
+        if (template_stats := async_get_template_stats(hass)) is None:
+            raise HomeAssistantError("Template stats not running")
+
+        async_stop_template_profiling(hass)
+        persistent_notification.async_dismiss(hass, "profile_template_stats")
+        for stats in websocket_api.top_template_stats(
+            template_stats, call.data[CONF_MAX_TEMPLATES], call.data[CONF_SORT_BY]
+        ):
+            _LOGGER.critical(
+                "Template %s (%s): %s renders, %.6fs total, %.6fs max, triggers: %s",
+                stats["template"],
+                ", ".join(stats["owners"]) or "unknown",
+                stats["renders"],
+                stats["total_time"],
+                stats["max_time"],
+                stats["triggers"],
+            )
+        shared_render_stats = async_get_shared_template_render_stats(hass)
+        _LOGGER.critical(
+            "Tracked templates: %s renders, %s renders shared (%.1f%%)",
+            shared_render_stats.renders,
+            shared_render_stats.shared,
+            shared_render_stats.ratio * 100,
+        )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,6 +487,53 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_JOB_STATS,
+        _async_start_job_stats,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_JOB_STATS,
+        _async_stop_job_stats,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_MAX_JOBS, default=DEFAULT_MAX_JOBS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                )
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_TEMPLATE_STATS,
+        _async_start_template_stats,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_TEMPLATE_STATS,
+        _async_stop_template_stats,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_TEMPLATES, default=DEFAULT_MAX_TEMPLATES
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(CONF_SORT_BY, default="total_time"): vol.In(
+                    TEMPLATE_STATS_SORT_KEYS
+                ),
+            }
+        ),
+    )
+
+    websocket_api.async_setup(hass)
+
     return True
 
 
@@ -391,6 +543,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.async_stop_job_profiling()
+    async_stop_template_profiling(hass)
     hass.data.pop(DOMAIN)
     return True
 
@@ -2,3 +2,8 @@
 
 DOMAIN = "profiler"
 DEFAULT_NAME = "Profiler"
+
+DEFAULT_MAX_JOBS = 25
+DEFAULT_MAX_TEMPLATES = 25
+
+TEMPLATE_STATS_SORT_KEYS = ("total_time", "max_time", "renders")
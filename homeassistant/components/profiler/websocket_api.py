@@ -0,0 +1,119 @@
+"""Websocket API for the profiler integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HassJobStats, HomeAssistant, callback
+from homeassistant.helpers.event import async_get_shared_template_render_stats
+from homeassistant.helpers.template_profiler import (
+    TemplateRenderStats,
+    async_get_template_stats,
+)
+
+from .const import DEFAULT_MAX_JOBS, DEFAULT_MAX_TEMPLATES, TEMPLATE_STATS_SORT_KEYS
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the profiler websocket API."""
+    websocket_api.async_register_command(hass, ws_job_stats)
+    websocket_api.async_register_command(hass, ws_template_stats)
+
+
+def top_job_stats(
+    job_stats: dict[str, HassJobStats], max_jobs: int
+) -> list[dict[str, Any]]:
+    """Return the jobs that used the most event loop time."""
+    return [
+        {"name": name, **asdict(stats)}
+        for name, stats in sorted(
+            job_stats.items(), key=lambda item: item[1].total_time, reverse=True
+        )[:max_jobs]
+    ]
+
+
+def top_template_stats(
+    template_stats: dict[str, TemplateRenderStats], max_templates: int, sort_by: str
+) -> list[dict[str, Any]]:
+    """Return the templates with the highest sort_by stat.
+
+    The triggers are sorted by how many re-renders they caused.
+    """
+    return [
+        {
+            "template": template,
+            "owners": sorted(stats.owners),
+            "renders": stats.renders,
+            "total_time": stats.total_time,
+            "max_time": stats.max_time,
+            "triggers": dict(
+                sorted(stats.triggers.items(), key=lambda item: item[1], reverse=True)
+            ),
+        }
+        for template, stats in sorted(
+            template_stats.items(),
+            key=lambda item: getattr(item[1], sort_by),
+            reverse=True,
+        )[:max_templates]
+    ]
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/job_stats",
+        vol.Optional("max_jobs", default=DEFAULT_MAX_JOBS): vol.All(
+            int, vol.Range(min=1)
+        ),
+    }
+)
+@callback
+def ws_job_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the event loop time used by jobs since job stats were started."""
+    job_stats = hass.async_get_job_stats()
+    connection.send_result(
+        msg["id"],
+        {
+            "running": job_stats is not None,
+            "jobs": top_job_stats(job_stats or {}, msg["max_jobs"]),
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/template_stats",
+        vol.Optional("max_templates", default=DEFAULT_MAX_TEMPLATES): vol.All(
+            int, vol.Range(min=1)
+        ),
+        vol.Optional("sort_by", default="total_time"): vol.In(TEMPLATE_STATS_SORT_KEYS),
+    }
+)
+@callback
+def ws_template_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the renders of templates since template stats were started."""
+    template_stats = async_get_template_stats(hass)
+    shared_render_stats = async_get_shared_template_render_stats(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "running": template_stats is not None,
+            "templates": top_template_stats(
+                template_stats or {}, msg["max_templates"], msg["sort_by"]
+            ),
+            "shared_renders": {
+                **asdict(shared_render_stats),
+                "ratio": shared_render_stats.ratio,
+            },
+        },
+    )
@@ -37,6 +37,9 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        spill_queue_depth = instance.spill_queue_depth
+        read_only_pool = instance.read_only_pool_stats
+        statistics_cache = instance.statistics_cache_stats
     else:
         backlog = None
         migration_in_progress = False
@@ -44,13 +47,19 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        spill_queue_depth = None
+        read_only_pool = None
+        statistics_cache = None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "read_only_pool": read_only_pool,
         "recording": recording,
+        "spill_queue_depth": spill_queue_depth,
+        "statistics_cache": statistics_cache,
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
@@ -0,0 +1,121 @@
+"""Bulk insert of the Events and States rows collected for a commit."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import Events, States
+
+# The foreign key columns that may be pointing to a row that
+# was added in the same commit. The id is only known after
+# the session is flushed so it has to be read from the
+# related object when the rows are inserted.
+_EVENTS_RELATIONSHIPS = (
+    ("data_id", "event_data_rel", "data_id"),
+    ("event_type_id", "event_type_rel", "event_type_id"),
+)
+_STATES_RELATIONSHIPS = (
+    ("attributes_id", "state_attributes", "attributes_id"),
+    ("metadata_id", "states_meta_rel", "metadata_id"),
+    ("old_state_id", "old_state", "state_id"),
+)
+
+
+@cache
+def _insert_columns(table: Table) -> tuple[str, ...]:
+    """Return the keys of the columns that are inserted for a table."""
+    return tuple(column.key for column in table.columns if not column.primary_key)
+
+
+def _rows_to_params(
+    rows: Iterable[Events | States], relationships: tuple[tuple[str, str, str], ...]
+) -> list[dict[str, Any]]:
+    """Convert ORM objects to the parameters of an executemany insert."""
+    params: list[dict[str, Any]] = []
+    columns: tuple[str, ...] | None = None
+    for row in rows:
+        if columns is None:
+            columns = _insert_columns(cast(Table, row.__table__))
+        row_dict = row.__dict__
+        row_params = {key: row_dict.get(key) for key in columns}
+        for id_key, relationship, related_id_key in relationships:
+            if (related := row_dict.get(relationship)) is not None:
+                row_params[id_key] = getattr(related, related_id_key)
+        params.append(row_params)
+    return params
+
+
+def bulk_insert_events(session: Session, events: list[Events]) -> None:
+    """Insert events with a single executemany.
+
+    The session must be flushed first so the EventData and
+    EventTypes rows the events point to have their ids assigned.
+    """
+    if not events:
+        return
+    table = cast(Table, events[0].__table__)
+    session.execute(insert(table), _rows_to_params(events, _EVENTS_RELATIONSHIPS))
+
+
+def _state_generations(states: list[States]) -> list[list[States]]:
+    """Split states into generations that can be inserted together.
+
+    A state that has its old state in the same commit can only be
+    inserted once the state_id of the old state is known so each
+    generation only contains states whose old state is in a previous
+    generation or already in the database.
+    """
+    generation_by_state: dict[int, int] = {}
+    generations: list[list[States]] = []
+    for dbstate in states:
+        if id(dbstate) in generation_by_state:
+            continue
+        # An old state that was never added to the commit, for example
+        # because its attributes could not be serialized, still has to
+        # be inserted first, as the ORM would do via the relationship.
+        chain: list[States] = []
+        parent: States | None = dbstate
+        while (
+            parent is not None
+            and id(parent) not in generation_by_state
+            and (parent is dbstate or parent.__dict__.get("state_id") is None)
+        ):
+            chain.append(parent)
+            parent = parent.__dict__.get("old_state")
+        generation = (
+            generation_by_state[id(parent)] + 1
+            if parent is not None and id(parent) in generation_by_state
+            else 0
+        )
+        for link in reversed(chain):
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(link)
+            generation_by_state[id(link)] = generation
+            generation += 1
+    return generations
+
+
+def bulk_insert_states(session: Session, states: list[States]) -> None:
+    """Insert states with one executemany per generation.
+
+    The state_ids are read back with RETURNING in parameter order
+    and set on the objects so the StatesManager and the next
+    generation can reference them. The session must be flushed first
+    so the StatesMeta and StateAttributes rows have their ids assigned.
+    """
+    if not states:
+        return
+    table = cast(Table, states[0].__table__)
+    stmt = insert(table).returning(table.c.state_id, sort_by_parameter_order=True)
+    for generation in _state_generations(states):
+        result = session.execute(
+            stmt, _rows_to_params(generation, _STATES_RELATIONSHIPS)
+        )
+        for dbstate, state_id in zip(generation, result.scalars(), strict=True):
+            dbstate.state_id = state_id
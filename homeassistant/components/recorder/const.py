@@ -30,6 +30,15 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# Events that do not fit in the queue are written to the spill
+# queue file until the database catches up
+SPILL_QUEUE_FILENAME = "home-assistant_recorder.spill"
+MAX_SPILL_QUEUE_SIZE = 512 * 1024**2
+
+# The id caches of the table managers are saved at shutdown
+# and loaded at startup to avoid looking up the ids again
+ID_CACHES_FILENAME = "home-assistant_recorder.id_caches"
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -45,6 +54,7 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_ONLY_WORKER_PREFIX = "DbReader"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -22,6 +22,7 @@ from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import QueuePool
 
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
@@ -50,17 +51,22 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import bulk_insert_events, bulk_insert_states
 from .const import (
+    DB_READ_ONLY_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
+    ID_CACHES_FILENAME,
     KEEPALIVE_TIME,
     LAST_REPORTED_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
+    MAX_SPILL_QUEUE_SIZE,
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPILL_QUEUE_FILENAME,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
@@ -77,9 +83,16 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, DBReadOnlyThreadPoolExecutor
+from .id_cache import load_id_caches, save_id_caches
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .partition import create_future_partitions, get_partitioned_tables
+from .pool import POOL_SIZE, READ_ONLY_POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
+from .queries import find_latest_recorder_runs_run_id
+from .recent_states import RecentStates
+from .spill_queue import SpillQueue, event_to_spill_line, spill_line_to_event
+from .table_managers import BaseLRUTableManager
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -100,6 +113,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    SpillQueueReplayTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -116,6 +130,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -140,6 +155,10 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 
+# The number of events replayed from the spill queue before
+# the recorder goes back to the tasks in the queue
+SPILL_QUEUE_REPLAY_BATCH = 1000
+
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
@@ -162,6 +181,7 @@ class Recorder(threading.Thread):
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_partitioning: bool,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
     ) -> None:
@@ -181,6 +201,9 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_partitioning = db_partitioning
+        # The tables that are partitioned by day, see partition.py
+        self.partitioned_tables: set[str] = set()
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -191,8 +214,20 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        # Engine of the read only pool, None if reads share
+        # the connections of the recorder (in memory SQLite)
+        self.read_only_engine: Engine | None = None
+        self.read_only_thread_ids: set[int] = set()
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
+        self._spill_queue = SpillQueue(
+            hass.config.path(SPILL_QUEUE_FILENAME), MAX_SPILL_QUEUE_SIZE
+        )
+        # Serialized events waiting to be appended to the spill queue
+        self._spill_buffer: list[bytes] = []
+        self._spill_flush_task: asyncio.Task[None] | None = None
+        self._spilling = False
+        self._spill_replay_queued = False
 
         # The entity_filter is exposed on the recorder instance so that
         # it can be used to see if an entity is being recorded and is called
@@ -203,6 +238,10 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Events and States are not added to the session, they are
+        # inserted in bulk when the session is committed
+        self._pending_events: list[Events] = []
+        self._pending_states: list[States] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -211,15 +250,26 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # The caches saved at shutdown and loaded at startup
+        self._id_caches: dict[str, BaseLRUTableManager[Any]] = {
+            "event_data": self.event_data_manager,
+            "event_types": self.event_type_manager,
+            "state_attributes": self.state_attributes_manager,
+            "states_meta": self.states_meta_manager,
+        }
+        self.recent_states = RecentStates()
+        self.purge_progress: PurgeProgress | None = None
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_only_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_only_executor: DBReadOnlyThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -242,6 +292,11 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    @property
+    def spill_queue_depth(self) -> int:
+        """Return the number of events waiting in the spill queue."""
+        return self._spill_queue.depth + len(self._spill_buffer)
+
     @cached_property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -265,6 +320,31 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_only_session(self) -> Session:
+        """Get a new sqlalchemy session for reading.
+
+        Sessions created in the threads of the read only executor use
+        the read only pool, all others are the same as get_session.
+        """
+        if (
+            self._get_read_only_session is not None
+            and threading.get_ident() in self.read_only_thread_ids
+        ):
+            return self._get_read_only_session()
+        return self.get_session()
+
+    @property
+    def read_only_pool_stats(self) -> dict[str, Any] | None:
+        """Return the metrics of the read only executor."""
+        if self._db_read_only_executor is None:
+            return None
+        return self._db_read_only_executor.stats
+
+    @property
+    def statistics_cache_stats(self) -> dict[str, int]:
+        """Return the metrics of the statistics_during_period cache."""
+        return statistics.get_statistics_during_period_cache(self.hass).stats
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -282,6 +362,11 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_only_executor = DBReadOnlyThreadPoolExecutor(
+            self.read_only_thread_ids,
+            thread_name_prefix=DB_READ_ONLY_WORKER_PREFIX,
+            max_workers=READ_ONLY_POOL_SIZE,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -291,9 +376,21 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
+        self._async_listen_events(
+            self._async_spill_event if self._spilling else self._queue.put_nowait
+        )
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            QUEUE_CHECK_INTERVAL,
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_events(self, queue_put: Callable[[Event], None]) -> None:
+        """Listen for events to record and pass them to queue_put."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -326,12 +423,6 @@ class Recorder(threading.Thread):
             MATCH_ALL,
             _event_listener,
         )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            QUEUE_CHECK_INTERVAL,
-            name="Recorder queue watcher",
-        )
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -356,6 +447,21 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_only_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a job that only reads from the database.
+
+        The job runs in the read only executor so it does not wait
+        for, or hold up, the connections of the db executor.
+        """
+        if self.read_only_engine is None:
+            return self.async_add_executor_job(target, *args)
+        return self.hass.loop.run_in_executor(
+            self._db_read_only_executor, target, *args
+        )
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -363,7 +469,24 @@ class Recorder(threading.Thread):
         The queue grows during migration or if something really goes wrong.
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
-        if not self._reached_max_backlog():
+        # While the database is locked for a backup, the lock
+        # is released instead when the queue overflows
+        if (
+            self._spilling
+            or self._database_lock_task
+            or not self._reached_max_backlog()
+        ):
+            return
+        if not self._spill_queue.full:
+            _LOGGER.warning(
+                "The recorder backlog queue reached the maximum size of %s events; "
+                "usually, the system is CPU bound, I/O bound, or the database "
+                "is slow; The recorder will write new events to %s until the "
+                "database catches up",
+                self.backlog,
+                self._spill_queue.path,
+            )
+            self._async_start_spilling()
             return
         _LOGGER.error(
             (
@@ -392,6 +515,88 @@ class Recorder(threading.Thread):
         # user a bad backup when they have plenty of RAM available.
         return self._available_memory() < MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG
 
+    @callback
+    def _async_start_spilling(self) -> None:
+        """Write new events to the spill queue instead of the queue."""
+        self._spilling = True
+        if self._event_listener:
+            self._event_listener()
+            self._async_listen_events(self._async_spill_event)
+
+    @callback
+    def _async_spill_event(self, event: Event) -> None:
+        """Add an event to the spill queue."""
+        if (line := event_to_spill_line(event)) is None:
+            return
+        self._spill_buffer.append(line)
+        if not self._spill_flush_task:
+            self._spill_flush_task = self.hass.async_create_task(
+                self._async_flush_spill_buffer(),
+                "Recorder spill queue flush",
+                eager_start=False,
+            )
+
+    async def _async_flush_spill_buffer(self) -> None:
+        """Append the buffered events to the spill queue."""
+        try:
+            while lines := self._spill_buffer:
+                self._spill_buffer = []
+                if not await self.hass.async_add_executor_job(
+                    self._spill_queue.append, lines
+                ):
+                    self._async_spill_queue_full()
+                    return
+                if not self._spill_replay_queued:
+                    self._spill_replay_queued = True
+                    self.queue_task(SpillQueueReplayTask())
+        finally:
+            self._spill_flush_task = None
+
+    @callback
+    def _async_spill_queue_full(self) -> None:
+        """Stop recording because the spill queue is full."""
+        _LOGGER.error(
+            (
+                "The recorder spill queue reached the maximum size of %s bytes; "
+                "The recorder will stop recording events until Home Assistant "
+                "is restarted"
+            ),
+            self._spill_queue.max_size,
+        )
+        self._spill_buffer.clear()
+        self._async_stop_queue_watcher_and_event_listener()
+
+    @callback
+    def _async_spill_queue_drained(self) -> None:
+        """Go back to the queue once every spilled event was replayed."""
+        if not self._spilling or self._spill_flush_task or self._spill_buffer:
+            # More events were spilled in the meantime and
+            # the flush will queue another replay
+            return
+        if self._spill_queue.depth:
+            self._spill_replay_queued = True
+            self.queue_task(SpillQueueReplayTask())
+            return
+        _LOGGER.info("The recorder replayed all events from the spill queue")
+        self._spilling = False
+        if self._event_listener:
+            self._event_listener()
+            self._async_listen_events(self._queue.put_nowait)
+
+    def _replay_spill_queue(self) -> None:
+        """Replay the next batch of events from the spill queue."""
+        self._spill_replay_queued = False
+        for line in self._spill_queue.read(SPILL_QUEUE_REPLAY_BATCH):
+            if event := spill_line_to_event(line):
+                self._guarded_process_one_task_or_event_or_recover(event)
+        if self._spill_queue.depth:
+            # Go back to the end of the queue so the
+            # tasks in the queue are not starved
+            self._spill_replay_queued = True
+            self.queue_task(SpillQueueReplayTask())
+        else:
+            self.hass.add_job(self._async_spill_queue_drained)
+
     @callback
     def _async_stop_queue_watcher_and_event_listener(self) -> None:
         """Stop watching the queue and listening for events."""
@@ -443,6 +648,12 @@ class Recorder(threading.Thread):
             self._hass_started.set_result(SHUTDOWN_TASK)
         self.queue_task(StopTask())
         self._async_stop_listeners()
+        # Events that were not replayed from the spill
+        # queue yet will be replayed on the next start
+        if self._spill_flush_task:
+            await self._spill_flush_task
+        if self._spill_buffer:
+            await self._async_flush_spill_buffer()
         await self.hass.async_add_executor_job(self.join)
 
     @callback
@@ -690,6 +901,16 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_event_to_bulk_insert(self, dbevent: Events) -> None:
+        """Add an event to be inserted in bulk on the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_events.append(dbevent)
+
+    def _add_state_to_bulk_insert(self, dbstate: States) -> None:
+        """Add a state to be inserted in bulk on the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_states.append(dbstate)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -779,6 +1000,14 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        assert self.engine is not None
+        if self.engine.dialect.name == SupportedDialect.POSTGRESQL:
+            self._setup_partitioned_tables()
+        elif self.db_partitioning:
+            _LOGGER.warning(
+                "Partitioning the database tables is only supported with PostgreSQL"
+            )
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -806,12 +1035,33 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _setup_partitioned_tables(self) -> None:
+        """Partition the tables if enabled and create the partitions ahead."""
+        today = dt_util.utcnow().date()
+        if self.db_partitioning and not migration.partition_tables(
+            self.get_session, today
+        ):
+            _LOGGER.error("Could not partition the database tables, see the logs")
+        with session_scope(session=self.get_session()) as session:
+            self.partitioned_tables = get_partitioned_tables(session)
+            # Home Assistant may have been stopped for longer than
+            # the partitions created ahead by the nightly cleanups
+            create_future_partitions(session, self.partitioned_tables, today)
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
+        if depth := self._spill_queue.load():
+            # Events spilled by a previous run are older
+            # than anything in the queue
+            _LOGGER.info("Replaying %s events from the spill queue", depth)
+            while lines := self._spill_queue.read(SPILL_QUEUE_REPLAY_BATCH):
+                for line in lines:
+                    if event := spill_line_to_event(line):
+                        self._guarded_process_one_task_or_event_or_recover(event)
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
@@ -1043,7 +1293,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_bulk_insert(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1068,7 +1318,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_bulk_insert(dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1109,6 +1359,8 @@ class Recorder(threading.Thread):
         ):
             return
 
+        self.recent_states.add(event)
+
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
             dbstate.states_meta_rel = pending_states_meta
@@ -1150,7 +1402,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_bulk_insert(dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1198,6 +1450,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_events or self._pending_states:
+            self._bulk_insert_pending(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1216,6 +1471,8 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self._pending_events.clear()
+        self._pending_states.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1233,6 +1490,22 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _bulk_insert_pending(self, session: Session) -> None:
+        """Insert the pending events and states in bulk."""
+        # Flush first so the rows the events and states point to,
+        # which are still added with the ORM to keep the dedupe
+        # in the table managers, have their ids assigned.
+        with session.no_autoflush:
+            session.flush()
+            bulk_insert_events(session, self._pending_events)
+            assert self.engine is not None
+            if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+                bulk_insert_states(session, self._pending_states)
+            else:
+                # The state_ids can not be read back in order from an
+                # executemany (MySQL) so let the ORM insert the states
+                session.add_all(self._pending_states)
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1253,6 +1526,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._pending_events.clear()
+        self._pending_states.clear()
 
         if not self.event_session:
             return
@@ -1416,19 +1691,63 @@ class Recorder(threading.Thread):
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if self._using_file_sqlite or not self.db_url.startswith(SQLITE_URL_PREFIX):
+            self._setup_read_only_connection(kwargs)
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_only_connection(self, kwargs: dict[str, Any]) -> None:
+        """Create the engine of the read only pool."""
+        kwargs.pop("recorder_and_worker_thread_ids", None)
+        if self._using_file_sqlite:
+            # Each reader gets its own connection, WAL mode
+            # allows them to read while the recorder writes
+            kwargs["poolclass"] = QueuePool
+            kwargs["connect_args"] = {"check_same_thread": False}
+        kwargs["pool_size"] = READ_ONLY_POOL_SIZE
+        kwargs["max_overflow"] = 0
+        kwargs["pool_pre_ping"] = True
+        assert not self.read_only_engine
+        self.read_only_engine = create_engine(self.db_url, **kwargs, future=True)
+        sqlalchemy_event.listen(
+            self.read_only_engine, "connect", self._setup_read_only_recorder_connection
+        )
+        self._get_read_only_session = scoped_session(
+            sessionmaker(bind=self.read_only_engine, future=True)
+        )
+
+    def _setup_read_only_recorder_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read only pool."""
+        assert self.read_only_engine is not None
+        setup_read_only_connection_for_dialect(
+            self, self.read_only_engine.dialect.name, dbapi_connection
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        if self.read_only_engine:
+            self.read_only_engine.dispose()
+            self.read_only_engine = None
+        self._get_read_only_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
+        # States may have been lost if the run is set up again after an error
+        self.recent_states.reset()
         with session_scope(session=self.get_session()) as session:
             end_incomplete_runs(session, self.recorder_runs_manager.recording_start)
+            # The ids of the last run are only valid until this run starts
+            load_id_caches(
+                self.hass.config.path(ID_CACHES_FILENAME),
+                self.schema_version,
+                session.execute(find_latest_recorder_runs_run_id()).scalar(),
+                self._id_caches,
+            )
             self.recorder_runs_manager.start(session)
             self.states_manager.load_from_db(session)
 
@@ -1450,6 +1769,18 @@ class Recorder(threading.Thread):
             self._commit_event_session_or_retry()
         except Exception:
             _LOGGER.exception("Error saving the event session during shutdown")
+        else:
+            if (
+                self.recorder_runs_manager.active
+                and self.schema_version == SCHEMA_VERSION
+                and not self.migration_in_progress
+            ):
+                save_id_caches(
+                    self.hass.config.path(ID_CACHES_FILENAME),
+                    self.schema_version,
+                    self.recorder_runs_manager.current.run_id,
+                    self._id_caches,
+                )
 
         self.event_session.close()
         self.recorder_runs_manager.clear()
@@ -1470,13 +1801,19 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
+            self._spill_queue.close()
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_only_executor)
+                if executor
+            ]
+            for executor in executors:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import Future
 from concurrent.futures.thread import _threads_queues, _worker
 import threading
+import time
 from typing import Any
 import weakref
 
@@ -71,3 +73,64 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+class DBReadOnlyThreadPoolExecutor(InterruptibleThreadPoolExecutor):
+    """An executor for queries that use the read only connection pool.
+
+    The ids of the worker threads are added to read_only_thread_ids
+    so sessions created in them are bound to the read only engine.
+    The executor also keeps the metrics of the jobs it runs.
+    """
+
+    def __init__(
+        self, read_only_thread_ids: set[int], *args: Any, **kwargs: Any
+    ) -> None:
+        """Init the executor."""
+        self.read_only_thread_ids = read_only_thread_ids
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._max_wait = 0.0
+        super().__init__(*args, initializer=self._register_thread, **kwargs)
+
+    def _register_thread(self, *_: Any) -> None:
+        """Register a worker thread as a read only thread."""
+        self.read_only_thread_ids.add(threading.get_ident())
+
+    def submit[_T](
+        self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any
+    ) -> Future[_T]:
+        """Submit a job and track how long it waits for a worker."""
+        with self._stats_lock:
+            self._queued += 1
+        return super().submit(self._run_job, time.monotonic(), fn, *args, **kwargs)
+
+    def _run_job[_T](
+        self, submitted: float, fn: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run a job and update the metrics."""
+        wait = time.monotonic() - submitted
+        with self._stats_lock:
+            self._queued -= 1
+            self._running += 1
+            self._max_wait = max(self._max_wait, wait)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._running -= 1
+                self._completed += 1
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the metrics of the executor."""
+        with self._stats_lock:
+            return {
+                "completed": self._completed,
+                "max_wait": round(self._max_wait, 3),
+                "max_workers": self._max_workers,
+                "queued": self._queued,
+                "running": self._running,
+            }
@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
+import homeassistant.util.dt as dt_util
 
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    downsample_states,
+    get_downsampled_states as _modern_get_downsampled_states,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
@@ -24,6 +28,8 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "downsample_states",
+    "get_downsampled_states",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
@@ -32,6 +38,50 @@ __all__ = [
 ]
 
 
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    points: int,
+) -> dict[str, dict[str, list[float | None]]]:
+    """Return the numeric states during a time period downsampled to points buckets."""
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_downsampled_states(
+            hass, start_time, end_time, entity_ids, points
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    start_time_ts = start_time.timestamp()
+    end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+    return {
+        entity_id: downsample_states(
+            (
+                (
+                    state[COMPRESSED_STATE_STATE],
+                    state.get(COMPRESSED_STATE_LAST_UPDATED, start_time_ts),
+                )
+                for state in cast(list[dict[str, Any]], states)
+            ),
+            start_time_ts,
+            end_time_ts,
+            points,
+        )
+        for entity_id, states in _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            significant_changes_only=False,
+            minimal_response=True,
+            no_attributes=True,
+            compressed_state_format=True,
+        ).items()
+    }
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
+import math
 from operator import itemgetter
 from typing import Any, cast
 
@@ -318,6 +319,144 @@ def get_full_significant_states_with_session(
     )
 
 
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    points: int,
+) -> dict[str, dict[str, list[float | None]]]:
+    """Wrap get_downsampled_states_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return get_downsampled_states_with_session(
+            hass, session, start_time, end_time, entity_ids, points
+        )
+
+
+def get_downsampled_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    points: int,
+) -> dict[str, dict[str, list[float | None]]]:
+    """Return the numeric states during a time period downsampled to points buckets.
+
+    Only the state and the time of each row are selected so the rows
+    are never converted to State objects. The rows of periods longer
+    than a day are streamed and reduced as they are read.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    instance = get_instance(hass)
+    if not (
+        entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+        return {}
+    include_start_time_state = True
+    if not (oldest_ts := _get_oldest_possible_ts(hass, start_time)):
+        include_start_time_state = False
+    start_time_ts = start_time.timestamp()
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    stmt = lambda_stmt(
+        lambda: _significant_states_stmt(
+            start_time_ts,
+            end_time_ts,
+            single_metadata_id,
+            metadata_ids,
+            [],
+            False,
+            True,
+            include_start_time_state,
+            oldest_ts,
+        ),
+        track_on=[
+            bool(single_metadata_id),
+            bool(end_time_ts),
+            include_start_time_state,
+        ],
+    )
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    return {
+        metadata_id_to_entity_id[metadata_id]: downsample_states(
+            (
+                (db_state[state_idx], db_state[last_updated_ts_idx])
+                for db_state in group
+            ),
+            start_time_ts,
+            end_time_ts or dt_util.utcnow().timestamp(),
+            points,
+        )
+        for metadata_id, group in groupby(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            itemgetter(_FIELD_MAP["metadata_id"]),
+        )
+    }
+
+
+def downsample_states(
+    states: Iterable[tuple[str, float]],
+    start_time_ts: float,
+    end_time_ts: float,
+    points: int,
+) -> dict[str, list[float | None]]:
+    """Downsample states sorted by time to the min, max and mean of points buckets.
+
+    The result is columnar, the start time of each bucket is in "t".
+    Buckets without any state are left out and the values of a bucket
+    that only has non numeric states, for example unavailable, are None.
+    The state at the start time is put in the first bucket.
+    """
+    bucket_size = max(end_time_ts - start_time_ts, 0) / points or 1.0
+    last_bucket = points - 1
+    # The running min, max, sum and count of the numeric states of each bucket
+    buckets: dict[int, list[float]] = {}
+    for state, last_updated_ts in states:
+        bucket = min(
+            max(int((last_updated_ts - start_time_ts) / bucket_size), 0),
+            last_bucket,
+        )
+        if (aggregate := buckets.get(bucket)) is None:
+            aggregate = buckets[bucket] = [math.inf, -math.inf, 0.0, 0]
+        try:
+            value = float(state)
+        except (TypeError, ValueError):
+            continue
+        # NaN and infinity can not be sent as JSON
+        if math.isfinite(value):
+            aggregate[0] = min(aggregate[0], value)
+            aggregate[1] = max(aggregate[1], value)
+            aggregate[2] += value
+            aggregate[3] += 1
+    times: list[float | None] = []
+    mins: list[float | None] = []
+    maxs: list[float | None] = []
+    means: list[float | None] = []
+    for bucket, (min_value, max_value, total, count) in buckets.items():
+        times.append(start_time_ts + bucket * bucket_size)
+        if count:
+            mins.append(min_value)
+            maxs.append(max_value)
+            means.append(total / count)
+        else:
+            mins.append(None)
+            maxs.append(None)
+            means.append(None)
+    return {"t": times, "min": mins, "max": maxs, "mean": means}
+
+
 def _state_changed_during_period_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -0,0 +1,86 @@
+"""Keep the id caches of the table managers across restarts."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import logging
+import os
+from typing import Any
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import save_json
+from homeassistant.util.json import load_json
+
+from .table_managers import BaseLRUTableManager
+
+_LOGGER = logging.getLogger(__name__)
+
+ID_CACHES_VERSION = 1
+
+
+def save_id_caches(
+    path: str,
+    schema_version: int,
+    run_id: int,
+    managers: Mapping[str, BaseLRUTableManager[Any]],
+) -> None:
+    """Save a snapshot of the id caches at the end of a recorder run."""
+    try:
+        save_json(
+            path,
+            {
+                "version": ID_CACHES_VERSION,
+                "schema_version": schema_version,
+                "run_id": run_id,
+                "caches": {
+                    name: manager.snapshot() for name, manager in managers.items()
+                },
+            },
+            atomic_writes=True,
+        )
+    except HomeAssistantError as err:
+        _LOGGER.error("Could not save the recorder id caches: %s", err)
+
+
+def load_id_caches(
+    path: str,
+    schema_version: int,
+    last_run_id: int | None,
+    managers: Mapping[str, BaseLRUTableManager[Any]],
+) -> int:
+    """Pre-warm the id caches from the snapshot of the last recorder run.
+
+    The snapshot is only used if it was taken at the end of the last
+    run in the database with the same schema, the ids may refer to other
+    rows otherwise, for example after a backup of the database was
+    restored. The snapshot is removed once it has been read since
+    the caches change as soon as the next run starts recording.
+
+    Returns the number of ids loaded into the caches.
+    """
+    try:
+        snapshot = load_json(path, None)
+    except HomeAssistantError:
+        snapshot = None
+    if snapshot is None:
+        return 0
+    try:
+        os.unlink(path)
+    except OSError as err:
+        _LOGGER.error("Could not remove the recorder id caches: %s", err)
+        return 0
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != ID_CACHES_VERSION
+        or snapshot.get("schema_version") != schema_version
+        or snapshot.get("run_id") != last_run_id
+        or not isinstance(caches := snapshot.get("caches"), dict)
+    ):
+        _LOGGER.debug("Discarding the recorder id caches of another run")
+        return 0
+    loaded = 0
+    for name, manager in managers.items():
+        if isinstance(ids := caches.get(name), list):
+            loaded += manager.prewarm(ids)
+    _LOGGER.debug("Loaded %s ids into the recorder id caches", loaded)
+    return loaded
@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable
 import contextlib
 from dataclasses import dataclass, replace as dataclass_replace
-from datetime import timedelta
+from datetime import UTC, date, datetime, timedelta
 import logging
 from time import time
 from typing import TYPE_CHECKING, Any, cast, final
@@ -81,6 +81,13 @@ from .db_schema import (
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partition import (
+    PARTITION_COLUMNS,
+    PARTITIONS_AHEAD_DAYS,
+    create_default_partition,
+    create_partitions,
+    get_partitioned_tables,
+)
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -2842,3 +2849,140 @@ def rebuild_sqlite_table(
         with session_scope(session=session_maker()) as session:
             # Step 12 - Re-enable foreign keys
             session.connection().execute(text("PRAGMA foreign_keys=ON"))
+
+
+def partition_tables(session_maker: Callable[[], Session], today: date) -> bool:
+    """Partition the states, events and short term statistics tables by day.
+
+    This is only supported by PostgreSQL and must only be called after
+    all migrations are complete. Tables that are already partitioned
+    are skipped.
+    """
+    with session_scope(session=session_maker(), read_only=True) as session:
+        partitioned_tables = get_partitioned_tables(session)
+    return all(
+        rebuild_postgresql_table_partitioned(session_maker, table, today)
+        for table in (States, Events, StatisticsShortTerm)
+        if table.__tablename__ not in partitioned_tables
+    )
+
+
+def rebuild_postgresql_table_partitioned(
+    session_maker: Callable[[], Session], table: type[Base], today: date
+) -> bool:
+    """Rebuild a PostgreSQL table as a table partitioned by day.
+
+    The partition column has to be part of the primary key of a
+    partitioned table, which means the table cannot be referenced
+    by a foreign key on its primary key anymore. The foreign key
+    of states.old_state_id is not recreated for that reason.
+    """
+    table_table = cast(Table, table.__table__)
+    orig_name = table_table.name
+    temp_name = f"{orig_name}_temp_{int(time())}"
+    partition_column = PARTITION_COLUMNS[orig_name]
+    id_column = table_table.primary_key.columns.values()[0].name
+    temp_sequence = f"{temp_name}_{id_column}_seq"
+    column_names = [column.name for column in table_table.columns]
+
+    _LOGGER.warning(
+        "Partitioning PostgreSQL table %s by day; %s", orig_name, MIGRATION_NOTE_WHILE
+    )
+
+    try:
+        with session_scope(session=session_maker()) as session:
+            # Step 1 - Create the partitioned table, identity columns are not
+            # supported by partitioned tables before PostgreSQL 17 so the ids
+            # are taken from a sequence owned by the table instead
+            session.execute(
+                text(
+                    f"CREATE TABLE {temp_name} (LIKE {orig_name})"
+                    f" PARTITION BY RANGE ({partition_column})"
+                )
+            )
+            session.execute(text(f"CREATE SEQUENCE {temp_sequence}"))
+            session.execute(
+                text(
+                    f"ALTER TABLE {temp_name} ALTER COLUMN {id_column}"
+                    f" SET DEFAULT nextval('{temp_sequence}')"
+                )
+            )
+            session.execute(
+                text(f"ALTER SEQUENCE {temp_sequence} OWNED BY {temp_name}.{id_column}")
+            )
+            # Step 2 - Create the partitions from the oldest row until
+            # PARTITIONS_AHEAD_DAYS days ahead
+            oldest_ts = session.execute(
+                text(f"SELECT min({partition_column}) FROM {orig_name}")  # noqa: S608
+            ).scalar()
+            first_day = (
+                datetime.fromtimestamp(oldest_ts, UTC).date()
+                if oldest_ts is not None
+                else today
+            )
+            last_day = today + timedelta(days=PARTITIONS_AHEAD_DAYS)
+            create_default_partition(session, orig_name, temp_name)
+            create_partitions(
+                session,
+                orig_name,
+                (
+                    first_day + timedelta(days=days)
+                    for days in range((last_day - first_day).days + 1)
+                ),
+                temp_name,
+            )
+            # Step 3 - Transfer content, the partition column cannot be NULL
+            # since it is part of the primary key
+            columns = ",".join(column_names)
+            select_columns = ",".join(
+                f"COALESCE({name}, 0)" if name == partition_column else name
+                for name in column_names
+            )
+            session.execute(
+                text(
+                    f"INSERT INTO {temp_name} ({columns})"  # noqa: S608
+                    f" SELECT {select_columns} FROM {orig_name}"
+                )
+            )
+            session.execute(
+                text(
+                    f"SELECT setval('{temp_sequence}',"  # noqa: S608
+                    f" COALESCE((SELECT max({id_column}) FROM {temp_name}), 0) + 1,"
+                    " false)"
+                )
+            )
+            # Step 4 - Drop the original table
+            session.execute(text(f"DROP TABLE {orig_name}"))
+            # Step 5 - Rename the partitioned table and its sequence
+            session.execute(text(f"ALTER TABLE {temp_name} RENAME TO {orig_name}"))
+            session.execute(
+                text(
+                    f"ALTER SEQUENCE {temp_sequence}"
+                    f" RENAME TO {orig_name}_{id_column}_seq"
+                )
+            )
+            # Step 6 - Recreate the primary key, indexes and foreign keys
+            session.execute(
+                text(
+                    f"ALTER TABLE {orig_name} ADD CONSTRAINT {orig_name}_pkey"
+                    f" PRIMARY KEY ({id_column}, {partition_column})"
+                )
+            )
+            connection = session.connection()
+            for index in table_table.indexes:
+                index.create(connection)
+            for constraint in table_table.foreign_key_constraints:
+                if constraint.referred_table is table_table:
+                    continue
+                # AddConstraint mutates the constraint passed to it, see
+                # _restore_foreign_key_constraints
+                create_rule = constraint._create_rule  # noqa: SLF001
+                add_constraint = AddConstraint(constraint)  # type: ignore[no-untyped-call]
+                constraint._create_rule = create_rule  # noqa: SLF001
+                connection.execute(add_constraint)
+    except SQLAlchemyError:
+        _LOGGER.exception("Error partitioning PostgreSQL table %s", orig_name)
+        return False
+    else:
+        _LOGGER.warning("Partitioning PostgreSQL table %s finished", orig_name)
+        return True
@@ -0,0 +1,219 @@
+"""Tables partitioned by day on PostgreSQL.
+
+The states, events and short term statistics tables can be range
+partitioned by day on their timestamp column. Purging a day is then
+a partition drop instead of deleting the rows one by one, and range
+queries on the timestamp column only scan the partitions of the
+days they cover.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+import logging
+
+from sqlalchemy import Select, Update, bindparam, column, select, table, text, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util.collection import chunked_or_all
+
+from .db_schema import TABLE_EVENTS, TABLE_STATES, TABLE_STATISTICS_SHORT_TERM
+
+_LOGGER = logging.getLogger(__name__)
+
+# The column each table is partitioned on
+PARTITION_COLUMNS = {
+    TABLE_STATES: "last_updated_ts",
+    TABLE_EVENTS: "time_fired_ts",
+    TABLE_STATISTICS_SHORT_TERM: "start_ts",
+}
+
+# Rows of a day without a partition are written to the default
+# partition and a partition cannot be created for a day once the
+# default partition has rows of that day, so the partitions are
+# created ahead of time
+PARTITIONS_AHEAD_DAYS = 7
+
+_PARTITION_DAY_FORMAT = "%Y%m%d"
+
+
+def partition_name(table_name: str, day: date) -> str:
+    """Return the name of the partition of a table for a day."""
+    return f"{table_name}_p{day.strftime(_PARTITION_DAY_FORMAT)}"
+
+
+def default_partition_name(table_name: str) -> str:
+    """Return the name of the default partition of a table."""
+    return f"{table_name}_default"
+
+
+def day_start_timestamp(day: date) -> float:
+    """Return the timestamp of the start of a day in UTC."""
+    return datetime(day.year, day.month, day.day, tzinfo=UTC).timestamp()
+
+
+def get_partitioned_tables(session: Session) -> set[str]:
+    """Return the tables that are partitioned."""
+    return {
+        row[0]
+        for row in session.execute(
+            text(
+                "SELECT relname FROM pg_class WHERE relkind = 'p'"
+                " AND relname IN :tables AND pg_table_is_visible(oid)"
+            ).bindparams(bindparam("tables", expanding=True)),
+            {"tables": list(PARTITION_COLUMNS)},
+        )
+    }
+
+
+def get_partition_days(session: Session, table_name: str) -> list[date]:
+    """Return the days of the partitions of a table, oldest first."""
+    prefix = f"{table_name}_p"
+    days: list[date] = []
+    for (name,) in session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits"
+            " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)"
+        ),
+        {"table": table_name},
+    ):
+        if not name.startswith(prefix):
+            continue
+        try:
+            days.append(
+                datetime.strptime(name[len(prefix) :], _PARTITION_DAY_FORMAT).date()
+            )
+        except ValueError:
+            continue
+    return sorted(days)
+
+
+def create_default_partition(
+    session: Session, table_name: str, parent: str | None = None
+) -> None:
+    """Create the default partition of a table.
+
+    parent is the name of the partitioned table if
+    the table is being created under another name.
+    """
+    session.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {default_partition_name(table_name)}"
+            f" PARTITION OF {parent or table_name} DEFAULT"
+        )
+    )
+
+
+def create_partitions(
+    session: Session,
+    table_name: str,
+    days: Iterable[date],
+    parent: str | None = None,
+) -> None:
+    """Create the missing partitions of a table for days.
+
+    parent is the name of the partitioned table if
+    the table is being created under another name.
+    """
+    existing_days = set(get_partition_days(session, parent or table_name))
+    for day in days:
+        if day in existing_days:
+            continue
+        name = partition_name(table_name, day)
+        start_ts = day_start_timestamp(day)
+        end_ts = day_start_timestamp(day + timedelta(days=1))
+        try:
+            with session.begin_nested():
+                session.execute(
+                    text(
+                        f"CREATE TABLE {name} PARTITION OF {parent or table_name}"
+                        f" FOR VALUES FROM ({start_ts}) TO ({end_ts})"
+                    )
+                )
+        except SQLAlchemyError:
+            # The default partition already has rows of the day
+            _LOGGER.warning(
+                "Could not create partition %s, the rows of the day are kept in %s",
+                name,
+                default_partition_name(table_name),
+            )
+
+
+def create_future_partitions(
+    session: Session, partitioned_tables: Iterable[str], today: date
+) -> None:
+    """Create the partitions from today to PARTITIONS_AHEAD_DAYS days ahead."""
+    days = [today + timedelta(days=days) for days in range(PARTITIONS_AHEAD_DAYS + 1)]
+    for table_name in partitioned_tables:
+        create_partitions(session, table_name, days)
+
+
+def find_partition_days_to_drop(
+    session: Session, table_name: str, purge_before: float
+) -> list[date]:
+    """Return the days of the partitions that only have rows older than purge_before."""
+    return [
+        day
+        for day in get_partition_days(session, table_name)
+        if day_start_timestamp(day + timedelta(days=1)) <= purge_before
+    ]
+
+
+def drop_partition(session: Session, name: str) -> None:
+    """Drop a partition with all of its rows."""
+    session.execute(text(f"DROP TABLE {name}"))
+    _LOGGER.debug("Dropped partition %s", name)
+
+
+def find_partition_attributes_ids(name: str) -> Select:
+    """Find the attributes_ids used by the states of a partition."""
+    return (
+        select(column("attributes_id"))
+        .select_from(table(name))
+        .where(column("attributes_id").is_not(None))
+        .distinct()
+    )
+
+
+def find_partition_data_ids(name: str) -> Select:
+    """Find the data_ids used by the events of a partition."""
+    return (
+        select(column("data_id"))
+        .select_from(table(name))
+        .where(column("data_id").is_not(None))
+        .distinct()
+    )
+
+
+def find_partition_state_ids(
+    session: Session, name: str, state_ids: set[int], max_bind_vars: int
+) -> set[int]:
+    """Return the state_ids of state_ids that are in a partition."""
+    found_state_ids: set[int] = set()
+    for state_ids_chunk in chunked_or_all(state_ids, max_bind_vars):
+        found_state_ids.update(
+            session.execute(
+                select(column("state_id"))
+                .select_from(table(name))
+                .where(column("state_id").in_(state_ids_chunk))
+            ).scalars()
+        )
+    return found_state_ids
+
+
+def disconnect_partition_states_rows(name: str) -> Update:
+    """Disconnect the states that follow the states of a partition."""
+    states = table(TABLE_STATES, column("old_state_id"))
+    return (
+        update(states)
+        .where(
+            states.c.old_state_id.in_(
+                select(column("state_id")).select_from(table(name))
+            )
+        )
+        .values(old_state_id=None)
+    )
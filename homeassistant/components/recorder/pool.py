@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import threading
 import traceback
 from typing import Any
@@ -27,6 +28,11 @@ DEBUG_MUTEX_POOL_TRACE = False
 
 POOL_SIZE = 5
 
+# The read only pool is used for history, logbook and statistics
+# queries so they can run in parallel without waiting for the
+# connections of the recorder thread and the db executor
+READ_ONLY_POOL_SIZE = max(2, min(8, os.cpu_count() or 1))
+
 ADVISE_MSG = (
     "Use homeassistant.components.recorder.get_instance(hass).async_add_executor_job()"
 )
@@ -3,18 +3,28 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partition import (
+    disconnect_partition_states_rows,
+    drop_partition,
+    find_partition_attributes_ids,
+    find_partition_data_ids,
+    find_partition_days_to_drop,
+    find_partition_state_ids,
+    partition_name,
+)
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -32,12 +42,14 @@ from .queries import (
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_id_range_to_purge,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_id_range_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -53,6 +65,76 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The target duration of a purge slice, events queued while a
+# slice runs are recorded before the next slice starts
+PURGE_SLICE_TARGET_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge that runs in slices.
+
+    The number of batches purged per slice is adjusted after every
+    slice to keep the slices close to PURGE_SLICE_TARGET_SECONDS.
+    """
+
+    purge_before: datetime
+    started: datetime
+    finished: datetime | None = None
+    slices: int = 0
+    last_slice_seconds: float = 0
+    states_batch_size: int = 1
+    events_batch_size: int = 1
+    remaining_states: int | None = None
+    remaining_events: int | None = None
+
+    def add_slice(self, seconds: float) -> None:
+        """Size the next slice after the duration of a slice."""
+        self.slices += 1
+        self.last_slice_seconds = seconds
+        if seconds > PURGE_SLICE_TARGET_SECONDS:
+            self.states_batch_size = max(self.states_batch_size // 2, 1)
+            self.events_batch_size = max(self.events_batch_size // 2, 1)
+        elif seconds < PURGE_SLICE_TARGET_SECONDS / 2:
+            self.states_batch_size = min(
+                self.states_batch_size * 2, DEFAULT_STATES_BATCHES_PER_PURGE
+            )
+            self.events_batch_size = min(
+                self.events_batch_size * 2, DEFAULT_EVENTS_BATCHES_PER_PURGE
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        return asdict(self)
+
+
+def estimate_rows_to_purge(
+    instance: Recorder, purge_before: datetime
+) -> tuple[int, int]:
+    """Estimate the number of states and events older than purge_before.
+
+    Ids increase with time, so the estimate is the number of ids between
+    the oldest row and the first row to keep, which only takes a few
+    index lookups even on very large tables.
+    """
+    purge_before_ts = purge_before.timestamp()
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        states = session.execute(find_states_id_range_to_purge(purge_before_ts)).one()
+        events = session.execute(find_events_id_range_to_purge(purge_before_ts)).one()
+    return _estimate_ids_to_purge(*states), _estimate_ids_to_purge(*events)
+
+
+def _estimate_ids_to_purge(
+    oldest_id: int | None, first_id_to_keep: int | None, newest_id: int | None
+) -> int:
+    """Estimate the number of rows to purge from the ids."""
+    if oldest_id is None or newest_id is None:
+        return 0
+    if first_id_to_keep is None:
+        # All rows are older than purge_before
+        return newest_id - oldest_id + 1
+    return max(first_id_to_keep - oldest_id, 0)
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -85,6 +167,13 @@ def purge_old_data(
                 "Purge running in new format as there are NO states with event_id"
                 " remaining"
             )
+            if instance.partitioned_tables and _purge_partitions(
+                instance, session, purge_before
+            ):
+                # Drop the partitions one at a time before
+                # purging the remaining rows one by one
+                _LOGGER.debug("Purging partitions hasn't fully completed yet")
+                return False
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
                 instance, session, states_batch_size, purge_before
@@ -247,6 +336,62 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _purge_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Drop the oldest partition of the partitioned tables older than purge_before.
+
+    Returns true if a partition was dropped.
+    """
+    purge_before_ts = purge_before.timestamp()
+    has_dropped_partition = False
+    for table_name in instance.partitioned_tables:
+        if not (
+            days := find_partition_days_to_drop(session, table_name, purge_before_ts)
+        ):
+            continue
+        name = partition_name(table_name, days[0])
+        if table_name == TABLE_STATES:
+            _purge_states_partition(instance, session, name)
+        elif table_name == TABLE_EVENTS:
+            _purge_events_partition(instance, session, name)
+        else:
+            drop_partition(session, name)
+        has_dropped_partition = True
+    return has_dropped_partition
+
+
+def _purge_states_partition(instance: Recorder, session: Session, name: str) -> None:
+    """Drop a partition of the states table and purge the unused attributes."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(find_partition_attributes_ids(name))
+    }
+    state_ids = find_partition_state_ids(
+        session,
+        name,
+        instance.states_manager.committed_state_ids,
+        instance.max_bind_vars,
+    )
+    # There is no foreign key on old_state_id since the
+    # states table is partitioned, but the states should
+    # not refer to a dropped state either way
+    disconnected_rows = session.execute(disconnect_partition_states_rows(name))
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+    drop_partition(session, name)
+    instance.states_manager.evict_purged_state_ids(state_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_events_partition(instance: Recorder, session: Session, name: str) -> None:
+    """Drop a partition of the events table and purge the unused event data."""
+    data_ids = {
+        data_id for (data_id,) in session.execute(find_partition_data_ids(name))
+    }
+    drop_partition(session, name)
+    _purge_unused_data_ids(instance, session, data_ids)
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -637,6 +637,36 @@ def find_states_to_purge(
     )
 
 
+def find_states_id_range_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the oldest state_id, the first state_id to keep and the newest state_id."""
+    return lambda_stmt(
+        lambda: select(
+            func.min(States.state_id),
+            select(States.state_id)
+            .filter(States.last_updated_ts >= purge_before)
+            .order_by(States.last_updated_ts)
+            .limit(1)
+            .scalar_subquery(),
+            func.max(States.state_id),
+        )
+    )
+
+
+def find_events_id_range_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the oldest event_id, the first event_id to keep and the newest event_id."""
+    return lambda_stmt(
+        lambda: select(
+            func.min(Events.event_id),
+            select(Events.event_id)
+            .filter(Events.time_fired_ts >= purge_before)
+            .order_by(Events.time_fired_ts)
+            .limit(1)
+            .scalar_subquery(),
+            func.max(Events.event_id),
+        )
+    )
+
+
 def find_oldest_state() -> StatementLambdaElement:
     """Find the last_updated_ts of the oldest state."""
     return lambda_stmt(
@@ -674,6 +704,11 @@ def find_latest_statistics_runs_run_id() -> StatementLambdaElement:
     return lambda_stmt(lambda: select(func.max(StatisticsRuns.run_id)))
 
 
+def find_latest_recorder_runs_run_id() -> StatementLambdaElement:
+    """Find the latest recorder_runs run_id."""
+    return lambda_stmt(lambda: select(func.max(RecorderRuns.run_id)))
+
+
 def find_legacy_event_state_and_attributes_and_data_ids_to_purge(
     purge_before: float, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -0,0 +1,184 @@
+"""Keep the recently recorded states for compiling statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+from homeassistant.components.sensor import ATTR_STATE_CLASS
+from homeassistant.core import Event, EventStateChangedData, State
+import homeassistant.util.dt as dt_util
+
+# If the statistics are not compiled for a long time, for example
+# because the recorder is far behind, the states are dropped and
+# the statistics are compiled from the database instead
+MAX_RECENT_STATES = 100000
+
+# The last_updated and last_changed timestamps, the state and the
+# attributes of a state, the attributes are shared with the State
+type _RecentState = tuple[float, float, str, Mapping[str, Any]]
+
+
+def _recent_state(state: State) -> _RecentState:
+    """Return the parts of a state needed to compile statistics."""
+    return (
+        state.last_updated_timestamp,
+        state.last_changed_timestamp,
+        state.state,
+        state.attributes,
+    )
+
+
+def _state(entity_id: str, recent_state: _RecentState) -> State:
+    """Return a recent state as a State."""
+    last_updated_ts, last_changed_ts, state, attributes = recent_state
+    last_updated = dt_util.utc_from_timestamp(last_updated_ts)
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_changed=last_updated
+        if last_changed_ts == last_updated_ts
+        else dt_util.utc_from_timestamp(last_changed_ts),
+        last_reported=last_updated,
+        last_updated=last_updated,
+        validate_entity_id=False,
+        last_updated_timestamp=last_updated_ts,
+    )
+
+
+class RecentStates:
+    """Keep the states recorded since the start of the last statistics period.
+
+    Statistics platforms can read the states of the period they compile
+    from memory instead of querying the states table. The states of an
+    entity are only served from memory when every state change of its
+    domain has been seen since before the start of the period, the
+    database is the fallback for everything else. Only the states of
+    entities with a state class are kept, without the State objects.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the recent states."""
+        # The time since when all state changes of a domain have been seen
+        self._domains: dict[str, float] = {}
+        self._states: dict[str, list[_RecentState]] = {}
+        # The time an entity was removed or lost its state class, the
+        # entity is served from the database until the period of the
+        # state change is compiled
+        self._removed: dict[str, float] = {}
+        self._count = 0
+
+    def add_domain(self, domain: str) -> None:
+        """Start keeping the states of a domain."""
+        if domain not in self._domains:
+            self._domains[domain] = dt_util.utcnow().timestamp()
+
+    def reset(self) -> None:
+        """Drop all states, for example after states may have been lost."""
+        now_timestamp = dt_util.utcnow().timestamp()
+        for domain in self._domains:
+            self._domains[domain] = now_timestamp
+        self._states.clear()
+        self._removed.clear()
+        self._count = 0
+
+    def add(self, event: Event[EventStateChangedData]) -> None:
+        """Add the new state of a recorded state_changed event."""
+        entity_id = event.data["entity_id"]
+        if entity_id.partition(".")[0] not in self._domains:
+            return
+        if (
+            new_state := event.data["new_state"]
+        ) is None or ATTR_STATE_CLASS not in new_state.attributes:
+            if states := self._states.pop(entity_id, None):
+                self._count -= len(states)
+            self._removed[entity_id] = event.time_fired_timestamp
+            return
+        if (states := self._states.get(entity_id)) is None:
+            # The old state is the state the entity had when
+            # its domain started to be kept
+            old_state = event.data["old_state"]
+            states = self._states[entity_id] = (
+                [_recent_state(old_state)] if old_state else []
+            )
+            self._count += len(states)
+        states.append(_recent_state(new_state))
+        self._count += 1
+        if self._count > MAX_RECENT_STATES:
+            self.reset()
+
+    def get_period(
+        self,
+        current_states: Iterable[State],
+        start: datetime,
+        end: datetime,
+        significant_changes_only: bool,
+    ) -> tuple[dict[str, list[State]], list[str]]:
+        """Return the states of entities during start-end.
+
+        The states are returned in the same way as the history queries,
+        including the state the entity had at the start of the period.
+        current_states are the states of the entities in the state
+        machine. Returns the states and the entity_ids that have to
+        be queried from the database.
+        """
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        self._prune(start_ts)
+        result: dict[str, list[State]] = {}
+        missing: list[str] = []
+        for current_state in current_states:
+            entity_id = current_state.entity_id
+            if (
+                self._domains.get(current_state.domain, end_ts) > start_ts
+                or entity_id in self._removed
+            ):
+                missing.append(entity_id)
+                continue
+            if (states := self._states.get(entity_id)) is None:
+                # The state has not changed since the domain started to
+                # be kept, unless it changed after the end of the period
+                # and the state change has not been recorded yet
+                if current_state.last_updated_timestamp >= end_ts:
+                    missing.append(entity_id)
+                else:
+                    result[entity_id] = [current_state]
+                continue
+            period_states: list[State] = []
+            for state in states:
+                last_updated_ts = state[0]
+                if last_updated_ts < start_ts:
+                    # Only the last state before the start is kept by _prune
+                    period_states.append(_state(entity_id, state))
+                elif last_updated_ts >= end_ts:
+                    break
+                elif not significant_changes_only or state[1] == last_updated_ts:
+                    period_states.append(_state(entity_id, state))
+            if period_states:
+                result[entity_id] = period_states
+        return result, missing
+
+    def _prune(self, start_ts: float) -> None:
+        """Drop the states that are older than the state at start_ts.
+
+        Periods that start before start_ts are served
+        from the database once the states are dropped.
+        """
+        for domain, since_ts in self._domains.items():
+            self._domains[domain] = max(since_ts, start_ts)
+        for entity_id, states in self._states.items():
+            for idx in range(len(states) - 1, 0, -1):
+                if states[idx][0] < start_ts:
+                    self._count -= idx
+                    self._states[entity_id] = states[idx:]
+                    break
+        self._removed = {
+            entity_id: removed_ts
+            for entity_id, removed_ts in self._removed.items()
+            if removed_ts >= start_ts
+        }
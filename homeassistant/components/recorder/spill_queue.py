@@ -0,0 +1,186 @@
+"""Disk backed queue for events that overflow the recorder queue."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any, cast
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+_ORIGINS = tuple(EventOrigin)
+
+
+def event_to_spill_line(event: Event) -> bytes | None:
+    """Serialize an event to a line of the spill queue."""
+    context = event.context
+    try:
+        return (
+            json_bytes(
+                (
+                    event.event_type,
+                    event.data,
+                    event.origin.idx,
+                    event.time_fired_timestamp,
+                    context.id,
+                    context.user_id,
+                    context.parent_id,
+                )
+            )
+            + b"\n"
+        )
+    except (ValueError, TypeError):
+        _LOGGER.warning("Event is not JSON serializable and was not spilled: %s", event)
+        return None
+
+
+def spill_line_to_event(line: bytes) -> Event | None:
+    """Restore an event from a line of the spill queue."""
+    try:
+        (
+            event_type,
+            data,
+            origin_idx,
+            time_fired_timestamp,
+            context_id,
+            context_user_id,
+            context_parent_id,
+        ) = cast(list[Any], json_loads(line))
+    except (*JSON_DECODE_EXCEPTIONS, ValueError, TypeError):
+        # A partially written line if Home Assistant
+        # was not shut down cleanly while spilling
+        _LOGGER.warning("Skipping corrupt line in the recorder spill queue")
+        return None
+    if event_type == EVENT_STATE_CHANGED:
+        data["old_state"] = State.from_dict(data.get("old_state"))
+        data["new_state"] = State.from_dict(data.get("new_state"))
+    return Event(
+        event_type,
+        data,
+        _ORIGINS[origin_idx],
+        time_fired_timestamp,
+        Context(user_id=context_user_id, parent_id=context_parent_id, id=context_id),
+    )
+
+
+class SpillQueue:
+    """An append-only JSON lines file of events waiting to be recorded.
+
+    Lines are appended from the executor and read back in order
+    by the recorder thread. The file is removed as soon as every
+    line has been read, which keeps the disk usage bounded by
+    max_size while the database is behind.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the spill queue."""
+        self.path = path
+        self.max_size = max_size
+        self.depth = 0
+        self.full = False
+        self._lock = threading.Lock()
+        self._read_offset = 0
+        self._write_offset = 0
+
+    def load(self) -> int:
+        """Load a spill queue left behind by a previous run.
+
+        Returns the number of events waiting to be replayed.
+        """
+        with self._lock:
+            try:
+                with open(self.path, "rb") as spill_file:
+                    data = spill_file.read()
+            except FileNotFoundError:
+                return 0
+            except OSError as err:
+                _LOGGER.error("Could not read the recorder spill queue: %s", err)
+                return 0
+            self._read_offset = 0
+            self._write_offset = len(data)
+            self.depth = data.count(b"\n")
+            return self.depth
+
+    def append(self, lines: list[bytes]) -> bool:
+        """Append lines to the queue.
+
+        Returns False if the lines were dropped because
+        the queue is full or cannot be written.
+        """
+        data = b"".join(lines)
+        with self._lock:
+            if self.full or self._write_offset + len(data) > self.max_size:
+                self.full = True
+                return False
+            try:
+                with open(self.path, "ab") as spill_file:
+                    spill_file.write(data)
+            except OSError as err:
+                _LOGGER.error("Could not write the recorder spill queue: %s", err)
+                self.full = True
+                return False
+            self._write_offset += len(data)
+            self.depth += len(lines)
+            return True
+
+    def read(self, max_lines: int) -> list[bytes]:
+        """Read the next lines from the queue."""
+        with self._lock:
+            if self._read_offset >= self._write_offset:
+                return []
+            lines: list[bytes] = []
+            try:
+                with open(self.path, "rb") as spill_file:
+                    spill_file.seek(self._read_offset)
+                    while len(lines) < max_lines and (line := spill_file.readline()):
+                        lines.append(line)
+            except OSError as err:
+                _LOGGER.error("Could not read the recorder spill queue: %s", err)
+                self._remove()
+                return []
+            self._read_offset += sum(len(line) for line in lines)
+            self.depth = max(self.depth - len(lines), 0)
+            if not lines or self._read_offset >= self._write_offset:
+                self._remove()
+            return lines
+
+    def close(self) -> None:
+        """Drop the lines already read so a later run only replays the rest."""
+        with self._lock:
+            if not self._read_offset:
+                return
+            if self._read_offset >= self._write_offset:
+                self._remove()
+                return
+            temp_path = f"{self.path}.tmp"
+            try:
+                with (
+                    open(self.path, "rb") as spill_file,
+                    open(temp_path, "wb") as temp_file,
+                ):
+                    spill_file.seek(self._read_offset)
+                    while chunk := spill_file.read(1024**2):
+                        temp_file.write(chunk)
+                os.replace(temp_path, self.path)
+            except OSError as err:
+                _LOGGER.error("Could not compact the recorder spill queue: %s", err)
+                return
+            self._write_offset -= self._read_offset
+            self._read_offset = 0
+
+    def _remove(self) -> None:
+        """Remove the queue file once it has been fully read."""
+        self._read_offset = self._write_offset = self.depth = 0
+        self.full = False
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            _LOGGER.error("Could not remove the recorder spill queue: %s", err)
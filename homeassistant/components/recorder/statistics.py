@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
+import math
 from operator import itemgetter
 import re
+import threading
 from time import time as time_time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
@@ -84,6 +86,8 @@ from .util import (
 )
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from . import Recorder
 
 QUERY_STATISTICS = (
@@ -164,6 +168,15 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+# The maximum number of statistics_during_period results to cache
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 256
+
+# Reduce statistics with NumPy when there are on average at least this
+# many rows per statistic, below that the overhead per statistic makes
+# the loop over the rows faster
+REDUCE_STATISTICS_VECTORIZED_MIN_ROWS = 100
 
 
 def mean(values: list[float]) -> float | None:
@@ -207,6 +220,89 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+class StatisticsDuringPeriodCache:
+    """LRU cache for the results of statistics_during_period.
+
+    Statistics of a finished period only change when statistics are
+    imported, adjusted or cleared, or when their unit is changed, which
+    clears the cache. Compiling statistics only invalidates the results
+    of periods that end after the start of the compiled statistics.
+
+    Results are looked up from the executor, the cache is invalidated
+    from the recorder thread after the changes have been committed.
+    """
+
+    def __init__(self, max_size: int = STATISTICS_DURING_PERIOD_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        # key: (end timestamp of the period, result)
+        self._results: OrderedDict[
+            Hashable, tuple[float, dict[str, list[StatisticsRow]]]
+        ] = OrderedDict()
+        self._max_size = max_size
+        # Results read before an invalidation are not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> tuple[dict[str, list[StatisticsRow]] | None, int]:
+        """Return a copy of the cached result and the current generation."""
+        with self._lock:
+            if (cached := self._results.get(key)) is None:
+                self.misses += 1
+                return None, self._generation
+            self._results.move_to_end(key)
+            self.hits += 1
+            return _copy_statistics_result(cached[1]), self._generation
+
+    def set(
+        self,
+        key: Hashable,
+        generation: int,
+        end_ts: float,
+        result: dict[str, list[StatisticsRow]],
+    ) -> None:
+        """Cache a result that was read in generation."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._results[key] = (end_ts, _copy_statistics_result(result))
+            self._results.move_to_end(key)
+            if len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+
+    def invalidate_after(self, timestamp: float) -> None:
+        """Drop the results of periods ending after timestamp."""
+        with self._lock:
+            self._generation += 1
+            self._results = OrderedDict(
+                (key, cached)
+                for key, cached in self._results.items()
+                if cached[0] <= timestamp
+            )
+
+    def clear(self) -> None:
+        """Drop all results."""
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the hits, misses and size of the cache."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._results)}
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Copy a result so callers can modify the rows."""
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -492,6 +588,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    get_statistics_during_period_cache(instance.hass).clear()
     return True
 
 
@@ -518,6 +615,16 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    # The statistics have been committed, drop the cached results they change
+    cache = get_statistics_during_period_cache(instance.hass)
+    if modified_statistic_ids:
+        cache.clear()
+    elif start.minute == 55:
+        # The hourly statistics start at the start of the hour
+        cache.invalidate_after(start.replace(minute=0).timestamp())
+    else:
+        cache.invalidate_after(start.timestamp())
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -755,6 +862,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 def update_statistics_metadata(
@@ -780,6 +888,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 async def async_list_statistic_ids(
@@ -916,6 +1025,23 @@ def _reduce_statistics(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily or monthly statistics."""
+    if sum(len(stat_list) for stat_list in stats.values()) >= (
+        REDUCE_STATISTICS_VECTORIZED_MIN_ROWS * len(stats)
+    ):
+        return _reduce_statistics_vectorized(stats, period_start_end, types)
+    return _reduce_statistics_per_row(
+        stats, same_period, period_start_end, period, types
+    )
+
+
+def _reduce_statistics_per_row(
+    stats: dict[str, list[StatisticsRow]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily or monthly statistics row by row."""
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
     period_seconds = period.total_seconds()
     _want_mean = "mean" in types
@@ -967,6 +1093,118 @@ def _reduce_statistics(
     return result
 
 
+def _period_boundaries(
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> np.ndarray:
+    """Return the start of each period spanned by the statistics.
+
+    The last element is the end of the last period.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    first_start = min(stat_list[0]["start"] for stat_list in stats.values())
+    last_start = max(stat_list[-1]["start"] for stat_list in stats.values())
+    start, end = period_start_end(first_start)
+    boundaries = [start]
+    while end <= last_start:
+        start, end = period_start_end(end)
+        boundaries.append(start)
+    boundaries.append(end)
+    return np.array(boundaries)
+
+
+def _column(stat_list: list[StatisticsRow], column: str) -> np.ndarray:
+    """Return a column of the statistics, None is NaN."""
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    return np.array(list(map(itemgetter(column), stat_list)), dtype=np.float64)
+
+
+def _nan_to_none(values: np.ndarray) -> list[float | None]:
+    """Return the values as a list, NaN is None."""
+    return [
+        None if math.isnan(value) else value
+        for value in cast(list[float], values.tolist())
+    ]
+
+
+def _reduce_statistics_vectorized(
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily or monthly statistics with NumPy.
+
+    Returns the same result as _reduce_statistics_per_row. The period
+    boundaries are computed once, the rows are grouped by period and the
+    mean, min and max are reduced per column.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    result: dict[str, list[StatisticsRow]] = {}
+    if not stats:
+        return result
+    boundaries = _period_boundaries(stats, period_start_end)
+    _want_mean = "mean" in types
+    _want_min = "min" in types
+    _want_max = "max" in types
+    _want_last_reset = "last_reset" in types
+    _want_state = "state" in types
+    _want_sum = "sum" in types
+    for statistic_id, stat_list in stats.items():
+        starts = np.fromiter(
+            map(itemgetter("start"), stat_list), np.float64, len(stat_list)
+        )
+        period_idx = np.searchsorted(boundaries, starts, side="right") - 1
+        # The index of the first and the last row of each period
+        first_rows = np.flatnonzero(np.diff(period_idx, prepend=-1))
+        last_rows = np.append(first_rows[1:], len(stat_list)) - 1
+        periods = period_idx[first_rows]
+        reduced: dict[str, list[float | None]] = {}
+        if _want_mean:
+            values = _column(stat_list, "mean")
+            valid = ~np.isnan(values)
+            counts = np.add.reduceat(valid, first_rows, dtype=np.int64)
+            sums = np.add.reduceat(np.where(valid, values, 0), first_rows)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                reduced["mean"] = _nan_to_none(sums / counts)
+        if _want_min:
+            # fmin and fmax ignore NaN unless all values are NaN
+            reduced["min"] = _nan_to_none(
+                np.fmin.reduceat(_column(stat_list, "min"), first_rows)
+            )
+        if _want_max:
+            reduced["max"] = _nan_to_none(
+                np.fmax.reduceat(_column(stat_list, "max"), first_rows)
+            )
+        rows: list[StatisticsRow] = []
+        for idx, (start, end, last_row) in enumerate(
+            zip(
+                boundaries[periods].tolist(),
+                boundaries[periods + 1].tolist(),
+                cast(list[int], last_rows.tolist()),
+                strict=True,
+            )
+        ):
+            row: StatisticsRow = {"start": start, "end": end}
+            for column, values_list in reduced.items():
+                row[column] = values_list[idx]  # type: ignore[literal-required]
+            prev_stat = stat_list[last_row]
+            if _want_last_reset:
+                row["last_reset"] = prev_stat.get("last_reset")
+            if _want_state:
+                row["state"] = prev_stat.get("state")
+            if _want_sum:
+                row["sum"] = prev_stat["sum"]
+            rows.append(row)
+        result[statistic_id] = rows
+    return result
+
+
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1706,6 +1944,43 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _align_period(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the period."""
+    if period == "day":
+        start_time = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        start_time = start_time.replace()
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = end_local.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) + timedelta(days=1)
+    elif period == "week":
+        start_local = dt_util.as_local(start_time)
+        start_time = start_local.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=start_local.weekday())
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = (
+                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                - timedelta(days=end_local.weekday())
+                + timedelta(days=7)
+            )
+    elif period == "month":
+        start_time = dt_util.as_local(start_time).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    return start_time, end_time
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1743,35 +2018,7 @@ def _statistics_during_period_with_session(
     if statistic_ids is not None:
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
-    # Align start_time and end_time with the period
-    if period == "day":
-        start_time = dt_util.as_local(start_time).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        start_time = start_time.replace()
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = end_local.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-    elif period == "week":
-        start_local = dt_util.as_local(start_time)
-        start_time = start_local.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=start_local.weekday())
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = (
-                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
-                - timedelta(days=end_local.weekday())
-                + timedelta(days=7)
-            )
-    elif period == "month":
-        start_time = dt_util.as_local(start_time).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        if end_time is not None:
-            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    start_time, end_time = _align_period(start_time, end_time, period)
 
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
@@ -1829,8 +2076,46 @@ def statistics_during_period(
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
+    if statistic_ids is None:
+        # Not cached, the result depends on the states of all statistics
+        with session_scope(hass=hass, read_only=True) as session:
+            return _statistics_during_period_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                period,
+                units,
+                types,
+            )
+
+    cache = get_statistics_during_period_cache(hass)
+    states = hass.states
+    key = (
+        start_time,
+        end_time,
+        # Statistics are converted to the unit of their state unless
+        # a unit is requested
+        tuple(
+            (
+                statistic_id,
+                state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if (state := states.get(statistic_id))
+                else UNDEFINED,
+            )
+            for statistic_id in sorted(statistic_ids)
+        ),
+        period,
+        None if units is None else tuple(sorted(units.items())),
+        frozenset(types),
+        dt_util.get_default_time_zone(),
+    )
+    cached, generation = cache.get(key)
+    if cached is not None:
+        return cached
     with session_scope(hass=hass, read_only=True) as session:
-        return _statistics_during_period_with_session(
+        result = _statistics_during_period_with_session(
             hass,
             session,
             start_time,
@@ -1840,6 +2125,10 @@ def statistics_during_period(
             units,
             types,
         )
+    aligned_end_time = _align_period(start_time, end_time, period)[1]
+    end_ts = math.inf if aligned_end_time is None else aligned_end_time.timestamp()
+    cache.set(key, generation, end_ts, result)
+    return result
 
 
 def _get_last_statistics_stmt(
@@ -2376,6 +2665,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics_during_period cache."""
+    return StatisticsDuringPeriodCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2435,15 +2732,18 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
-    with session_scope(
-        session=instance.get_session(),
-        exception_filter=filter_unique_constraint_integrity_error(
-            instance, "statistic"
-        ),
-    ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
-        )
+    try:
+        with session_scope(
+            session=instance.get_session(),
+            exception_filter=filter_unique_constraint_integrity_error(
+                instance, "statistic"
+            ),
+        ) as session:
+            return _import_statistics_with_session(
+                instance, session, metadata, statistics, table
+            )
+    finally:
+        get_statistics_during_period_cache(instance.hass).clear()
 
 
 @retryable_database_job("adjust_statistics")
@@ -2485,6 +2785,7 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    get_statistics_during_period_cache(instance.hass).clear()
     return True
 
 
@@ -2552,6 +2853,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 @callback
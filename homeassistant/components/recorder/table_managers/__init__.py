@@ -74,3 +74,35 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+    def snapshot(self) -> list[tuple[EventType[Any] | str, int]]:
+        """Return the cached ids, the least recently used first.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return list(reversed(self._id_map.items()))
+
+    def prewarm(self, ids: list[Any]) -> int:
+        """Load the ids of a snapshot into the cache.
+
+        The cache grows to the size of the snapshot, which is
+        bounded by the size the cache had when it was taken.
+        Returns the number of ids loaded.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.adjust_lru_size(len(ids))
+        lru = self._id_map
+        loaded = 0
+        for item in ids:
+            if (
+                isinstance(item, list)
+                and len(item) == 2
+                and isinstance(key := item[0], str)
+                and type(id_ := item[1]) is int
+            ):
+                lru[key] = id_
+                loaded += 1
+        return loaded
@@ -28,6 +28,11 @@ class StatesManager:
         """Return the oldest timestamp."""
         return self._oldest_ts
 
+    @property
+    def committed_state_ids(self) -> set[int]:
+        """Return the state_ids of the committed states."""
+        return set(self._last_committed_id.values())
+
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
 
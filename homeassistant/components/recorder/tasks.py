@@ -9,13 +9,15 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
+from homeassistant.util import dt as dt_util
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, INTEGRATION_PLATFORM_COMPILE_STATISTICS
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -114,20 +116,40 @@ class PurgeTask(RecorderTask):
     purge_before: datetime
     repack: bool
     apply_filter: bool
+    progress: purge.PurgeProgress | None = None
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        if (progress := self.progress) is None:
+            progress = purge.PurgeProgress(self.purge_before, dt_util.utcnow())
+            instance.purge_progress = progress
+        progress.remaining_states, progress.remaining_events = (
+            purge.estimate_rows_to_purge(instance, self.purge_before)
+        )
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            events_batch_size=progress.events_batch_size,
+            states_batch_size=progress.states_batch_size,
+        )
+        progress.add_slice(time.monotonic() - start)
+        # Cached statistics may include purged short term statistics
+        statistics.get_statistics_during_period_cache(instance.hass).clear()
+        if finished:
+            progress.finished = dt_util.utcnow()
+            progress.remaining_states = progress.remaining_events = 0
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
             return
-        # Schedule a new purge task if this one didn't finish
+        # Schedule a new purge task if this one didn't finish, the
+        # events queued while this slice ran are recorded first
         instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
+            PurgeTask(self.purge_before, self.repack, self.apply_filter, progress)
         )
 
 
@@ -295,6 +317,17 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class SpillQueueReplayTask(RecorderTask):
+    """Replay the events written to the spill queue."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_spill_queue()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
@@ -310,6 +343,8 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DOMAIN].recorder_platforms
         platforms[domain] = platform
+        if hasattr(platform, INTEGRATION_PLATFORM_COMPILE_STATISTICS):
+            instance.recent_states.add_domain(domain)
 
 
 @dataclass(slots=True)
@@ -57,6 +57,7 @@ from .models import (
     UnsupportedDialect,
     process_timestamp,
 )
+from .partition import create_future_partitions
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
@@ -622,6 +623,19 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_only_connection_for_dialect(
+    instance: Recorder, dialect_name: str, dbapi_connection: DBAPIConnection
+) -> None:
+    """Execute statements needed for a connection of the read only pool."""
+    setup_connection_for_dialect(instance, dialect_name, dbapi_connection, False)
+    if dialect_name == SupportedDialect.SQLITE:
+        # Readers never take the write lock so they
+        # do not block the recorder thread in WAL mode
+        execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -780,6 +794,11 @@ def periodic_db_cleanups(instance: Recorder) -> None:
     These cleanups will happen nightly or after any purge.
     """
     assert instance.engine is not None
+    if instance.partitioned_tables:
+        with session_scope(session=instance.get_session()) as session:
+            create_future_partitions(
+                session, instance.partitioned_tables, dt_util.utcnow().date()
+            )
     if instance.engine.dialect.name == SupportedDialect.SQLITE:
         # Execute sqlite to create a wal checkpoint and free up disk space
         _LOGGER.debug("WAL checkpoint")
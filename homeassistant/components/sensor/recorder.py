@@ -402,6 +402,41 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_history(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    sensor_states: list[State],
+    entity_ids: list[str],
+    significant_changes_only: bool,
+) -> dict[str, list[State]]:
+    """Get the history of entities during start-end.
+
+    The states kept in memory by the recorder are used when they cover
+    the period, the database is only queried for the other entities.
+    """
+    wanted_entity_ids = set(entity_ids)
+    history_list, missing_entity_ids = get_instance(hass).recent_states.get_period(
+        (state for state in sensor_states if state.entity_id in wanted_entity_ids),
+        start,
+        end,
+        significant_changes_only,
+    )
+    if missing_entity_ids:
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=missing_entity_ids,
+                significant_changes_only=significant_changes_only,
+            )
+        )
+    return history_list
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -419,13 +454,8 @@ def compile_statistics(  # noqa: C901
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list = _get_history(
+            hass, session, start, end, sensor_states, entities_full_history, False
         )
     entities_significant_history = [
         i.entity_id
@@ -433,12 +463,8 @@ def compile_statistics(  # noqa: C901
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        _history_list = _get_history(
+            hass, session, start, end, sensor_states, entities_significant_history, True
         )
         history_list = {**history_list, **_history_list}
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Final, cast
 
+import voluptuous as vol
+
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType, VolSchemaType
@@ -44,7 +46,22 @@ DOMAIN: Final = const.DOMAIN
 
 DEPENDENCIES: Final[tuple[str]] = ("http",)
 
-CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Any(
+            None,
+            vol.Schema(
+                {
+                    vol.Optional(
+                        const.CONF_COALESCE_THRESHOLD,
+                        default=const.DEFAULT_COALESCE_THRESHOLD,
+                    ): cv.positive_int,
+                }
+            ),
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 
 @bind_hass
@@ -69,6 +86,10 @@ def async_register_command(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the websocket API."""
+    conf = config.get(DOMAIN) or {}
+    hass.data[const.DATA_COALESCING] = http.EntityChangeCoalescing(
+        conf.get(const.CONF_COALESCE_THRESHOLD, const.DEFAULT_COALESCE_THRESHOLD)
+    )
     hass.http.register_view(http.WebsocketAPIView())
     commands.async_register_commands(hass, async_register_command)
     return True
@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -60,6 +61,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +69,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DATA_ENTITY_CHANGES_FANOUT: HassKey[EntityChangesFanout] = HassKey(
+    "websocket_api_entity_changes_fanout"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -367,31 +372,144 @@ def _send_handle_get_states_response(
     )
 
 
+class _EntitySubscription:
+    """A subscribe_entities subscription of a single connection."""
+
+    __slots__ = (
+        "send_message",
+        "send_entity_change",
+        "entity_ids",
+        "entity_filter",
+        "user",
+        "message_id_as_bytes",
+    )
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        send_entity_change: Callable[
+            [str, bytes, bytes, Event[EventStateChangedData]], None
+        ]
+        | None,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.send_entity_change = send_entity_change
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.user = user
+        self.message_id_as_bytes = message_id_as_bytes
+
+
+class EntityChangesFanout:
+    """Fan out state changed events to all subscribe_entities subscriptions.
+
+    A single state changed listener is shared by every subscription.
+    Each event is serialized once into a connection independent prefix
+    and the frame for a message id is built once per event, so
+    connections that subscribed with the same message id enqueue
+    the very same bytes object.
+    """
+
+    __slots__ = ("_hass", "_subscriptions", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fan out."""
+        self._hass = hass
+        self._subscriptions: list[_EntitySubscription] = []
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+        send_entity_change: Callable[
+            [str, bytes, bytes, Event[EventStateChangedData]], None
+        ]
+        | None = None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to entity changes and return a callback to unsubscribe.
+
+        When send_entity_change is passed, changes are queued with it
+        so the connection can coalesce changes of the same entity.
+        """
+        subscription = _EntitySubscription(
+            send_message,
+            send_entity_change,
+            entity_ids,
+            entity_filter,
+            user,
+            message_id_as_bytes,
+        )
+        # The list is replaced instead of mutated so it is safe
+        # to subscribe or unsubscribe while forwarding an event.
+        self._subscriptions = [*self._subscriptions, subscription]
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+        return partial(self._async_unsubscribe, subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: _EntitySubscription) -> None:
+        """Remove a subscription."""
+        self._subscriptions = [
+            sub for sub in self._subscriptions if sub is not subscription
+        ]
+        if not self._subscriptions and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        prefix: bytes | None = None
+        frames: dict[bytes, bytes] = {}
+        for sub in self._subscriptions:
+            if (sub.entity_ids and entity_id not in sub.entity_ids) or (
+                sub.entity_filter and not sub.entity_filter(entity_id)
+            ):
+                continue
+            # We have to lookup the permissions again because the user might have
+            # changed since the subscription was created.
+            user = sub.user
+            permissions = user.permissions
+            if (
+                not user.is_admin
+                and not permissions.access_all_entities(POLICY_READ)
+                and not permissions.check_entity(entity_id, POLICY_READ)
+            ):
+                continue
+            message_id_as_bytes = sub.message_id_as_bytes
+            if (frame := frames.get(message_id_as_bytes)) is None:
+                if prefix is None:
+                    prefix = messages.cached_state_diff_message_prefix(event)
+                frame = frames[message_id_as_bytes] = b"".join(
+                    (prefix, b',"id":', message_id_as_bytes, b"}")
+                )
+            if (send_entity_change := sub.send_entity_change) is None:
+                sub.send_message(frame)
+            else:
+                send_entity_change(entity_id, message_id_as_bytes, frame, event)
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+def async_get_entity_changes_fanout(hass: HomeAssistant) -> EntityChangesFanout:
+    """Return the shared subscribe_entities fan out."""
+    if (fanout := hass.data.get(DATA_ENTITY_CHANGES_FANOUT)) is None:
+        fanout = hass.data[DATA_ENTITY_CHANGES_FANOUT] = EntityChangesFanout(hass)
+    return fanout
 
 
 @callback
@@ -415,16 +533,15 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    connection.subscriptions[msg_id] = async_get_entity_changes_fanout(
+        hass
+    ).async_subscribe(
+        connection.send_message,
+        entity_ids,
+        entity_filter,
+        connection.user,
+        message_id_as_bytes,
+        connection.send_entity_change,
     )
     connection.send_result(msg_id)
 
@@ -10,7 +10,13 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import (
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
 from homeassistant.util.json import JsonValueType
@@ -43,6 +49,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_entity_change",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -65,6 +72,9 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self.send_entity_change: (
+            Callable[[str, bytes, bytes, Event[EventStateChangedData]], None] | None
+        ) = None
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -253,6 +263,7 @@ class ActiveConnection:
                 )
         self.subscriptions.clear()
         self.send_message = self._connect_closed_error
+        self.send_entity_change = None
         current_request.set(None)
         current_connection.set(None)
 
@@ -6,9 +6,11 @@ from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util.hass_dict import HassKey
 
 if TYPE_CHECKING:
     from .connection import ActiveConnection
+    from .http import EntityChangeCoalescing
 
 
 type WebSocketCommandHandler = Callable[
@@ -34,6 +36,12 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages after which queued subscribe_entities changes
+# for the same entity are merged into the latest state instead of queuing
+# every intermediate state.
+CONF_COALESCE_THRESHOLD: Final = "coalesce_threshold"
+DEFAULT_COALESCE_THRESHOLD: Final = 512
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -57,4 +65,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the coalescing threshold and counters
+DATA_COALESCING: HassKey[EntityChangeCoalescing] = HassKey(f"{DOMAIN}.coalescing")
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 import datetime as dt
 from functools import partial
 import logging
@@ -15,7 +16,7 @@ from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
@@ -23,6 +24,7 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    DATA_COALESCING,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
@@ -33,7 +35,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import cached_state_full_message, message_to_json_bytes
 from .util import describe_request
 
 CLOSE_MSG_TYPES = {WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.CLOSING}
@@ -45,6 +47,16 @@ if TYPE_CHECKING:
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+@dataclass(slots=True)
+class EntityChangeCoalescing:
+    """Threshold and counters for coalescing subscribe_entities changes."""
+
+    threshold: int
+    coalesced_messages: int = 0
+    # Connected clients which had entity changes coalesced
+    coalescing_connections: int = 0
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -84,6 +96,10 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_coalescing",
+        "_coalesced",
+        "_pending_entity_changes",
+        "_dequeued_count",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -107,6 +123,14 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Changes of subscribe_entities subscriptions that are still in the
+        # message queue keyed by message id and entity_id. The position is
+        # the absolute position in the queue, which is turned into an index
+        # by subtracting the number of messages already taken off the queue.
+        self._coalescing = hass.data[DATA_COALESCING]
+        self._coalesced: bool = False
+        self._pending_entity_changes: dict[tuple[bytes, str], tuple[int, bytes]] = {}
+        self._dequeued_count: int = 0
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -145,6 +169,7 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if not message_queue:
+                    self._pending_entity_changes.clear()
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -157,12 +182,14 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    self._dequeued_count += 1
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
                     continue
 
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                self._dequeued_count += len(message_queue)
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
@@ -236,6 +263,53 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _send_entity_change(
+        self,
+        entity_id: str,
+        message_id_as_bytes: bytes,
+        message: bytes,
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Queue a change of a subscribe_entities subscription.
+
+        Once the client falls behind and the queue passes the coalesce
+        threshold, a change for an entity that is still waiting in the
+        queue replaces the pending message with the full latest state so
+        the client sees the newest state instead of every intermediate one.
+        """
+        message_queue = self._message_queue
+        pending_entity_changes = self._pending_entity_changes
+        key = (message_id_as_bytes, entity_id)
+        if (
+            len(message_queue) >= self._coalescing.threshold
+            and (pending := pending_entity_changes.get(key)) is not None
+        ):
+            position, pending_message = pending
+            index = position - self._dequeued_count
+            if 0 <= index < len(message_queue) and (
+                message_queue[index] is pending_message
+            ):
+                message = cached_state_full_message(message_id_as_bytes, event)
+                message_queue[index] = message
+                pending_entity_changes[key] = (position, message)
+                coalescing = self._coalescing
+                coalescing.coalesced_messages += 1
+                if not self._coalesced:
+                    self._coalesced = True
+                    coalescing.coalescing_connections += 1
+                    self._logger.debug(
+                        "%s: Coalescing entity changes with %s pending messages",
+                        self.description,
+                        len(message_queue),
+                    )
+                return
+        pending_entity_changes[key] = (
+            self._dequeued_count + len(message_queue),
+            message,
+        )
+        self._send_message(message)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -397,6 +471,7 @@ class WebSocketHandler:
         if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("%s: Received %s", self.description, auth_msg_data)
         connection = await auth.async_handle(auth_msg_data)
+        connection.send_entity_change = self._send_entity_change
         # As the webserver is now started before the start
         # event we do not want to block for websocket responses
         #
@@ -525,6 +600,8 @@ class WebSocketHandler:
                 if connection is not None:
                     hass.data[DATA_CONNECTIONS] -= 1
                     self._connection = None
+                if self._coalesced:
+                    self._coalescing.coalescing_connections -= 1
 
                 async_dispatcher_send(hass, SIGNAL_WEBSOCKET_DISCONNECTED)
 
@@ -154,7 +154,7 @@ def cached_state_diff_message(
     """
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
+            cached_state_diff_message_prefix(event),
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -163,20 +163,55 @@ def cached_state_diff_message(
 
 
 @lru_cache(maxsize=128)
-def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
+def cached_state_diff_message_prefix(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    The message is constructed without the id and the closing
+    brace so the connection independent prefix can be shared
+    by every subscription and only the id has to be appended.
     """
     return (
         _message_to_json_bytes_or_none(
             {"type": "event", "event": _state_diff_event(event)}
         )
         or INVALID_JSON_PARTIAL_MESSAGE
+    )[:-1]
+
+
+def cached_state_full_message(
+    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+) -> bytes:
+    """Return an event message with the full new state of the entity.
+
+    This is sent in place of a diff when pending changes for
+    an entity are coalesced since the client has not seen the
+    intermediate states the diff is based on.
+    """
+    return b"".join(
+        (
+            _cached_state_full_message_prefix(event),
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
     )
 
 
+@lru_cache(maxsize=128)
+def _cached_state_full_message_prefix(event: Event[EventStateChangedData]) -> bytes:
+    """Cache and serialize the full state of the event to json without the id."""
+    if (new_state := event.data["new_state"]) is None:
+        state_event: dict[str, Any] = {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    else:
+        state_event = {
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}
+        }
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": state_event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )[:-1]
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
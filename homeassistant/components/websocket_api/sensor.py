@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
+    DATA_COALESCING,
     DATA_CONNECTIONS,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
@@ -24,7 +26,7 @@ async def async_setup_platform(
     """Set up the API streams platform."""
     entity = APICount()
 
-    async_add_entities([entity])
+    async_add_entities([entity, APICoalescedMessages(), APICoalescingConnections()])
 
 
 class APICount(SensorEntity):
@@ -54,3 +56,32 @@ class APICount(SensorEntity):
     def _update_count(self) -> None:
         self._attr_native_value = self.hass.data.get(DATA_CONNECTIONS, 0)
         self.async_write_ha_state()
+
+
+class APICoalescedMessages(SensorEntity):
+    """Entity to represent how many entity changes were coalesced."""
+
+    _attr_name = "Coalesced entity changes"
+    _attr_unique_id = "websocket_api_coalesced_entity_changes"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of coalesced entity changes."""
+        return self.hass.data[DATA_COALESCING].coalesced_messages
+
+
+class APICoalescingConnections(SensorEntity):
+    """Entity to represent how many connected clients had changes coalesced."""
+
+    _attr_name = "Coalescing clients"
+    _attr_unique_id = "websocket_api_coalescing_clients"
+    _attr_native_unit_of_measurement = "clients"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of connected clients that had changes coalesced."""
+        return self.hass.data[DATA_COALESCING].coalescing_connections
@@ -40,6 +40,7 @@ from typing import (
     overload,
 )
 
+from lru import LRU
 from propcache import cached_property, under_cached_property
 from typing_extensions import TypeVar
 import voluptuous as vol
@@ -192,6 +193,9 @@ _DEPRECATED_Config = DeferredDeprecatedAlias(
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# How many attribute dicts are interned by the state machine in compact mode
+_COMPACT_ATTRIBUTES_CACHE_SIZE = 1024
+
 
 EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_HOMEASSISTANT_CLOSE,
@@ -362,6 +366,26 @@ class HassJob[**_P, _R_co]:
         """Return if the job should be cancelled on shutdown."""
         return self._cancel_on_shutdown
 
+    @under_cached_property
+    def profile_name(self) -> str:
+        """Return the name used to group the job when profiling."""
+        target: Any = self.target
+        while isinstance(target, functools.partial):
+            target = target.func
+        module = getattr(target, "__module__", None) or type(target).__module__
+        qualname = getattr(target, "__qualname__", None) or type(target).__qualname__
+        return f"{module}.{qualname}"
+
+    @under_cached_property
+    def integration(self) -> str | None:
+        """Return the integration that owns the job target, if any."""
+        module_parts = self.profile_name.split(".", 3)
+        if module_parts[:2] == ["homeassistant", "components"]:
+            return module_parts[2]
+        if module_parts[0] == "custom_components":
+            return module_parts[1]
+        return None
+
     def __repr__(self) -> str:
         """Return the job."""
         return f"<Job {self.name} {self.job_type} {self.target}>"
@@ -375,6 +399,43 @@ class HassJobWithArgs:
     args: Iterable[Any]
 
 
+@dataclass(slots=True)
+class HassJobStats:
+    """Event loop time used by the jobs of a target."""
+
+    integration: str | None
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+class _HassJobProfiler:
+    """Record how much event loop time jobs use, grouped by target."""
+
+    __slots__ = ("stats",)
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.stats: dict[str, HassJobStats] = {}
+
+    def record(self, hassjob: HassJob[..., Any], elapsed: float) -> None:
+        """Record a run of a job."""
+        name = hassjob.profile_name
+        if (stats := self.stats.get(name)) is None:
+            stats = self.stats[name] = HassJobStats(hassjob.integration)
+        stats.calls += 1
+        stats.total_time += elapsed
+        stats.max_time = max(elapsed, stats.max_time)
+
+    def run_callback(self, hassjob: HassJob[..., Any], *args: Any) -> None:
+        """Run a callback job and record how long it took."""
+        start = time.perf_counter()
+        try:
+            hassjob.target(*args)
+        finally:
+            self.record(hassjob, time.perf_counter() - start)
+
+
 def get_hassjob_callable_job_type(target: Callable[..., Any]) -> HassJobType:
     """Determine the job type from the callable."""
     # Check for partials to properly determine if coroutine function
@@ -455,6 +516,7 @@ class HomeAssistant:
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
         self.loop_thread_id = getattr(self.loop, "_thread_id")
+        self._job_profiler: _HassJobProfiler | None = None
 
     def verify_event_loop_thread(self, what: str) -> None:
         """Report and raise if we are not running in the event loop thread."""
@@ -476,6 +538,38 @@ class HomeAssistant:
         """
         return self._tasks
 
+    @callback
+    def async_start_job_profiling(self) -> None:
+        """Start recording the event loop time used by jobs.
+
+        Callback jobs are timed for their whole run, including any
+        jobs they run themselves. Coroutine function jobs are only timed
+        until they first suspend, and executor jobs are not recorded
+        since they do not run in the event loop.
+
+        This method must be run in the event loop.
+        """
+        if self._job_profiler is None:
+            self._job_profiler = _HassJobProfiler()
+
+    @callback
+    def async_stop_job_profiling(self) -> None:
+        """Stop recording the event loop time used by jobs.
+
+        This method must be run in the event loop.
+        """
+        self._job_profiler = None
+
+    @callback
+    def async_get_job_stats(self) -> dict[str, HassJobStats] | None:
+        """Return the recorded job stats or None if profiling is not running.
+
+        This method must be run in the event loop.
+        """
+        if self._job_profiler is None:
+            return None
+        return self._job_profiler.stats
+
     @cached_property
     def is_running(self) -> bool:
         """Return if Home Assistant is running."""
@@ -755,15 +849,25 @@ class HomeAssistant:
         if hassjob.job_type is HassJobType.Coroutinefunction:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., Coroutine[Any, Any, _R]], hassjob)
-            task = create_eager_task(
-                hassjob.target(*args), name=hassjob.name, loop=self.loop
-            )
+            if (profiler := self._job_profiler) is None:
+                task = create_eager_task(
+                    hassjob.target(*args), name=hassjob.name, loop=self.loop
+                )
+            else:
+                start = time.perf_counter()
+                task = create_eager_task(
+                    hassjob.target(*args), name=hassjob.name, loop=self.loop
+                )
+                profiler.record(hassjob, time.perf_counter() - start)
             if task.done():
                 return task
         elif hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            self.loop.call_soon(hassjob.target, *args)
+            if (profiler := self._job_profiler) is None:
+                self.loop.call_soon(hassjob.target, *args)
+            else:
+                self.loop.call_soon(profiler.run_callback, hassjob, *args)
             return None
         else:
             if TYPE_CHECKING:
@@ -937,7 +1041,10 @@ class HomeAssistant:
         if hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            hassjob.target(*args)
+            if self._job_profiler is None:
+                hassjob.target(*args)
+            else:
+                self._job_profiler.run_callback(hassjob, *args)
             return None
 
         return self._async_add_hass_job(hassjob, *args, background=background)
@@ -2022,6 +2129,88 @@ class State:
         )
 
 
+class CompactState(State):
+    """A state that builds its datetimes lazily from float timestamps.
+
+    Used by the state machine in compact mode. Only the timestamps are
+    kept in memory and the last_changed, last_updated and last_reported
+    datetimes are created when they are accessed.
+    """
+
+    __slots__ = ("_last_changed_timestamp", "_last_reported_timestamp")
+
+    def __init__(
+        self,
+        entity_id: str,
+        state: str,
+        attributes: ReadOnlyDict[str, Any],
+        last_changed_timestamp: float,
+        last_updated_timestamp: float,
+        context: Context,
+        validate_entity_id: bool | None,
+        state_info: StateInfo | None,
+    ) -> None:
+        """Initialize a new compact state."""
+        if validate_entity_id and not valid_entity_id(entity_id):
+            raise InvalidEntityFormatError(
+                f"Invalid entity id encountered: {entity_id}. "
+                "Format should be <domain>.<object_id>"
+            )
+
+        validate_state(state)
+
+        self._cache = {}
+        self.entity_id = entity_id
+        self.state = state
+        self.attributes = attributes
+        self.context = context
+        self.state_info = state_info
+        self.domain, self.object_id = split_entity_id(entity_id)
+        self.last_updated_timestamp = last_updated_timestamp
+        self._last_changed_timestamp = last_changed_timestamp
+        self._last_reported_timestamp = last_updated_timestamp
+
+    @property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        return dt_util.utc_from_timestamp(self._last_changed_timestamp)
+
+    @last_changed.setter
+    def last_changed(self, value: datetime.datetime) -> None:
+        """Set the last time the state was changed."""
+        self._last_changed_timestamp = value.timestamp()
+
+    @property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        return dt_util.utc_from_timestamp(self._last_reported_timestamp)
+
+    @last_reported.setter
+    def last_reported(self, value: datetime.datetime) -> None:
+        """Set the last time the state was reported."""
+        self._last_reported_timestamp = value.timestamp()
+
+    @property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        return dt_util.utc_from_timestamp(self.last_updated_timestamp)
+
+    @last_updated.setter
+    def last_updated(self, value: datetime.datetime) -> None:
+        """Set the last time the state or attributes were changed."""
+        self.last_updated_timestamp = value.timestamp()
+
+    @property  # type: ignore[override]
+    def last_changed_timestamp(self) -> float:
+        """Timestamp of last change."""
+        return self._last_changed_timestamp
+
+    @property  # type: ignore[override]
+    def last_reported_timestamp(self) -> float:
+        """Timestamp of last report."""
+        return self._last_reported_timestamp
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -2064,10 +2253,46 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+def _same_attribute_value(value: Any, other: Any) -> bool:
+    """Return if two attribute values are equal and of the same type.
+
+    1, 1.0 and True compare equal but serialize differently.
+    """
+    if value is other:
+        return True
+    if type(value) is not type(other):
+        return False
+    if isinstance(value, tuple):
+        return len(value) == len(other) and all(
+            map(_same_attribute_value, value, other)
+        )
+    if isinstance(value, (frozenset, set)):
+        # The elements can't be paired, only identical sets are the same
+        return False
+    return bool(value == other)
+
+
+def _same_attributes(attributes: Mapping[str, Any], other: Mapping[str, Any]) -> bool:
+    """Return if two attribute mappings have the same items in the same order."""
+    return len(attributes) == len(other) and all(
+        key == other_key and _same_attribute_value(value, other_value)
+        for (key, value), (other_key, other_value) in zip(
+            attributes.items(), other.items(), strict=False
+        )
+    )
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_attributes_cache",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2078,6 +2303,53 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Interned attributes keyed by their hash, only used in compact mode
+        self._attributes_cache: LRU[int, ReadOnlyDict[str, Any]] | None = None
+
+    @callback
+    def async_set_compact(self, compact: bool) -> None:
+        """Enable or disable compact storage of states.
+
+        In compact mode, new states are stored as CompactState objects that
+        only keep float timestamps, and identical attribute dicts are
+        interned so states that share the same attributes also share the
+        same ReadOnlyDict. States already in the state machine are not
+        converted.
+
+        This method must be run in the event loop.
+        """
+        if compact is (self._attributes_cache is not None):
+            return
+        self._attributes_cache = (
+            LRU(_COMPACT_ATTRIBUTES_CACHE_SIZE) if compact else None
+        )
+
+    @callback
+    def _async_intern_attributes(
+        self,
+        attributes_cache: LRU[int, ReadOnlyDict[str, Any]],
+        attributes: Mapping[str, Any],
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a shared ReadOnlyDict for the attributes.
+
+        Only the hash is kept as the key so the cache does not hold
+        a copy of the attributes, a hit is confirmed by comparing them.
+        The cache is kept small since attributes that are shared between
+        entities are written around the same time.
+        """
+        try:
+            key = hash(tuple((k, type(v), v) for k, v in attributes.items()))
+        except TypeError:
+            # Attributes contain unhashable values (lists, dicts)
+            # and cannot be interned
+            return ReadOnlyDict(attributes)
+        if (interned := attributes_cache.get(key)) is not None and (
+            _same_attributes(interned, attributes)
+        ):
+            return interned
+        interned = ReadOnlyDict(attributes)
+        attributes_cache[key] = interned
+        return interned
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2293,9 +2565,12 @@ class StateMachine:
         context: Context | None,
         state_info: StateInfo | None,
         timestamp: float,
+        now: datetime.datetime | None = None,
     ) -> None:
         """Set the state of an entity, add entity if it does not exist.
 
+        now is the timestamp as a UTC datetime if the caller already has it.
+
         This method is intended to only be used by core internally
         and should not be considered a stable API. We will make
         breaking changes to this function in the future and it
@@ -2331,7 +2606,8 @@ class StateMachine:
         # timestamp implementation:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
+        if now is None:
+            now = dt_util.utc_from_timestamp(timestamp)
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
@@ -2339,8 +2615,11 @@ class StateMachine:
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            if type(old_state) is CompactState:
+                old_state._last_reported_timestamp = timestamp  # noqa: SLF001
+            else:
+                old_state.last_reported = now  # type: ignore[union-attr]
+                old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
@@ -2359,20 +2638,39 @@ class StateMachine:
                 assert old_state is not None
             attributes = old_state.attributes
 
-        # This is intentionally called with positional only arguments for performance
-        # reasons
-        state = State(
-            entity_id,
-            new_state,
-            attributes,
-            last_changed,
-            now,
-            now,
-            context,
-            old_state is None,
-            state_info,
-            timestamp,
-        )
+        state: State
+        if (attributes_cache := self._attributes_cache) is None:
+            # This is intentionally called with positional only arguments for
+            # performance reasons
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                now,
+                now,
+                context,
+                old_state is None,
+                state_info,
+                timestamp,
+            )
+        else:
+            if not same_attr:
+                attributes = self._async_intern_attributes(
+                    attributes_cache, attributes or {}
+                )
+            state = CompactState(
+                entity_id,
+                new_state,
+                attributes,  # type: ignore[arg-type]
+                old_state.last_changed_timestamp  # type: ignore[union-attr]
+                if same_state
+                else timestamp,
+                timestamp,
+                context,
+                old_state is None,
+                state_info,
+            )
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
@@ -2388,6 +2686,41 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities.
+
+        States is an iterable of (entity_id, new_state, attributes) tuples.
+        All states share the same timestamp and are written in order, so an
+        entity that appears more than once ends up with its last state. The
+        state event of each write is fired right after the write, so
+        listeners always see the state machine match the event.
+
+        If context is not passed, each write gets its own context as it
+        would with async_set.
+
+        This method must be run in the event loop.
+        """
+        timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        set_internal = self.async_set_internal
+        for entity_id, new_state, attributes in states:
+            set_internal(
+                entity_id.lower(),
+                str(new_state),
+                attributes or {},
+                force_update,
+                context,
+                None,
+                timestamp,
+                now,
+            )
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -83,6 +83,7 @@ _LOGGER = logging.getLogger(__name__)
 
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
 
+CONF_COMPACT_STATES: Final = "compact_states"
 CONF_CREDENTIAL: Final = "credential"
 CONF_ICE_SERVERS: Final = "ice_servers"
 CONF_WEBRTC: Final = "webrtc"
@@ -324,6 +325,7 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_COMPACT_STATES): cv.boolean,
             vol.Optional(CONF_WEBRTC): vol.Schema(
                 {
                     vol.Required(CONF_ICE_SERVERS): vol.All(
@@ -416,6 +418,8 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if config.get(CONF_DEBUG):
         hac.debug = True
 
+    hass.states.async_set_compact(config.get(CONF_COMPACT_STATES, False))
+
     if CONF_WEBRTC in config:
         hac.webrtc.ice_servers = [
             RTCIceServer(
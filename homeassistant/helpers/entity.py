@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABCMeta
 import asyncio
-from collections import deque
+from collections import defaultdict, deque
 from collections.abc import Callable, Coroutine, Iterable, Mapping
 import dataclasses
 from enum import Enum, auto
@@ -75,6 +75,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_ENTITY_SOURCE_DOMAINS = "entity_info_domains"
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -100,6 +101,55 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@callback
+@singleton.singleton(DATA_ENTITY_SOURCE_DOMAINS)
+def _entity_source_domains(
+    hass: HomeAssistant,
+) -> defaultdict[str, dict[str, Literal[True]]]:
+    """Get the entity ids of the entity sources by domain."""
+    return defaultdict(dict)
+
+
+@callback
+def async_get_source_entity_ids(hass: HomeAssistant, domain: str) -> list[str]:
+    """Return the entity ids of the entities of an integration.
+
+    The entity ids are indexed when entities are added to and removed
+    from hass.
+    """
+    return list(_entity_source_domains(hass).get(domain, ()))
+
+
+@callback
+def _async_add_entity_source(
+    hass: HomeAssistant, entity_id: str, entity_info: EntityInfo
+) -> None:
+    """Add the entity info of an entity to the entity sources."""
+    sources = entity_sources(hass)
+    if (old_info := sources.get(entity_id)) is not None:
+        _async_unindex_entity_source(hass, entity_id, old_info)
+    sources[entity_id] = entity_info
+    _entity_source_domains(hass)[entity_info["domain"]][entity_id] = True
+
+
+@callback
+def _async_remove_entity_source(hass: HomeAssistant, entity_id: str) -> None:
+    """Remove the entity info of an entity from the entity sources."""
+    _async_unindex_entity_source(hass, entity_id, entity_sources(hass).pop(entity_id))
+
+
+@callback
+def _async_unindex_entity_source(
+    hass: HomeAssistant, entity_id: str, entity_info: EntityInfo
+) -> None:
+    """Remove an entity from the entity ids by domain."""
+    domains = _entity_source_domains(hass)
+    entity_ids = domains[entity_info["domain"]]
+    entity_ids.pop(entity_id, None)
+    if not entity_ids:
+        del domains[entity_info["domain"]]
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -1472,7 +1522,7 @@ class Entity(
         if self.platform.config_entry:
             entity_info["config_entry"] = self.platform.config_entry.entry_id
 
-        entity_sources(self.hass)[self.entity_id] = entity_info
+        _async_add_entity_source(self.hass, self.entity_id, entity_info)
 
         self._state_info = {
             "unrecorded_attributes": self.__combined_unrecorded_attributes
@@ -1502,7 +1552,7 @@ class Entity(
         # The check for self.platform guards against integrations not using an
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
-            del entity_sources(self.hass)[self.entity_id]
+            _async_remove_entity_source(self.hass, self.entity_id)
 
     @callback
     def _async_registry_updated(
@@ -55,6 +55,7 @@ from .entity_registry import (
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
+from .template_profiler import DATA_TEMPLATE_PROFILER
 from .typing import TemplateVarsType
 
 _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
@@ -75,6 +76,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_SHARED_TEMPLATE_RENDERS_DATA: HassKey[_SharedTemplateRenders] = HassKey(
+    "shared_template_renders"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -972,6 +976,99 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+@dataclass(slots=True)
+class SharedTemplateRenderStats:
+    """Renders of tracked templates shared between trackers."""
+
+    renders: int = 0
+    shared: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """Return the share of the renders which were not rendered again."""
+        if total := self.renders + self.shared:
+            return self.shared / total
+        return 0.0
+
+
+class _SharedTemplateRenders:
+    """Share the renders of identical templates for a state change.
+
+    Trackers of templates with the same shared render key render the
+    same result for the same state change. The first tracker renders
+    and the others reuse the render as long as the states it read did
+    not change since, which the actions of the trackers can do.
+    Templates iterating over all states or domains or using the time are
+    not shared.
+    Template warnings of a shared render are only logged once.
+    """
+
+    __slots__ = ("_event", "_renders", "_states", "stats")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared renders."""
+        self._states = hass.states
+        self._event: Event[EventStateChangedData] | None = None
+        self._renders: dict[
+            tuple[str, bool | None, bool | None],
+            tuple[RenderInfo, list[tuple[str, State | None]]],
+        ] = {}
+        self.stats = SharedTemplateRenderStats()
+
+    @callback
+    def async_render_to_info(
+        self, track_template_: TrackTemplate, event: Event[EventStateChangedData]
+    ) -> RenderInfo:
+        """Render a template or reuse the render of the same template."""
+        template = track_template_.template
+        variables = track_template_.variables
+        if (key := template.shared_render_key(variables)) is None:
+            return template.async_render_to_info(variables)
+        if event is not self._event:
+            self._event = event
+            self._renders.clear()
+        states = self._states
+        if (shared := self._renders.get(key)) is not None:
+            shared_info, read_states = shared
+            if all(states.get(entity_id) is state for entity_id, state in read_states):
+                self.stats.shared += 1
+                info = copy.copy(shared_info)
+                info.template = template
+                return info
+        info = template.async_render_to_info(variables)
+        self.stats.renders += 1
+        if not (
+            info.all_states
+            or info.all_states_lifecycle
+            or info.domains
+            or info.domains_lifecycle
+            or info.has_time
+        ):
+            self._renders[key] = (
+                info,
+                [(entity_id, states.get(entity_id)) for entity_id in info.entities],
+            )
+        return info
+
+
+@callback
+def _async_get_shared_template_renders(hass: HomeAssistant) -> _SharedTemplateRenders:
+    """Return the shared renders of tracked templates."""
+    if (shared_renders := hass.data.get(_SHARED_TEMPLATE_RENDERS_DATA)) is None:
+        shared_renders = hass.data[_SHARED_TEMPLATE_RENDERS_DATA] = (
+            _SharedTemplateRenders(hass)
+        )
+    return shared_renders
+
+
+@callback
+def async_get_shared_template_render_stats(
+    hass: HomeAssistant,
+) -> SharedTemplateRenderStats:
+    """Return how many renders of tracked templates were shared."""
+    return _async_get_shared_template_renders(hass).stats
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -1131,6 +1228,7 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        replayed: bool | None = False,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1170,9 +1268,20 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if (profiler := self.hass.data.get(DATA_TEMPLATE_PROFILER)) is not None:
+            profiler.record_trigger(
+                template.template, event.data["entity_id"] if event else None
+            )
+        if event is None or replayed:
+            # A rate limited event is replayed later when the render of
+            # the event may be stale
+            info = template.async_render_to_info(track_template_.variables)
+        else:
+            # Trackers of the same template share the render of a state change
+            info = _async_get_shared_template_renders(self.hass).async_render_to_info(
+                track_template_, event
+            )
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1246,7 +1355,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, replayed
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1277,7 +1388,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, replayed
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1969,11 +2082,16 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
+        if new_state is not None and old_state is not None:
+            # Only re-render when a field the template read changed
+            return info.fields_changed(entity_id, old_state, new_state)
         return True
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
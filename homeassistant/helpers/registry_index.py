@@ -0,0 +1,152 @@
+"""Reverse indexes which combine the registries.
+
+The registries index their entries by the ids the entries hold
+themselves, like the area, labels and config entry of an entity or
+the floor of an area. The indexes here also depend on the entries of
+other registries, they are built on first use and kept up to date
+from the registry updated events.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import device_registry as dr, entity_registry as er
+
+DATA_AREA_ENTITIES_INDEX: HassKey[AreaEntitiesIndex] = HassKey("area_entities_index")
+
+# The changes of entities and devices which can change the area of an entity
+_ENTITY_AREA_CHANGES = {"area_id", "device_id", "disabled_by"}
+
+
+class AreaEntitiesIndex:
+    """Index the entities in an area.
+
+    Entities are in the area they are assigned to. Enabled entities
+    which are not assigned to an area are in the area of their device.
+    The entities assigned to an area come before the entities which
+    inherit the area of their device.
+    """
+
+    __slots__ = (
+        "_assigned_entities",
+        "_device_registry",
+        "_entity_areas",
+        "_inherited_entities",
+        "_registry",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._registry = er.async_get(hass)
+        self._device_registry = dr.async_get(hass)
+        self._assigned_entities: dict[str, dict[str, Literal[True]]] = {}
+        self._inherited_entities: dict[str, dict[str, Literal[True]]] = {}
+        self._entity_areas: dict[str, tuple[str, bool]] = {}
+        for entity_id in self._registry.entities:
+            self._index_entity(entity_id)
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+        )
+
+    def _entity_area(self, entity_id: str) -> tuple[str, bool] | None:
+        """Return the area of an entity and if it is inherited from its device."""
+        if (entry := self._registry.async_get(entity_id)) is None:
+            return None
+        if entry.area_id is not None:
+            return (entry.area_id, False)
+        if (
+            entry.device_id is None
+            or entry.disabled_by is not None
+            or (device := self._device_registry.async_get(entry.device_id)) is None
+        ):
+            return None
+        if device.area_id is None:
+            return None
+        return (device.area_id, True)
+
+    def _area_index(self, inherited: bool) -> dict[str, dict[str, Literal[True]]]:
+        """Return the index of the assigned or the inherited entities."""
+        return self._inherited_entities if inherited else self._assigned_entities
+
+    def _unindex_entity(self, entity_id: str) -> None:
+        """Remove an entity from the index."""
+        if (entity_area := self._entity_areas.pop(entity_id, None)) is None:
+            return
+        area_id, inherited = entity_area
+        area_index = self._area_index(inherited)
+        entity_ids = area_index[area_id]
+        del entity_ids[entity_id]
+        if not entity_ids:
+            del area_index[area_id]
+
+    def _index_entity(self, entity_id: str) -> None:
+        """Add an entity to the index."""
+        if (entity_area := self._entity_area(entity_id)) is None:
+            return
+        self._entity_areas[entity_id] = entity_area
+        area_id, inherited = entity_area
+        self._area_index(inherited).setdefault(area_id, {})[entity_id] = True
+
+    def _reindex_entity(self, entity_id: str) -> None:
+        """Update the area of an entity."""
+        if self._entity_areas.get(entity_id) == self._entity_area(entity_id):
+            return
+        self._unindex_entity(entity_id)
+        self._index_entity(entity_id)
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Update the index when an entity is created, updated or removed."""
+        data = event.data
+        if data["action"] != "update":
+            self._reindex_entity(data["entity_id"])
+            return
+        if old_entity_id := data.get("old_entity_id"):
+            self._unindex_entity(old_entity_id)
+            self._index_entity(data["entity_id"])
+        elif not _ENTITY_AREA_CHANGES.isdisjoint(data["changes"]):
+            self._reindex_entity(data["entity_id"])
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Update the entities of a device when the area of the device changes."""
+        data = event.data
+        if data["action"] == "create" or (
+            data["action"] == "update" and "area_id" not in data["changes"]
+        ):
+            return
+        for entry in self._registry.entities.get_entries_for_device_id(
+            data["device_id"], include_disabled_entities=True
+        ):
+            self._reindex_entity(entry.entity_id)
+
+    @callback
+    def async_get_entity_ids(self, area_id: str) -> list[str]:
+        """Return the entity ids of the entities in an area.
+
+        The entities assigned to the area come first, followed by the
+        entities which inherit the area of their device.
+        """
+        return [
+            *self._assigned_entities.get(area_id, ()),
+            *self._inherited_entities.get(area_id, ()),
+        ]
+
+
+@callback
+def async_get_area_entities_index(hass: HomeAssistant) -> AreaEntitiesIndex:
+    """Return the index of the entities in the areas."""
+    if (index := hass.data.get(DATA_AREA_ENTITIES_INDEX)) is None:
+        index = hass.data[DATA_AREA_ENTITIES_INDEX] = AreaEntitiesIndex(hass)
+    return index
@@ -12,6 +12,7 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+from itertools import chain
 import json
 import logging
 import math
@@ -38,7 +39,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import meta, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -93,7 +94,10 @@ from . import (
     location as loc_helper,
 )
 from .deprecation import deprecated_function
+from .registry_index import async_get_area_entities_index
 from .singleton import singleton
+from .template_bytecode import DATA_TEMPLATE_BYTECODE
+from .template_profiler import DATA_TEMPLATE_PROFILER
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -353,6 +357,12 @@ def _false(arg: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _template_variables(template: str) -> frozenset[str]:
+    """Return the names a template reads which it does not define."""
+    return frozenset(meta.find_undeclared_variables(_NO_HASS_ENV.parse(template)))
+
+
 @lru_cache(maxsize=EVAL_CACHE_SIZE)
 def _cached_parse_result(render_result: str) -> Any:
     """Parse a result and cache the result."""
@@ -397,6 +407,9 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_states",
+        "entity_attributes",
+        "entity_fields",
         "rate_limit",
         "has_time",
     )
@@ -415,6 +428,13 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which only the state or some attributes were read,
+        # the entities of which the whole state was read are in entities
+        self.entity_states: set[str] = set()
+        self.entity_attributes: dict[str, set[str]] = {}
+        # Will be set once frozen, maps the entities of which only
+        # some fields were read to the fields, see fields_changed
+        self.entity_fields: dict[str, tuple[bool, frozenset[str]]] = {}
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -457,6 +477,27 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def fields_changed(
+        self, entity_id: str, old_state: State, new_state: State
+    ) -> bool:
+        """Return if a state change changed a field the template read.
+
+        Always True for entities of which the whole state was read.
+        """
+        if (fields := self.entity_fields.get(entity_id)) is None:
+            return True
+        read_state, attributes = fields
+        if read_state and old_state.state != new_state.state:
+            return True
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        if old_attributes is new_attributes:
+            return False
+        return any(
+            old_attributes.get(attribute) != new_attributes.get(attribute)
+            for attribute in attributes
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -469,11 +510,33 @@ class RenderInfo:
         self.all_states = False
 
     def _freeze_sets(self) -> None:
-        self.entities = frozenset(self.entities)
+        self.entities = frozenset(
+            chain(self.entities, self.entity_states, self.entity_attributes)
+        )
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
+    def _freeze_entity_fields(self, entities: collections.abc.Set[str]) -> None:
+        """Keep the fields of the entities of which only some fields were read.
+
+        The whole state of the entities of a domain
+        which is iterated over may have been read.
+        """
+        entity_states = self.entity_states
+        entity_attributes = self.entity_attributes
+        domains = self.domains
+        self.entity_fields = {
+            entity_id: (
+                entity_id in entity_states,
+                frozenset(entity_attributes.get(entity_id, ())),
+            )
+            for entity_id in entity_states.union(entity_attributes)
+            if entity_id not in entities
+            and split_entity_id(entity_id)[0] not in domains
+        }
+
     def _freeze(self) -> None:
+        entities = self.entities
         self._freeze_sets()
 
         if self.rate_limit is None:
@@ -494,6 +557,8 @@ class RenderInfo:
         if self.all_states:
             return
 
+        self._freeze_entity_fields(entities)
+
         if self.domains:
             self.filter = self._filter_domains_and_entities
         elif self.entities:
@@ -640,7 +705,15 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (
+                self.hass is None
+                or (profiler := self.hass.data.get(DATA_TEMPLATE_PROFILER)) is None
+            ):
+                render_result = _render_with_context(self.template, compiled, **kwargs)
+            else:
+                render_result = profiler.run_render(
+                    _render_with_context, self.template, compiled, kwargs
+                )
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -656,6 +729,22 @@ class Template:
 
         return self._parse_result(render_result)
 
+    def shared_render_key(
+        self, variables: TemplateVarsType
+    ) -> tuple[str, bool | None, bool | None] | None:
+        """Return a key which is the same for templates rendering the same.
+
+        Compiled templates with the same source and compiled in the same
+        environment render to the same result for the same states, unless
+        they read any of their variables. Returns None for templates which
+        read their variables or are not compiled yet.
+        """
+        if self._compiled is None:
+            return None
+        if variables and not _template_variables(self.template).isdisjoint(variables):
+            return None
+        return (self.template, self._limited, self._strict)
+
     def _parse_result(self, render_result: str) -> Any:
         """Parse the result."""
         try:
@@ -790,10 +879,13 @@ class Template:
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
         parse_result: bool = False,
+        parse_json: bool = True,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. Callers that already
+        parsed the value can pass value_json in variables and set
+        parse_json to False.
 
         This method must be run in the event loop.
         """
@@ -807,15 +899,24 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
-            pass
+        if parse_json:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
 
         try:
-            render_result = _render_with_context(
-                self.template, compiled, **variables
-            ).strip()
+            if (
+                self.hass is None
+                or (profiler := self.hass.data.get(DATA_TEMPLATE_PROFILER)) is None
+            ):
+                render_result = _render_with_context(
+                    self.template, compiled, **variables
+                ).strip()
+            else:
+                render_result = profiler.run_render(
+                    _render_with_context, self.template, compiled, variables
+                ).strip()
         except jinja2.TemplateError as ex:
             if error_value is _SENTINEL:
                 _LOGGER.error(
@@ -1055,6 +1156,10 @@ class TemplateStateBase(State):
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_state_only(self) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entity_states.add(self._entity_id)
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
@@ -1062,7 +1167,10 @@ class TemplateStateBase(State):
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item == "state":
+                    render_info.entity_states.add(self._entity_id)
+                else:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1081,7 +1189,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_only()
         return self._state.state
 
     @property
@@ -1376,13 +1484,9 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
 
     # fallback to just returning all entities for a domain
     # pylint: disable-next=import-outside-toplevel
-    from .entity import entity_sources
+    from .entity import async_get_source_entity_ids
 
-    return [
-        entity_id
-        for entity_id, info in entity_sources(hass).items()
-        if info["domain"] == entry_name
-    ]
+    return async_get_source_entity_ids(hass, entry_name)
 
 
 def config_entry_id(hass: HomeAssistant, entity_id: str) -> str | None:
@@ -1614,23 +1718,9 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
         _area_id = area_id_or_name
     if _area_id is None:
         return []
-    ent_reg = entity_registry.async_get(hass)
-    entity_ids = [
-        entry.entity_id
-        for entry in entity_registry.async_entries_for_area(ent_reg, _area_id)
-    ]
-    dev_reg = device_registry.async_get(hass)
-    # We also need to add entities tied to a device in the area that don't themselves
-    # have an area specified since they inherit the area from the device.
-    entity_ids.extend(
-        [
-            entity.entity_id
-            for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
-            if entity.area_id is None
-        ]
-    )
-    return entity_ids
+    # Entities tied to a device in the area that don't themselves have
+    # an area specified inherit the area from the device.
+    return async_get_area_entities_index(hass).async_get_entity_ids(_area_id)
 
 
 def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
@@ -1885,7 +1975,12 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
-    if (state_obj := _get_state(hass, entity_id)) is not None:
+    state_obj = hass.states.get(entity_id)
+    if (render_info := _render_info.get()) is not None:
+        if state_obj is not None:
+            entity_id = state_obj.entity_id
+        render_info.entity_attributes.setdefault(entity_id, set()).add(name)
+    if state_obj is not None:
         return state_obj.attributes.get(name)
     return None
 
@@ -2864,6 +2959,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # The code a template compiles to depends on the filters
+        # and globals of the environment, which depend on its flavor
+        self.flavor = "limited" if limited else "strict" if strict else "normal"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3219,7 +3317,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(DATA_TEMPLATE_BYTECODE))
+        ):
+            compiled = bytecode_cache.get(self.flavor, source)
+            if compiled is None:
+                compiled = super().compile(source)
+                bytecode_cache.set(self.flavor, source, compiled)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
@@ -0,0 +1,134 @@
+"""Keep the compiled code of templates across restarts.
+
+Compiling a template with Jinja is much slower than loading the code
+object it compiles to. The code objects are saved under .storage and
+loaded at startup, keyed by the hash of the template source and the
+flavor of the environment it was compiled in.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from importlib.util import MAGIC_NUMBER
+import logging
+import marshal
+import os
+from types import CodeType
+from typing import Any
+
+import jinja2
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.file import write_utf8_file
+from homeassistant.util.hass_dict import HassKey
+
+from .storage import STORAGE_DIR
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TEMPLATE_BYTECODE: HassKey[TemplateBytecodeCache] = HassKey("template_bytecode")
+
+STORAGE_KEY = "core.template_bytecode"
+STORAGE_VERSION = 1
+
+# The least recently used code objects are evicted above this size
+MAX_BYTECODE_SIZE = 8 * 1024**2
+
+# Code objects can only be loaded by the Python version that
+# marshaled them and depend on the Jinja version that generated them
+_BYTECODE_HEADER = f"{STORAGE_VERSION}:{MAGIC_NUMBER.hex()}:{jinja2.__version__}"
+
+
+async def async_load(hass: HomeAssistant) -> None:
+    """Load the compiled code of the templates of the last run."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await hass.async_add_executor_job(bytecode_cache.load)
+    hass.data[DATA_TEMPLATE_BYTECODE] = bytecode_cache
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, bytecode_cache.async_save)
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_FINAL_WRITE, bytecode_cache.async_save
+    )
+
+
+class TemplateBytecodeCache:
+    """Cache the code objects of templates in a file.
+
+    The code objects are kept marshaled in memory, least recently used
+    first, and are only unmarshaled when a template is compiled.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, STORAGE_KEY)
+        self._bytecode: dict[str, bytes] = {}
+        self._size = 0
+        self._unsaved = False
+
+    @staticmethod
+    def _key(flavor: str, source: str) -> str:
+        """Return the key of the code object of a template."""
+        return f"{flavor}:{hashlib.sha256(source.encode()).hexdigest()}"
+
+    def get(self, flavor: str, source: str) -> CodeType | None:
+        """Return the code object of a template if it has been compiled before."""
+        key = self._key(flavor, source)
+        if (bytecode := self._bytecode.pop(key, None)) is None:
+            return None
+        try:
+            code = marshal.loads(bytecode)
+        except (EOFError, TypeError, ValueError):
+            self._size -= len(bytecode)
+            return None
+        self._bytecode[key] = bytecode
+        return code  # type: ignore[no-any-return]
+
+    def set(self, flavor: str, source: str, code: CodeType) -> None:
+        """Add the code object of a compiled template."""
+        key = self._key(flavor, source)
+        bytecode = marshal.dumps(code)
+        if (old_bytecode := self._bytecode.pop(key, None)) is not None:
+            self._size -= len(old_bytecode)
+        self._bytecode[key] = bytecode
+        self._size += len(bytecode)
+        while self._size > MAX_BYTECODE_SIZE:
+            self._size -= len(self._bytecode.pop(next(iter(self._bytecode))))
+        self._unsaved = True
+
+    def load(self) -> None:
+        """Load the code objects saved by the last run."""
+        try:
+            with open(self.path, "rb") as fp:
+                header, bytecode = marshal.load(fp)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, TypeError, ValueError) as err:
+            _LOGGER.warning("Could not load the template bytecode cache: %s", err)
+            return
+        if header != _BYTECODE_HEADER or not isinstance(bytecode, dict):
+            _LOGGER.debug("Discarding the template bytecode cache of another version")
+            return
+        self._bytecode = bytecode
+        self._size = sum(len(code) for code in bytecode.values())
+
+    @callback
+    def async_save(self, _event: Event | None = None) -> None:
+        """Save the code objects if templates were compiled since the last save."""
+        if not self._unsaved:
+            return
+        self._unsaved = False
+        self.hass.async_add_executor_job(self._save, dict(self._bytecode))
+
+    def _save(self, bytecode: dict[str, bytes]) -> None:
+        """Save the code objects."""
+        data: Any = (_BYTECODE_HEADER, bytecode)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, marshal.dumps(data), True, "wb")
+        except (HomeAssistantError, OSError) as err:
+            _LOGGER.error("Could not save the template bytecode cache: %s", err)
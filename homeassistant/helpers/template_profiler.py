@@ -0,0 +1,129 @@
+"""Record how much event loop time templates use to render.
+
+Renders are grouped by the source of the template, the templates
+of entities and automations which share their source are counted
+together and the stats keep all of their owners.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .trace import trace_id_get
+
+DATA_TEMPLATE_PROFILER: HassKey[TemplateProfiler] = HassKey("template_profiler")
+
+# Template re-renders not caused by a state change, for
+# example of templates using now() or forced refreshes
+TRIGGER_REFRESH = "refresh"
+
+
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Event loop time used by the renders of a template."""
+
+    owners: set[str] = field(default_factory=set)
+    renders: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    # The entities whose state changes caused tracked templates to re-render
+    triggers: dict[str, int] = field(default_factory=dict)
+
+
+def _render_owner(variables: Mapping[str, Any]) -> str | None:
+    """Return the entity or automation a template is rendered for."""
+    if (this := variables.get("this")) is not None:
+        if isinstance(this, Mapping):
+            entity_id = this.get("entity_id")
+        else:
+            entity_id = getattr(this, "entity_id", None)
+        if isinstance(entity_id, str):
+            return entity_id
+    if (trace_id := trace_id_get()) is not None:
+        return trace_id[0]
+    return None
+
+
+class TemplateProfiler:
+    """Record the renders of templates, grouped by their source."""
+
+    __slots__ = ("stats",)
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.stats: dict[str, TemplateRenderStats] = {}
+
+    def _get_stats(self, template: str) -> TemplateRenderStats:
+        """Return the stats of a template."""
+        if (stats := self.stats.get(template)) is None:
+            stats = self.stats[template] = TemplateRenderStats()
+        return stats
+
+    def record_render(
+        self, template: str, variables: Mapping[str, Any], elapsed: float
+    ) -> None:
+        """Record a render of a template."""
+        stats = self._get_stats(template)
+        stats.renders += 1
+        stats.total_time += elapsed
+        stats.max_time = max(elapsed, stats.max_time)
+        if (owner := _render_owner(variables)) is not None:
+            stats.owners.add(owner)
+
+    def record_trigger(self, template: str, entity_id: str | None) -> None:
+        """Record what caused a tracked template to re-render."""
+        triggers = self._get_stats(template).triggers
+        trigger = entity_id or TRIGGER_REFRESH
+        triggers[trigger] = triggers.get(trigger, 0) + 1
+
+    def run_render(
+        self,
+        render: Callable[..., str],
+        template: str,
+        compiled: Any,
+        variables: dict[str, Any],
+    ) -> str:
+        """Render a template and record how long it took."""
+        start = time.perf_counter()
+        try:
+            return render(template, compiled, **variables)
+        finally:
+            self.record_render(template, variables, time.perf_counter() - start)
+
+
+@callback
+def async_start_template_profiling(hass: HomeAssistant) -> None:
+    """Start recording the event loop time used by template renders.
+
+    This method must be run in the event loop.
+    """
+    if DATA_TEMPLATE_PROFILER not in hass.data:
+        hass.data[DATA_TEMPLATE_PROFILER] = TemplateProfiler()
+
+
+@callback
+def async_stop_template_profiling(hass: HomeAssistant) -> None:
+    """Stop recording the event loop time used by template renders.
+
+    This method must be run in the event loop.
+    """
+    hass.data.pop(DATA_TEMPLATE_PROFILER, None)
+
+
+@callback
+def async_get_template_stats(
+    hass: HomeAssistant,
+) -> dict[str, TemplateRenderStats] | None:
+    """Return the recorded template stats or None if profiling is not running.
+
+    This method must be run in the event loop.
+    """
+    if (profiler := hass.data.get(DATA_TEMPLATE_PROFILER)) is None:
+        return None
+    return profiler.stats
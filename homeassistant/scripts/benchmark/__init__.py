@@ -4,10 +4,16 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import gc
 import logging
+import os
+import time
 from timeit import default_timer as timer
+import tracemalloc
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -223,6 +229,950 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_entity_listeners(hass):
+    """Fire 100k state changes while unrelated entity subscriptions grow.
+
+    The dispatch time should stay flat as the number of state change
+    trackers for other entities grows since they are keyed by entity_id.
+    """
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**5
+    subscribed = 0
+    total = 0.0
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    async_track_state_change_event(hass, entity_id, listener)
+
+    event_data = {
+        "entity_id": entity_id,
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    for unrelated in (0, 1000, 10000):
+        for idx in range(subscribed, unrelated):
+            async_track_state_change_event(hass, f"sensor.unrelated_{idx}", listener)
+        subscribed = unrelated
+        count = 0
+
+        start = timer()
+        for _ in range(events_to_fire):
+            hass.bus.async_fire_internal(EVENT_STATE_CHANGED, event_data)
+        await hass.async_block_till_done()
+        runtime = timer() - start
+
+        assert count == events_to_fire
+        print(f"{unrelated} unrelated entity trackers: {runtime}s")
+        total += runtime
+
+    return total
+
+
+@benchmark
+async def set_many_states(hass):
+    """Write 400 bursts of 1000 states with async_set_many and async_set.
+
+    The bursts of both alternate and the median burst of each is reported.
+    """
+    count = 0
+    entities = 1000
+    bursts = 400
+    attributes = {"unit_of_measurement": "W"}
+    loop_entity_ids = [f"sensor.loop_{idx}" for idx in range(entities)]
+    many_entity_ids = [f"sensor.many_{idx}" for idx in range(entities)]
+    loop_runtimes = []
+    runtimes = []
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+
+    for burst in range(bursts):
+        state = str(burst)
+        start = timer()
+        for entity_id in loop_entity_ids:
+            hass.states.async_set(entity_id, state, attributes)
+        loop_runtimes.append(timer() - start)
+
+        start = timer()
+        hass.states.async_set_many(
+            [(entity_id, state, attributes) for entity_id in many_entity_ids]
+        )
+        runtimes.append(timer() - start)
+    await hass.async_block_till_done()
+
+    assert count == 2 * entities * bursts
+    loop_runtimes.sort()
+    runtimes.sort()
+    print(
+        f"median burst: async_set loop: {loop_runtimes[bursts // 2]}s, "
+        f"async_set_many: {runtimes[bursts // 2]}s"
+    )
+    return sum(runtimes)
+
+
+@benchmark
+async def compact_states_memory(hass):
+    """Measure the memory held per entity with and without compact states.
+
+    Half of the entities have unique attributes and the other half
+    share the same attributes.
+    """
+    entities = 10000
+    start = timer()
+
+    async def _measure(prefix):
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for update in range(3):
+            for idx in range(0, entities, 2):
+                hass.states.async_set(
+                    f"sensor.{prefix}_{idx}",
+                    str(update),
+                    {
+                        "friendly_name": f"Power {idx}",
+                        "unit_of_measurement": "W",
+                        "device_class": "power",
+                        "state_class": "measurement",
+                    },
+                )
+                hass.states.async_set(
+                    f"binary_sensor.{prefix}_{idx}",
+                    "on" if update % 2 else "off",
+                    {"device_class": "motion", "icon": "mdi:motion-sensor"},
+                )
+            await hass.async_block_till_done()
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        return used / entities
+
+    per_entity = await _measure("regular")
+    hass.states.async_set_compact(True)
+    compact_per_entity = await _measure("compact")
+    print(
+        f"Bytes per entity: {per_entity:.0f} regular, {compact_per_entity:.0f} compact"
+    )
+    return timer() - start
+
+
+@benchmark
+async def subscribe_entities_fanout(hass):
+    """Measure CPU time per state change as subscribe_entities connections grow.
+
+    Every connection subscribes with the same message id like the frontend
+    does, so the frame is built once and the same bytes are enqueued.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.commands import (
+        async_get_entity_changes_fanout,
+    )
+
+    entity_id = "sensor.power"
+    events_to_fire = 10**4
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True)
+    fanout = async_get_entity_changes_fanout(hass)
+    queues = []
+    total = 0.0
+
+    for connections in (1, 10, 40, 100):
+        while len(queues) < connections:
+            queue = deque()
+            queues.append(queue)
+            fanout.async_subscribe(queue.append, None, None, user, b"3")
+
+        start = time.process_time()
+        for idx in range(events_to_fire):
+            hass.states.async_set(entity_id, str(idx), {"unit_of_measurement": "W"})
+        await hass.async_block_till_done()
+        runtime = time.process_time() - start
+
+        for queue in queues:
+            assert len(queue) == events_to_fire
+            queue.clear()
+        print(
+            f"{connections} connections: "
+            f"{runtime / events_to_fire * 10**6:.2f}µs CPU per event"
+        )
+        total += runtime
+
+    return total
+
+
+@benchmark
+async def mqtt_wildcard_matching(hass):
+    """Match 50k distinct topics against 5k wildcard subscriptions.
+
+    The shared subscription trie is compared with testing a matcher
+    per subscription on a sample of the topics.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    job = core.HassJob(core.callback(lambda msg: None))
+    filters = [
+        *(f"zigbee2mqtt/device_{idx}/+" for idx in range(2000)),
+        *(f"tele/tasmota_{idx}/#" for idx in range(2000)),
+        *(f"frigate/camera_{idx}/+/snapshot" for idx in range(1000)),
+    ]
+    topics = [
+        *(f"zigbee2mqtt/device_{idx % 2000}/attr_{idx}" for idx in range(20000)),
+        *(f"tele/tasmota_{idx % 2000}/SENSOR/{idx}" for idx in range(20000)),
+        *(f"frigate/camera_{idx % 1000}/obj_{idx}/snapshot" for idx in range(10000)),
+    ]
+    subscriptions = [Subscription(topic, False, job) for topic in filters]
+
+    start = timer()
+    trie = SubscriptionTrie()
+    for subscription in subscriptions:
+        trie.add(subscription)
+    matched = sum(len(trie.match(topic)) for topic in topics)
+    runtime = timer() - start
+    assert matched == len(topics)
+
+    matchers = []
+    for subscription in subscriptions:
+        matcher = MQTTMatcher()
+        matcher[subscription.topic] = True
+        matchers.append(matcher)
+    sample = topics[::1000]
+    linear_start = timer()
+    for topic in sample:
+        for matcher in matchers:
+            next(matcher.iter_match(topic), False)
+    linear_runtime = (timer() - linear_start) * len(topics) / len(sample)
+
+    print(
+        f"{len(filters)} subscriptions, {len(topics)} topics: trie {runtime}s, "
+        f"matcher per subscription (extrapolated) {linear_runtime}s"
+    )
+    return runtime
+
+
+@benchmark
+async def mqtt_inbound_throughput(hass):
+    """Deliver 10k zigbee2mqtt style messages from an in process broker.
+
+    The fake broker streams the messages over TCP to the MQTT client.
+    Each of the 100 devices has 20 subscribers which render a value
+    template for a key of the payload. Rendering the templates directly
+    parses the payload for every subscriber, MQTT value templates share
+    the parsed payloads of the messages of one socket read.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.const import (
+        CONF_BIRTH_MESSAGE,
+        CONF_BROKER,
+        CONF_WILL_MESSAGE,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.models import MqttData, MqttValueTemplate
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.config_entries import ConfigEntry
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.const import CONF_PORT
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    def remaining_length(length):
+        encoded = bytearray()
+        while True:
+            length, digit = divmod(length, 128)
+            encoded.append(digit | 0x80 if length else digit)
+            if not length:
+                return bytes(encoded)
+
+    def publish_packet(topic, payload):
+        body = len(topic).to_bytes(2) + topic.encode() + payload.encode()
+        return b"\x30" + remaining_length(len(body)) + body
+
+    devices = 100
+    keys = [f"key_{idx}" for idx in range(20)]
+    prefixes = ("parse_each", "shared")
+    messages = {
+        prefix: b"".join(
+            (
+                *(
+                    publish_packet(
+                        f"{prefix}/device_{idx % devices}",
+                        JSON_DUMP({"linkquality": idx, **dict.fromkeys(keys, idx)}),
+                    )
+                    for idx in range(10**4)
+                ),
+                publish_packet(f"{prefix}/done", ""),
+            )
+        )
+        for prefix in prefixes
+    }
+    topic_count = len(prefixes) * (devices + 1)
+
+    client_writer = hass.loop.create_future()
+    subscribed = asyncio.Event()
+
+    async def handle_client(reader, writer):
+        """Handle the CONNECT, SUBSCRIBE and PINGREQ packets of the client."""
+        client_writer.set_result(writer)
+        subscribed_topics = 0
+        with suppress(asyncio.IncompleteReadError, ConnectionError):
+            while True:
+                packet_type = (await reader.readexactly(1))[0] >> 4
+                length = shift = 0
+                while True:
+                    digit = (await reader.readexactly(1))[0]
+                    length |= (digit & 0x7F) << shift
+                    shift += 7
+                    if not digit & 0x80:
+                        break
+                body = await reader.readexactly(length)
+                if packet_type == 1:
+                    writer.write(b"\x20\x02\x00\x00")
+                elif packet_type == 8:
+                    # Grant QoS 0 to each topic filter
+                    filters = 0
+                    pos = 2
+                    while pos < length:
+                        pos += 2 + int.from_bytes(body[pos : pos + 2]) + 1
+                        filters += 1
+                    suback = body[:2] + bytes(filters)
+                    writer.write(b"\x90" + remaining_length(len(suback)) + suback)
+                    subscribed_topics += filters
+                    if subscribed_topics == topic_count:
+                        subscribed.set()
+                elif packet_type == 12:
+                    writer.write(b"\xd0\x00")
+                elif packet_type == 14:
+                    break
+        writer.close()
+
+    server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    config_entry = ConfigEntry(
+        data={},
+        discovery_keys={},
+        domain="mqtt",
+        minor_version=1,
+        options={},
+        source="user",
+        subentries_data=None,
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+    mqtt_client = MQTT(
+        hass,
+        config_entry,
+        {
+            CONF_BROKER: "127.0.0.1",
+            CONF_PORT: port,
+            CONF_BIRTH_MESSAGE: {},
+            CONF_WILL_MESSAGE: {},
+        },
+    )
+    await mqtt_client.async_start(MqttData(client=mqtt_client, config=[]))
+
+    done = {prefix: hass.loop.create_future() for prefix in prefixes}
+    for prefix in prefixes:
+        mqtt_client.async_subscribe(
+            f"{prefix}/done",
+            core.callback(lambda msg, prefix=prefix: done[prefix].set_result(None)),
+            0,
+        )
+        for key in keys:
+            template = Template(f"{{{{ value_json.{key} }}}}", hass)
+            if prefix == "shared":
+                render = MqttValueTemplate(
+                    template
+                ).async_render_with_possible_json_value
+            else:
+                render = template.async_render_with_possible_json_value
+            for idx in range(devices):
+                mqtt_client.async_subscribe(
+                    f"{prefix}/device_{idx}",
+                    core.callback(lambda msg, render=render: render(msg.payload)),
+                    0,
+                )
+
+    client_available = hass.loop.create_future()
+    await mqtt_client.async_connect(client_available)
+    assert await client_available
+    await subscribed.wait()
+    writer = await client_writer
+
+    runtimes = {}
+    for prefix in prefixes:
+        start = timer()
+        writer.write(messages[prefix])
+        await done[prefix]
+        runtimes[prefix] = timer() - start
+
+    await mqtt_client.async_disconnect(disconnect_paho_client=True)
+    mqtt_client.cleanup()
+    server.close()
+    await server.wait_closed()
+
+    print(
+        f"Parse per template: {10**4 / runtimes['parse_each']:.0f} messages/s, "
+        f"shared parse: {10**4 / runtimes['shared']:.0f} messages/s"
+    )
+    return runtimes["shared"]
+
+
+@benchmark
+async def recorder_bulk_insert(hass):
+    """Insert 20 commits of 1k events and 1k states each.
+
+    Compares adding the rows to the ORM session with the bulk insert
+    the recorder uses. Set RECORDER_BENCHMARK_DB_URL to benchmark
+    a PostgreSQL or MariaDB database instead of an in memory SQLite.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.bulk_insert import (
+        bulk_insert_events,
+        bulk_insert_states,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        Events,
+        EventTypes,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    commits = 20
+    rows_per_commit = 1000
+    entities = 100
+
+    def _insert_commits(engine, bulk: bool) -> float:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            event_types = EventTypes(event_type="benchmark_event")
+            metas = [StatesMeta(entity_id=f"sensor.b_{idx}") for idx in range(entities)]
+            attributes = [
+                StateAttributes(shared_attrs=f'{{"idx":{idx}}}', hash=idx)
+                for idx in range(entities)
+            ]
+            session.add_all((event_types, *metas, *attributes))
+            session.commit()
+            last_states: list[States | None] = [None] * entities
+            start = timer()
+            for commit in range(commits):
+                events = []
+                states = []
+                for idx in range(rows_per_commit):
+                    entity = idx % entities
+                    fired = commit * rows_per_commit + idx
+                    events.append(
+                        Events(event_type_rel=event_types, time_fired_ts=fired)
+                    )
+                    dbstate = States(
+                        state=str(fired),
+                        last_updated_ts=fired,
+                        states_meta_rel=metas[entity],
+                        state_attributes=attributes[entity],
+                        old_state=last_states[entity],
+                    )
+                    last_states[entity] = dbstate
+                    states.append(dbstate)
+                if bulk:
+                    session.flush()
+                    bulk_insert_events(session, events)
+                    bulk_insert_states(session, states)
+                else:
+                    session.add_all(events)
+                    session.add_all(states)
+                session.commit()
+            return timer() - start
+
+    def _run() -> tuple[str, float, float]:
+        engine = create_engine(os.environ.get("RECORDER_BENCHMARK_DB_URL", "sqlite://"))
+        try:
+            return (
+                engine.dialect.name,
+                _insert_commits(engine, False),
+                _insert_commits(engine, True),
+            )
+        finally:
+            engine.dispose()
+
+    dialect, orm_runtime, runtime = await hass.async_add_executor_job(_run)
+    rows = commits * rows_per_commit
+    print(
+        f"{dialect}: ORM {rows / orm_runtime:.0f} events/s, "
+        f"bulk insert {rows / runtime:.0f} events/s "
+        "(each event is an events row and a states row)"
+    )
+    return runtime
+
+
+@benchmark
+async def reduce_statistics(hass):
+    """Reduce a year of hourly statistics of 200 statistic ids to days and months.
+
+    Compares the loop over the rows with the NumPy reduction.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    statistic_ids = 200
+    hours = 365 * 24
+    start = 1672531200.0  # 2023-01-01 00:00 UTC
+    stats = {
+        f"sensor.energy_{idx}": [
+            {
+                "start": start + hour * 3600,
+                "end": start + (hour + 1) * 3600,
+                "mean": float(hour % 24),
+                "min": float(hour % 24 - 1),
+                "max": float(hour % 24 + 1),
+                "last_reset": None,
+                "state": float(hour),
+                "sum": float(hour),
+            }
+            for hour in range(hours)
+        ]
+        for idx in range(statistic_ids)
+    }
+    runtime = 0.0
+    for types in (
+        {"last_reset", "max", "mean", "min", "state", "sum"},
+        # The energy dashboard only requests the sum
+        {"sum"},
+    ):
+        for name, factory, period in (
+            ("day", statistics.reduce_day_ts_factory, timedelta(days=1)),
+            ("month", statistics.reduce_month_ts_factory, timedelta(days=31)),
+        ):
+            same_period, period_start_end = factory()
+            start_time = timer()
+            statistics._reduce_statistics_per_row(  # noqa: SLF001
+                stats, same_period, period_start_end, period, types
+            )
+            loop_runtime = timer() - start_time
+            start_time = timer()
+            statistics._reduce_statistics_vectorized(  # noqa: SLF001
+                stats, period_start_end, types
+            )
+            vectorized_runtime = timer() - start_time
+            runtime += vectorized_runtime
+            print(
+                f"{name} {','.join(sorted(types))}: loop {loop_runtime:.3f}s, "
+                f"NumPy {vectorized_runtime:.3f}s "
+                f"({loop_runtime / vectorized_runtime:.1f}x)"
+            )
+    return runtime
+
+
+@benchmark
+async def recorder_partition_purge(hass):
+    """Purge 3 of 10 days of 100k states per day and query a day of states.
+
+    Compares deleting the rows with dropping the partitions of a states
+    table partitioned by day. Requires RECORDER_BENCHMARK_DB_URL to be
+    set to a PostgreSQL database.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine, text
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import sessionmaker
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import migration
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import Base, States
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.partition import (
+        day_start_timestamp,
+        drop_partition,
+        partition_name,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.util import session_scope
+
+    # pylint: disable-next=import-outside-toplevel
+    import homeassistant.util.dt as dt_util
+
+    days = 10
+    purge_days = 3
+    rows_per_day = 100000
+    entities = 100
+    today = dt_util.utcnow().date()
+    first_day = today - timedelta(days=days)
+    first_ts = day_start_timestamp(first_day)
+    purge_before = day_start_timestamp(first_day + timedelta(days=purge_days))
+    query_start = day_start_timestamp(today - timedelta(days=2))
+
+    def _fill_states(engine) -> None:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO states_meta (metadata_id, entity_id)"
+                    " SELECT idx, 'sensor.benchmark_' || idx"
+                    " FROM generate_series(1, :entities) AS idx"
+                ),
+                {"entities": entities},
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO states (state, last_updated_ts, metadata_id)"
+                    " SELECT 'on', :first_ts + row * :step, 1 + row % :entities"
+                    " FROM generate_series(0, :rows - 1) AS row"
+                ),
+                {
+                    "first_ts": first_ts,
+                    "step": 86400 / rows_per_day,
+                    "entities": entities,
+                    "rows": days * rows_per_day,
+                },
+            )
+            connection.execute(text("ANALYZE states"))
+
+    def _query(session) -> float:
+        start = timer()
+        session.execute(
+            text(
+                "SELECT count(*) FROM states WHERE metadata_id = 1"
+                " AND last_updated_ts >= :start AND last_updated_ts < :end"
+            ),
+            {"start": query_start, "end": query_start + 86400},
+        ).scalar()
+        return timer() - start
+
+    def _run() -> tuple[float, float, float, float] | None:
+        engine = create_engine(os.environ.get("RECORDER_BENCHMARK_DB_URL", "sqlite://"))
+        session_maker = sessionmaker(engine)
+        try:
+            if engine.dialect.name != "postgresql":
+                return None
+            _fill_states(engine)
+            with session_scope(session=session_maker()) as session:
+                start = timer()
+                session.execute(
+                    text("DELETE FROM states WHERE last_updated_ts < :purge_before"),
+                    {"purge_before": purge_before},
+                )
+                delete_runtime = timer() - start
+            with session_scope(session=session_maker()) as session:
+                query_runtime = _query(session)
+
+            _fill_states(engine)
+            migration.rebuild_postgresql_table_partitioned(session_maker, States, today)
+            with engine.begin() as connection:
+                connection.execute(text("ANALYZE states"))
+            with session_scope(session=session_maker()) as session:
+                start = timer()
+                for day in range(purge_days):
+                    drop_partition(
+                        session,
+                        partition_name("states", first_day + timedelta(days=day)),
+                    )
+                drop_runtime = timer() - start
+            with session_scope(session=session_maker()) as session:
+                partitioned_query_runtime = _query(session)
+            return (
+                delete_runtime,
+                drop_runtime,
+                query_runtime,
+                partitioned_query_runtime,
+            )
+        finally:
+            Base.metadata.drop_all(engine)
+            engine.dispose()
+
+    if not (result := await hass.async_add_executor_job(_run)):
+        print("Set RECORDER_BENCHMARK_DB_URL to a PostgreSQL database")
+        return 0
+    delete_runtime, drop_runtime, query_runtime, partitioned_query_runtime = result
+    print(
+        f"purge {purge_days * rows_per_day} states: DELETE {delete_runtime:.3f}s, "
+        f"partition drop {drop_runtime:.3f}s; query a day of an entity: "
+        f"{query_runtime * 1000:.1f}ms, partitioned {partitioned_query_runtime * 1000:.1f}ms"
+    )
+    return drop_runtime
+
+
+@benchmark
+async def recorder_state_attributes(hass):
+    """Serialize the attributes of 100k state changes of 100 sensors.
+
+    The state changes but the attributes do not, which is the case for
+    most sensor updates. Compares serializing the attributes of every
+    state change with reusing the attributes serialized for the last
+    state change of the entity.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from types import SimpleNamespace
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import StateAttributes
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.table_managers.state_attributes import (
+        StateAttributesManager,
+    )
+
+    state_changes = 100000
+    entities = 100
+    attributes = {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "friendly_name": "Benchmark power",
+        "icon": "mdi:flash",
+    }
+    events = []
+
+    @core.callback
+    def listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    for idx in range(state_changes):
+        hass.states.async_set(f"sensor.power_{idx % entities}", str(idx), attributes)
+    await hass.async_block_till_done()
+
+    def _serialize() -> tuple[float, float]:
+        start = timer()
+        for event in events:
+            StateAttributes.shared_attrs_bytes_from_event(event, None)
+        serialize_runtime = timer() - start
+        manager = StateAttributesManager(SimpleNamespace(dialect_name=None))
+        start = timer()
+        for event in events:
+            manager.serialize_from_event(event)
+        return serialize_runtime, timer() - start
+
+    serialize_runtime, runtime = await hass.async_add_executor_job(_serialize)
+    print(
+        f"{len(events)} state changes: serialize every state change "
+        f"{serialize_runtime:.3f}s, reuse unchanged attributes {runtime:.3f}s"
+    )
+    return runtime
+
+
+@benchmark
+async def template_untouched_attributes(hass):
+    """Update the media position of a media player 1k times with 100 templates.
+
+    The templates read the volume level of the media player, templates
+    reading it with state_attr are not re-rendered when only the media
+    position changes, templates reading the attributes object are.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    updates = 1000
+    entity_id = "media_player.living_room"
+
+    @core.callback
+    def listener(event, updates):
+        """Handle template results."""
+
+    async def _track_updates(template_str: str) -> float:
+        trackers = [
+            async_track_template_result(
+                hass,
+                [TrackTemplate(Template(f"{template_str} {idx}", hass), None)],
+                listener,
+            )
+            for idx in range(100)
+        ]
+        start = timer()
+        for position in range(updates):
+            hass.states.async_set(
+                entity_id,
+                "playing",
+                {"volume_level": 0.5, "media_position": position},
+            )
+        await hass.async_block_till_done()
+        runtime = timer() - start
+        for tracker in trackers:
+            tracker.async_remove()
+        return runtime
+
+    hass.states.async_set(entity_id, "playing", {"volume_level": 0.5})
+    attributes_runtime = await _track_updates(
+        "{{ states.media_player.living_room.attributes.volume_level }}"
+    )
+    runtime = await _track_updates(
+        "{{ state_attr('media_player.living_room', 'volume_level') }}"
+    )
+    print(
+        f"{updates} updates: attributes object {attributes_runtime:.3f}s, "
+        f"state_attr {runtime:.3f}s"
+    )
+    return runtime
+
+
+@benchmark
+async def template_registry_lookups(hass):
+    """Render the area, label, floor and integration lookups 1k times.
+
+    The registries hold 10k entities of 10 integrations on 1k devices
+    in 100 areas, every seventh entity is assigned to an area and a
+    label of its own. The lookups use the indexes of the registries and
+    should not get slower with the number of entities.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from tempfile import TemporaryDirectory
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.config_entries import ConfigEntries, ConfigEntry
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity import _async_add_entity_source
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    renders = 1000
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config_entries = ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        for registry in (fr, lr, ar, dr, er):
+            await registry.async_load(hass)
+        floor_registry = fr.async_get(hass)
+        label_registry = lr.async_get(hass)
+        area_registry = ar.async_get(hass)
+        device_registry = dr.async_get(hass)
+        entity_registry = er.async_get(hass)
+
+        floors = [floor_registry.async_create(f"Floor {idx}") for idx in range(5)]
+        labels = [label_registry.async_create(f"Label {idx}") for idx in range(20)]
+        areas = [
+            area_registry.async_create(
+                f"Area {idx}",
+                floor_id=floors[idx % 5].floor_id,
+                labels={labels[idx % 20].label_id},
+            )
+            for idx in range(100)
+        ]
+        config_entries = []
+        for idx in range(10):
+            config_entry = ConfigEntry(
+                data={},
+                discovery_keys={},
+                domain=f"integration_{idx}",
+                minor_version=1,
+                options={},
+                source="user",
+                subentries_data=None,
+                title=f"Entry {idx}",
+                unique_id=None,
+                version=1,
+            )
+            hass.config_entries._entries[config_entry.entry_id] = config_entry  # noqa: SLF001
+            config_entries.append(config_entry)
+        devices = []
+        for idx in range(1000):
+            device = device_registry.async_get_or_create(
+                config_entry_id=config_entries[idx % 10].entry_id,
+                identifiers={("benchmark", str(idx))},
+            )
+            device_registry.async_update_device(device.id, area_id=areas[idx % 100].id)
+            devices.append(device)
+        for idx in range(10000):
+            entry = entity_registry.async_get_or_create(
+                "sensor",
+                f"integration_{idx % 10}",
+                str(idx),
+                config_entry=config_entries[idx % 10],
+                device_id=devices[idx % 1000].id,
+            )
+            if idx % 7 == 0:
+                entity_registry.async_update_entity(
+                    entry.entity_id,
+                    area_id=areas[(idx + 3) % 100].id,
+                    labels={labels[idx % 20].label_id},
+                )
+            _async_add_entity_source(
+                hass,
+                entry.entity_id,
+                {
+                    "config_entry": config_entries[idx % 10].entry_id,
+                    "custom_component": False,
+                    "domain": entry.platform,
+                },
+            )
+            hass.states.async_set(entry.entity_id, "on")
+        await hass.async_block_till_done()
+
+        lookups = {
+            "area_entities": "{{ area_entities('Area 5') | count }}",
+            "label_entities": "{{ label_entities('Label 5') | count }}",
+            "floor_areas": "{{ floor_areas('Floor 1') | count }}",
+            "integration_entities": "{{ integration_entities('integration_3') | count }}",
+            "expand": "{{ expand(area_entities('Area 5')) | count }}",
+        }
+        runtime = 0.0
+        for name, template_str in lookups.items():
+            template = Template(template_str, hass)
+            template.async_render()
+            start = timer()
+            for _ in range(renders):
+                template.async_render()
+            lookup_runtime = timer() - start
+            runtime += lookup_runtime
+            print(f"{renders} renders of {name}: {lookup_runtime:.3f}s")
+
+        await hass.async_stop(force=True)
+    return runtime
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -2154,3 +2154,78 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_downsampled_history_during_period(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test downsampled_history_during_period."""
+    now = dt_util.utcnow().replace(microsecond=0) - timedelta(hours=1)
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+
+    for offset, sensor_state in (
+        (0, "10"),
+        (10, "20"),
+        (20, "30"),
+        (70, "unavailable"),
+        (100, "5"),
+    ):
+        with freeze_time(now + timedelta(seconds=offset)):
+            hass.states.async_set("sensor.test", sensor_state)
+            hass.states.async_set("binary_sensor.test", STATE_ON if offset else "off")
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    start_time = now + timedelta(seconds=5)
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/downsampled_history_during_period",
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(seconds=120)).isoformat(),
+            "entity_ids": ["sensor.test", "binary_sensor.test"],
+            "points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    start_time_ts = start_time.timestamp()
+    assert response["result"] == {
+        "sensor.test": {
+            "t": [start_time_ts, start_time_ts + 60, start_time_ts + 90],
+            "min": [10.0, None, 5.0],
+            "max": [30.0, None, 5.0],
+            "mean": [20.0, None, 5.0],
+        },
+        "binary_sensor.test": {
+            "t": [start_time_ts],
+            "min": [None],
+            "max": [None],
+            "mean": [None],
+        },
+    }
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/downsampled_history_during_period",
+            "start_time": "cats",
+            "entity_ids": ["sensor.test"],
+            "points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/downsampled_history_during_period",
+            "start_time": start_time.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "points": 0,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
@@ -7,6 +7,7 @@ from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import core
@@ -22,11 +23,13 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NAME,
+    ATTR_SERVICE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
     STATE_OFF,
@@ -292,6 +295,83 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_pages(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test logbook get_events in pages."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    for entity_id in ("light.a", "light.b", "light.c"):
+        hass.states.async_set(entity_id, STATE_OFF)
+    await hass.async_block_till_done()
+    freezer.tick()
+    start_time = dt_util.utcnow().isoformat()
+
+    context = core.Context(id="01GTDGKBCH00GW0X276W5TEDDD")
+    freezer.tick()
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+        context=context,
+    )
+    freezer.tick()
+    hass.states.async_set("light.a", STATE_ON, context=context)
+    freezer.tick()
+    # Two rows of the same timestamp are on the same page
+    hass.states.async_set("light.b", STATE_ON)
+    hass.states.async_set("light.c", STATE_ON)
+    freezer.tick()
+    hass.states.async_set("light.a", STATE_OFF, context=context)
+    await async_wait_recording_done(hass)
+    freezer.tick()
+
+    client = await hass_ws_client()
+
+    async def _get_page(limit: int, cursor: float | None) -> dict[str, Any]:
+        message: dict[str, Any] = {
+            "type": "logbook/get_events",
+            "start_time": start_time,
+            "limit": limit,
+        }
+        if cursor is not None:
+            message["cursor"] = cursor
+        await client.send_json_auto_id(message)
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    def _entries(page: dict[str, Any]) -> list[tuple[str, str, str | None]]:
+        return [
+            (entry["entity_id"], entry["state"], entry.get("context_service"))
+            for entry in page["events"]
+        ]
+
+    page = await _get_page(2, None)
+    assert _entries(page) == [("light.a", STATE_ON, "turn_on")]
+    cursor = page["next_cursor"]
+    page = await _get_page(2, cursor)
+    assert _entries(page) == [("light.b", STATE_ON, None), ("light.c", STATE_ON, None)]
+    # The context of the row started on a previous page
+    page = await _get_page(2, page["next_cursor"])
+    assert _entries(page) == [("light.a", STATE_OFF, "turn_on")]
+    assert page["next_cursor"] is None
+
+    # A page that cannot be split by timestamp has all rows of the timestamp
+    page = await _get_page(1, cursor)
+    assert _entries(page) == [("light.b", STATE_ON, None), ("light.c", STATE_ON, None)]
+    page = await _get_page(1, page["next_cursor"])
+    assert _entries(page) == [("light.a", STATE_OFF, "turn_on")]
+    assert page["next_cursor"] is None
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -10,12 +10,22 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 import certifi
 import paho.mqtt.client as paho_mqtt
+from paho.mqtt.matcher import MQTTMatcher
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
-from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
+from homeassistant.components.mqtt.models import (
+    MessageCallbackType,
+    PayloadSentinel,
+    ReceiveMessage,
+    async_json_loads_payload,
+)
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import (
     CONF_PROTOCOL,
@@ -23,7 +33,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -250,6 +266,90 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(recorded_calls) == 1
 
 
+async def test_subscribers_share_decoded_payload(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the payload is decoded once for all subscribers of a message."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+
+    async_fire_mqtt_message(hass, "test-topic", '{"state": "ON"}')
+    await hass.async_block_till_done()
+
+    assert len(recorded_calls) == 3
+    decoded = [msg.payload for msg in recorded_calls if isinstance(msg.payload, str)]
+    raw = [msg.payload for msg in recorded_calls if isinstance(msg.payload, bytes)]
+    assert decoded == ['{"state": "ON"}', '{"state": "ON"}']
+    assert decoded[0] is decoded[1]
+    assert raw == [b'{"state": "ON"}']
+
+
+async def test_subscribers_share_parsed_json_per_message(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test the subscribers of a message share the parsed JSON payload."""
+    await mqtt_mock_entry()
+    parsed: list[Any] = []
+
+    @callback
+    def _parse_payload(msg: ReceiveMessage) -> None:
+        parsed.append(async_json_loads_payload(msg.payload))
+
+    await mqtt.async_subscribe(hass, "test-topic", _parse_payload)
+    await mqtt.async_subscribe(hass, "test-topic/#", _parse_payload)
+
+    async_fire_mqtt_message(hass, "test-topic", '{"state": "ON"}')
+    async_fire_mqtt_message(hass, "test-topic", '{"state": "ON"}')
+    async_fire_mqtt_message(hass, "test-topic", "ON")
+    await hass.async_block_till_done()
+
+    assert parsed[:4] == [{"state": "ON"}] * 4
+    assert parsed[0] is parsed[1]
+    # Later messages with the same payload are parsed again
+    assert parsed[2] is parsed[3]
+    assert parsed[2] is not parsed[0]
+    assert parsed[4:] == [PayloadSentinel.NONE] * 2
+
+
+async def test_messages_of_one_read_delivered_as_batch(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test messages received in one socket read are delivered as a batch."""
+    await mqtt_mock_entry()
+    parsed: list[tuple[str, Any]] = []
+
+    @callback
+    def _parse_payload(msg: ReceiveMessage) -> None:
+        parsed.append((msg.topic, async_json_loads_payload(msg.payload)))
+
+    await mqtt.async_subscribe(hass, "test-topic/#", _parse_payload)
+    delivered_during_read: list[int] = []
+
+    def _loop_read(max_packets: int) -> int:
+        for idx in range(3):
+            async_fire_mqtt_message(hass, f"test-topic/{idx}", '{"state": "ON"}')
+        delivered_during_read.append(len(parsed))
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    hass.data["mqtt"].client._async_reader_callback(Mock(loop_read=_loop_read))
+
+    assert delivered_during_read == [0]
+    assert parsed == [
+        ("test-topic/0", {"state": "ON"}),
+        ("test-topic/1", {"state": "ON"}),
+        ("test-topic/2", {"state": "ON"}),
+    ]
+    # The messages of the batch share the parsed payload
+    assert parsed[0][1] is parsed[1][1] is parsed[2][1]
+
+
 async def test_subscribe_topic(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -653,6 +753,62 @@ async def test_subscribe_special_characters(
     assert recorded_calls[0].payload == payload
 
 
+def test_subscription_trie() -> None:
+    """Test the wildcard subscription trie matches like the paho matcher."""
+    filters = [
+        "+",
+        "#",
+        "home/#",
+        "home/+",
+        "home/+/temperature",
+        "home/+/+",
+        "home/kitchen/#",
+        "+/kitchen/temperature",
+        "$SYS/#",
+        "$SYS/+/uptime",
+        "/+",
+        "home//#",
+    ]
+    topics = [
+        "home",
+        "home/kitchen",
+        "home/kitchen/temperature",
+        "home/kitchen/temperature/max",
+        "office/kitchen/temperature",
+        "$SYS",
+        "$SYS/broker/uptime",
+        "/home",
+        "home//x",
+        "",
+    ]
+    job = HassJob(callback(lambda msg: None))
+    trie = SubscriptionTrie()
+    subscriptions = [Subscription(topic, False, job) for topic in filters]
+    for subscription in subscriptions:
+        trie.add(subscription)
+    assert len(trie) == len(filters)
+
+    for topic in topics:
+        expected = []
+        for subscription in subscriptions:
+            matcher = MQTTMatcher()
+            matcher[subscription.topic] = True
+            if next(matcher.iter_match(topic), False):
+                expected.append(subscription)
+        # Matches are returned in the order the subscriptions were added
+        assert trie.match(topic) == expected, topic
+
+    for subscription in subscriptions:
+        trie.remove(subscription)
+    assert len(trie) == 0
+    assert trie.match("home/kitchen") == []
+    # Nodes are pruned once empty
+    assert not trie._root.children
+
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions[0])
+
+
 async def test_subscribe_same_topic(
     hass: HomeAssistant,
     mock_debouncer: asyncio.Event,
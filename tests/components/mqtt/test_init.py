@@ -20,6 +20,7 @@ from homeassistant.components.mqtt.models import (
     MqttCommandTemplateException,
     MqttValueTemplateException,
     ReceiveMessage,
+    share_json_payloads,
 )
 from homeassistant.components.mqtt.schemas import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.sensor import SensorDeviceClass
@@ -40,6 +41,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
@@ -214,6 +216,35 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_parses_json_once(hass: HomeAssistant) -> None:
+    """Test templates rendering the payload of a message share the parsed JSON."""
+    payload = '{"temperature": 21.5, "humidity": 40}'
+    temperature = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json.temperature }}", hass=hass)
+    )
+    humidity = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json.humidity }}", hass=hass)
+    )
+    not_json = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json is defined }} {{ value }}", hass=hass)
+    )
+
+    with patch(
+        "homeassistant.components.mqtt.models.json_loads", wraps=json_loads
+    ) as mock_json_loads:
+        with share_json_payloads():
+            assert temperature.async_render_with_possible_json_value(payload) == "21.5"
+            assert humidity.async_render_with_possible_json_value(payload) == "40"
+            assert mock_json_loads.call_count == 1
+            assert not_json.async_render_with_possible_json_value("ON") == "False ON"
+            assert not_json.async_render_with_possible_json_value("ON") == "False ON"
+            assert mock_json_loads.call_count == 2
+
+        # The parsed payloads are only shared while a message is delivered
+        assert temperature.async_render_with_possible_json_value(payload) == "21.5"
+        assert mock_json_loads.call_count == 3
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
@@ -1,10 +1,15 @@
 """The tests for shared code of the MQTT platform."""
 
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.components import mqtt, sensor
+from homeassistant.components.mqtt.models import (
+    ReceiveMessage,
+    async_json_loads_payload,
+)
 from homeassistant.components.mqtt.sensor import DEFAULT_NAME as DEFAULT_SENSOR_NAME
 from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
@@ -13,6 +18,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
+from homeassistant.util.json import json_loads
 
 from tests.common import MockConfigEntry, async_capture_events, async_fire_mqtt_message
 from tests.typing import MqttMockHAClientGenerator
@@ -448,3 +454,47 @@ async def test_value_template_fails(
         "TypeError: unsupported operand type(s) for *: 'NoneType' and 'int' rendering template"
         in caplog.text
     )
+
+
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                sensor.DOMAIN: {
+                    "name": "test",
+                    "state_topic": "test-topic",
+                    "value_template": "{{ value_json.temperature }}",
+                    "json_attributes_topic": "test-topic",
+                }
+            }
+        }
+    ],
+)
+async def test_json_attributes_share_parsed_payload(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test JSON attributes share the parsed payload and keep a copy of it."""
+    await mqtt_mock_entry()
+    parsed: list[Any] = []
+
+    @callback
+    def _parse_payload(msg: ReceiveMessage) -> None:
+        parsed.append(async_json_loads_payload(msg.payload))
+
+    await mqtt.async_subscribe(hass, "test-topic", _parse_payload)
+
+    with patch(
+        "homeassistant.components.mqtt.models.json_loads", wraps=json_loads
+    ) as mock_json_loads:
+        async_fire_mqtt_message(
+            hass, "test-topic", '{"temperature": 21.5, "zones": [{"id": 1}]}'
+        )
+        await hass.async_block_till_done()
+    assert mock_json_loads.call_count == 1
+
+    state = hass.states.get("sensor.test")
+    assert state.state == "21.5"
+    assert state.attributes["zones"] == [{"id": 1}]
+    assert state.attributes["zones"] is not parsed[0]["zones"]
+    assert state.attributes["zones"][0] is not parsed[0]["zones"][0]
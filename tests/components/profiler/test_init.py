@@ -26,15 +26,21 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
+    SERVICE_START_JOB_STATS,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_TEMPLATE_STATS,
+    SERVICE_STOP_JOB_STATS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_TEMPLATE_STATS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.template import Template
+from homeassistant.helpers.template_profiler import async_get_template_stats
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -469,3 +475,103 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_job_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    """Test recording and logging job stats."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_START_JOB_STATS)
+    assert hass.services.has_service(DOMAIN, SERVICE_STOP_JOB_STATS)
+
+    @callback
+    def _slow_listener(event):
+        pass
+
+    @callback
+    def _other_listener(event):
+        pass
+
+    hass.bus.async_listen("profiler_test_event", _slow_listener)
+    hass.bus.async_listen("profiler_test_event", _other_listener)
+
+    with pytest.raises(HomeAssistantError, match="Job stats not running"):
+        await hass.services.async_call(DOMAIN, SERVICE_STOP_JOB_STATS, blocking=True)
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_STATS, blocking=True)
+
+    with pytest.raises(HomeAssistantError, match="Job stats already started"):
+        await hass.services.async_call(DOMAIN, SERVICE_START_JOB_STATS, blocking=True)
+
+    hass.bus.async_fire("profiler_test_event")
+    hass.bus.async_fire("profiler_test_event")
+    await hass.async_block_till_done()
+
+    job_stats = hass.async_get_job_stats()
+    slow_listener = job_stats[f"{__name__}.test_job_stats.<locals>._slow_listener"]
+    assert slow_listener.calls == 2
+    assert slow_listener.integration is None
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_JOB_STATS, blocking=True)
+    assert hass.async_get_job_stats() is None
+    assert "_slow_listener (core): 2 calls" in caplog.text
+    assert "_other_listener (core): 2 calls" in caplog.text
+    assert "_async_start_job_stats (profiler): 1 calls" in caplog.text
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_STATS, blocking=True)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.async_get_job_stats() is None
+
+
+async def test_template_stats(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test recording and logging template stats."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_START_TEMPLATE_STATS)
+    assert hass.services.has_service(DOMAIN, SERVICE_STOP_TEMPLATE_STATS)
+
+    with pytest.raises(HomeAssistantError, match="Template stats not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_TEMPLATE_STATS, blocking=True
+        )
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_TEMPLATE_STATS, blocking=True)
+
+    with pytest.raises(HomeAssistantError, match="Template stats already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_TEMPLATE_STATS, blocking=True
+        )
+
+    frequent = Template("{{ 1 + 1 }}", hass)
+    for _ in range(3):
+        frequent.async_render({"this": {"entity_id": "sensor.frequent"}})
+    Template("{{ 2 + 2 }}", hass).async_render()
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_STOP_TEMPLATE_STATS,
+        {"max_templates": 1, "sort_by": "renders"},
+        blocking=True,
+    )
+    assert async_get_template_stats(hass) is None
+    assert "Template {{ 1 + 1 }} (sensor.frequent): 3 renders" in caplog.text
+    assert "{{ 2 + 2 }}" not in caplog.text
+    assert "Tracked templates: 0 renders, 0 renders shared (0.0%)" in caplog.text
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_TEMPLATE_STATS, blocking=True)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert async_get_template_stats(hass) is None
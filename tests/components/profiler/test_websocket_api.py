@@ -0,0 +1,124 @@
+"""Test the profiler websocket API."""
+
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.template import Template
+from homeassistant.helpers.template_profiler import (
+    async_start_template_profiling,
+    async_stop_template_profiling,
+)
+
+from tests.common import MockConfigEntry
+from tests.typing import WebSocketGenerator
+
+
+async def test_job_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting job stats over the websocket API."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "profiler/job_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"running": False, "jobs": []}
+
+    @callback
+    def _listener(event):
+        pass
+
+    hass.bus.async_listen("profiler_test_event", _listener)
+    hass.async_start_job_profiling()
+    for _ in range(3):
+        hass.bus.async_fire("profiler_test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "profiler/job_stats", "max_jobs": 100})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["running"] is True
+    jobs = {job["name"]: job for job in result["jobs"]}
+    job = jobs[f"{__name__}.test_job_stats.<locals>._listener"]
+    assert job["calls"] == 3
+    assert job["integration"] is None
+    assert job["total_time"] >= job["max_time"] >= 0
+    total_times = [job["total_time"] for job in result["jobs"]]
+    assert total_times == sorted(total_times, reverse=True)
+
+    await client.send_json_auto_id({"type": "profiler/job_stats", "max_jobs": 1})
+    response = await client.receive_json()
+    assert len(response["result"]["jobs"]) == 1
+
+    await client.send_json_auto_id({"type": "profiler/job_stats", "max_jobs": 0})
+    response = await client.receive_json()
+    assert not response["success"]
+
+    hass.async_stop_job_profiling()
+
+
+async def test_template_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting template stats over the websocket API."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "profiler/template_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "running": False,
+        "templates": [],
+        "shared_renders": {"renders": 0, "shared": 0, "ratio": 0.0},
+    }
+
+    async_start_template_profiling(hass)
+    for _ in range(3):
+        Template("{{ 1 + 1 }}", hass).async_render(
+            {"this": {"entity_id": "sensor.frequent"}}
+        )
+    Template("{{ 2 + 2 }}", hass).async_render()
+
+    await client.send_json_auto_id(
+        {"type": "profiler/template_stats", "sort_by": "renders"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["running"] is True
+    assert [template["template"] for template in result["templates"]] == [
+        "{{ 1 + 1 }}",
+        "{{ 2 + 2 }}",
+    ]
+    template = result["templates"][0]
+    assert template["owners"] == ["sensor.frequent"]
+    assert template["renders"] == 3
+    assert template["total_time"] >= template["max_time"] >= 0
+    assert template["triggers"] == {}
+    assert result["shared_renders"] == {"renders": 0, "shared": 0, "ratio": 0.0}
+
+    await client.send_json_auto_id(
+        {"type": "profiler/template_stats", "max_templates": 1}
+    )
+    response = await client.receive_json()
+    assert len(response["result"]["templates"]) == 1
+
+    await client.send_json_auto_id(
+        {"type": "profiler/template_stats", "sort_by": "owners"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+
+    async_stop_template_profiling(hass)
@@ -4,6 +4,7 @@ from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import partial
+from pathlib import Path
 import threading
 from unittest.mock import Mock, patch
 
@@ -41,6 +42,15 @@ def skip_by_db_engine(request: pytest.FixtureRequest, recorder_db_url: str) -> N
             pytest.skip(f"skipped for DB engine: {db_engine}")
 
 
+@pytest.fixture(autouse=True)
+def recorder_spill_queue_path(tmp_path: Path) -> Generator[None]:
+    """Keep the spill queue of each test out of the shared config dir."""
+    with patch.object(
+        recorder.core, "SPILL_QUEUE_FILENAME", str(tmp_path / "recorder.spill")
+    ):
+        yield
+
+
 @pytest.fixture
 def recorder_dialect_name(hass: HomeAssistant, db_engine: str) -> Generator[None]:
     """Patch the recorder dialect."""
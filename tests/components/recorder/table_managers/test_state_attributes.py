@@ -0,0 +1,60 @@
+"""Test the state attributes table manager."""
+
+from unittest.mock import patch
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    StateAttributesManager,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+
+
+async def test_serialize_unchanged_attributes_once(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the attributes are only serialized again when they change."""
+    events: list[Event] = []
+
+    @callback
+    def _listener(event: Event) -> None:
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _listener)
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.one", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.one", "3", {"unit_of_measurement": "kW"})
+    hass.states.async_remove("sensor.one")
+    hass.states.async_set("sensor.one", "4", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    # Attributes that are equal but another object
+    events.append(
+        Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.two",
+                "old_state": events[2].data["new_state"],
+                "new_state": State("sensor.two", "2", {"unit_of_measurement": "W"}),
+            },
+        )
+    )
+
+    manager = StateAttributesManager(recorder_mock)
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as shared_attrs_bytes_from_event:
+        assert [manager.serialize_from_event(event) for event in events] == [
+            b'{"unit_of_measurement":"W"}',
+            b'{"unit_of_measurement":"W"}',
+            b'{"unit_of_measurement":"W"}',
+            b'{"unit_of_measurement":"kW"}',
+            b"{}",
+            b'{"unit_of_measurement":"kW"}',
+            b'{"unit_of_measurement":"W"}',
+        ]
+    # The second state of sensor.one kept the attributes object of the first
+    assert len(shared_attrs_bytes_from_event.mock_calls) == 6
@@ -0,0 +1,87 @@
+"""Test bulk insert of events and states."""
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from homeassistant.components.recorder.bulk_insert import (
+    bulk_insert_events,
+    bulk_insert_states,
+)
+from homeassistant.components.recorder.db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+
+def test_bulk_insert_events_and_states() -> None:
+    """Test bulk insert resolves the ids of rows added in the same commit."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        event_types = EventTypes(event_type="test_event")
+        event_data = EventData(shared_data='{"a":1}', hash=1)
+        states_meta = StatesMeta(entity_id="sensor.test")
+        state_attributes = StateAttributes(shared_attrs='{"b":2}', hash=2)
+        session.add_all((event_types, event_data, states_meta, state_attributes))
+
+        events = [
+            Events(event_type_rel=event_types, event_data_rel=event_data),
+            Events(event_type_rel=event_types, time_fired_ts=1.0),
+        ]
+        # A state that was never queued for insert but is the old
+        # state of a queued state must be inserted first
+        orphan = States(state="orphan", states_meta_rel=states_meta)
+        states = [
+            States(
+                state=str(idx),
+                states_meta_rel=states_meta,
+                state_attributes=state_attributes,
+            )
+            for idx in range(4)
+        ]
+        states[0].old_state = orphan
+        states[1].old_state = states[0]
+        states[3].old_state = states[1]
+
+        session.flush()
+        bulk_insert_events(session, events)
+        bulk_insert_states(session, states)
+        session.commit()
+
+        db_events = session.execute(
+            select(Events.event_type_id, Events.data_id).order_by(Events.event_id)
+        ).all()
+        assert db_events == [
+            (event_types.event_type_id, event_data.data_id),
+            (event_types.event_type_id, None),
+        ]
+
+        db_states = {
+            row.state: row
+            for row in session.execute(
+                select(
+                    States.state_id,
+                    States.state,
+                    States.old_state_id,
+                    States.metadata_id,
+                    States.attributes_id,
+                )
+            )
+        }
+        assert len(db_states) == 5
+        assert db_states["orphan"].old_state_id is None
+        assert db_states["0"].old_state_id == db_states["orphan"].state_id
+        assert db_states["1"].old_state_id == db_states["0"].state_id
+        assert db_states["2"].old_state_id is None
+        assert db_states["3"].old_state_id == db_states["1"].state_id
+        assert db_states["0"].metadata_id == states_meta.metadata_id
+        assert db_states["0"].attributes_id == state_attributes.attributes_id
+        assert db_states["orphan"].attributes_id is None
+        for dbstate in states:
+            assert dbstate.state_id == db_states[dbstate.state].state_id
@@ -1014,3 +1014,29 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+def test_downsample_states() -> None:
+    """Test downsampling states to the min, max and mean of buckets."""
+    states = [
+        ("3", 0.0),
+        ("1", 10.0),
+        ("unavailable", 25.0),
+        ("nan", 40.0),
+        ("4", 95.0),
+        ("8", 100.0),
+        ("6", 250.0),
+    ]
+    # The states are reduced as they are read
+    assert history.downsample_states(iter(states), 0.0, 100.0, 4) == {
+        "t": [0.0, 25.0, 75.0],
+        "min": [1.0, None, 4.0],
+        "max": [3.0, None, 8.0],
+        "mean": [2.0, None, 6.0],
+    }
+    assert history.downsample_states([], 0.0, 100.0, 4) == {
+        "t": [],
+        "min": [],
+        "max": [],
+        "mean": [],
+    }
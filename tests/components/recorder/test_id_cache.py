@@ -0,0 +1,91 @@
+"""Test the id caches kept across restarts."""
+
+import os
+
+import pytest
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.id_cache import load_id_caches
+from homeassistant.core import HomeAssistant
+
+from .common import async_wait_recording_done
+
+from tests.common import async_test_home_assistant
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.usefixtures("hass_storage")  # Prevent test hass from writing to storage
+async def test_id_caches_prewarmed_after_restart(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Test the ids cached by the last run are cached when the next run starts."""
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass) as instance,
+    ):
+        await hass.async_start()
+        hass.states.async_set("sensor.cached", "on", {"cached": True})
+        hass.bus.async_fire("cached_event", {"cached": True})
+        await async_wait_recording_done(hass)
+        metadata_id = instance.states_meta_manager.get_from_cache("sensor.cached")
+        assert metadata_id is not None
+        await hass.async_stop()
+        id_caches_path = hass.config.path(recorder.core.ID_CACHES_FILENAME)
+        assert os.path.exists(id_caches_path)
+
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass) as instance,
+    ):
+        await hass.async_start()
+        await async_wait_recording_done(hass)
+        # The snapshot is only used once
+        assert not os.path.exists(id_caches_path)
+        assert (
+            instance.states_meta_manager.get_from_cache("sensor.cached") == metadata_id
+        )
+        assert instance.event_type_manager.get_from_cache("cached_event") is not None
+        assert instance.event_data_manager.get_from_cache('{"cached":true}') is not None
+        assert (
+            instance.state_attributes_manager.get_from_cache('{"cached":true}')
+            is not None
+        )
+        await hass.async_stop()
+
+
+async def test_id_caches_of_another_run_discarded(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a snapshot of another run or schema is not loaded."""
+    managers = {"states_meta": recorder_mock.states_meta_manager}
+    path = hass.config.path("recorder.id_caches")
+    snapshot = {
+        "version": 1,
+        "schema_version": 48,
+        "run_id": 1,
+        "caches": {"states_meta": [["sensor.other", 1], ["sensor.last", 2]]},
+    }
+
+    for schema_version, last_run_id in ((49, 1), (48, 2)):
+        await hass.async_add_executor_job(recorder.id_cache.save_json, path, snapshot)
+        assert load_id_caches(path, schema_version, last_run_id, managers) == 0
+        assert not os.path.exists(path)
+        assert recorder_mock.states_meta_manager.get_from_cache("sensor.other") is None
+
+    await hass.async_add_executor_job(recorder.id_cache.save_json, path, snapshot)
+    assert load_id_caches(path, 48, 1, managers) == 2
+    # The most recently used id stays the most recently used
+    assert recorder_mock.states_meta_manager.snapshot()[-1] == ("sensor.last", 2)
+    assert recorder_mock.states_meta_manager.get_from_cache("sensor.other") == 1
+
+    # A missing snapshot is not an error
+    assert load_id_caches(path, 48, 1, managers) == 0
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Generator
 from datetime import datetime, timedelta
+import os
 import sqlite3
 import sys
 import threading
@@ -58,6 +59,10 @@ from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
+from homeassistant.components.recorder.spill_queue import (
+    SpillQueue,
+    event_to_spill_line,
+)
 from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
@@ -134,6 +139,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_partitioning=False,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
     )
@@ -394,19 +400,13 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+        patch(
+            "homeassistant.components.recorder.core.bulk_insert_states",
+            side_effect=OperationalError(
+                "insert the state", "fake params", "forced to fail"
+            ),
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -437,19 +437,13 @@ async def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+        patch(
+            "homeassistant.components.recorder.core.bulk_insert_states",
+            side_effect=SQLAlchemyError(
+                "insert the state", "fake params", "forced to fail"
+            ),
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -2026,6 +2020,153 @@ async def test_database_lock_and_overflow_checks_available_memory(
     assert start_time.count(":") == 2
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_queue_overflow_spills_events(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test events are spilled to disk and replayed in order when the queue overflows.
+
+    Use file DB, in memory DB cannot do write locks.
+    """
+    with patch.object(recorder.core, "QUEUE_CHECK_INTERVAL", timedelta(seconds=1)):
+        instance = await async_setup_recorder_instance(
+            hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+        )
+    spill_path = hass.config.path(recorder.core.SPILL_QUEUE_FILENAME)
+
+    with (
+        patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(
+            recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
+        ),
+        patch.object(recorder.core, "SPILL_QUEUE_REPLAY_BATCH", 2),
+    ):
+        # Keep the recorder busy so the events stay in the queue
+        processed = threading.Event()
+        release = threading.Event()
+
+        def _block(*args: Any) -> None:
+            processed.set()
+            release.wait()
+
+        with patch.object(instance, "_process_one_event", side_effect=_block):
+            hass.states.async_set("test.spill", "0")
+            await hass.async_add_executor_job(processed.wait)
+            hass.states.async_set("test.spill", "1")
+            hass.states.async_set("test.spill", "2")
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+            await hass.async_block_till_done()
+            assert "will write new events to" in caplog.text
+            assert instance.recording
+            for state in range(3, 8):
+                hass.states.async_set("test.spill", str(state))
+            await hass.async_block_till_done()
+            assert instance.spill_queue_depth == 5
+            assert await hass.async_add_executor_job(os.path.exists, spill_path)
+            release.set()
+
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    assert "replayed all events from the spill queue" in caplog.text
+    assert instance.spill_queue_depth == 0
+    assert not await hass.async_add_executor_job(os.path.exists, spill_path)
+
+    hass.states.async_set("test.spill", "8")
+    await async_wait_recording_done(hass)
+
+    def _get_db_states() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                state
+                for (state,) in session.query(States.state)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "test.spill")
+                .order_by(States.state_id)
+            ]
+
+    # The first state was swallowed by the patched recorder
+    assert await instance.async_add_executor_job(_get_db_states) == [
+        str(idx) for idx in range(1, 9)
+    ]
+
+
+async def test_spill_queue_replayed_on_start(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test events left in the spill queue by a previous run are recorded."""
+    spill_queue = SpillQueue(
+        hass.config.path(recorder.core.SPILL_QUEUE_FILENAME), 1024**2
+    )
+    lines = [
+        event_to_spill_line(Event("spilled_event", {"idx": idx})) for idx in range(3)
+    ]
+    await hass.async_add_executor_job(spill_queue.append, lines)
+
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    def _get_db_events() -> list[Events]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(
+                session.query(Events).filter(
+                    Events.event_type_id.in_(select_event_type_ids(("spilled_event",)))
+                )
+            )
+
+    db_events = await instance.async_add_executor_job(_get_db_events)
+    assert len(db_events) == 3
+    assert instance.spill_queue_depth == 0
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_only_executor(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test read only jobs use the read only pool.
+
+    On-disk database because in memory databases do not have a read only pool.
+    """
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    def _get_db_states() -> tuple[bool, list[str]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                session.get_bind() is instance.read_only_engine,
+                [db_state.state for db_state in session.query(States)],
+            )
+
+    assert await instance.async_add_read_only_executor_job(_get_db_states) == (
+        True,
+        ["on"],
+    )
+    # Other threads keep using the connections of the recorder
+    assert await instance.async_add_executor_job(_get_db_states) == (False, ["on"])
+
+    def _add_event_type() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            session.add(EventTypes(event_type="not_written"))
+            session.commit()
+
+    with pytest.raises(OperationalError, match="readonly"):
+        await instance.async_add_read_only_executor_job(_add_event_type)
+
+    stats = instance.read_only_pool_stats
+    assert stats["completed"] == 2
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 async def test_database_lock_timeout(
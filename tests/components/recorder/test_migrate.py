@@ -500,7 +500,7 @@ async def test_events_during_migration_queue_exhausted(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     instrument_migration: InstrumentedMigration,
 ) -> None:
-    """Test that events during migration takes so long the queue is exhausted."""
+    """Test events are spilled when migration takes so long the queue is exhausted."""
 
     assert recorder.util.async_migration_in_progress(hass) is False
 
@@ -533,16 +533,21 @@ async def test_events_during_migration_queue_exhausted(
         await async_wait_recording_done(hass)
 
     assert recorder.util.async_migration_in_progress(hass) is False
-    db_states = await recorder.get_instance(hass).async_add_executor_job(
+    instance = recorder.get_instance(hass)
+    assert instance.recording
+    assert instance.spill_queue_depth == 0
+    db_states = await instance.async_add_executor_job(
         _get_native_states, hass, "my.entity"
     )
-    assert len(db_states) == 1
+    # The state set after the queue was exhausted was
+    # replayed from the spill queue
+    assert [state.state for state in db_states] == ["on", "off"]
     hass.states.async_set("my.entity", "on", {})
     await async_wait_recording_done(hass)
-    db_states = await recorder.get_instance(hass).async_add_executor_job(
+    db_states = await instance.async_add_executor_job(
         _get_native_states, hass, "my.entity"
     )
-    assert len(db_states) == 2
+    assert len(db_states) == 3
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,238 @@
+"""Test the tables partitioned by day."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm.session import Session
+
+from homeassistant.components.recorder import Recorder, migration
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.partition import (
+    PARTITIONS_AHEAD_DAYS,
+    day_start_timestamp,
+    get_partition_days,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+PARTITION_DAY = date(2020, 1, 1)
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def test_get_partition_days() -> None:
+    """Test the days of the partitions are found from their names."""
+    session = MagicMock()
+    session.execute.return_value = [
+        ("states_p20200102",),
+        ("states_default",),
+        ("states_p20200101",),
+        ("states_pbroken",),
+    ]
+    assert get_partition_days(session, "states") == [
+        date(2020, 1, 1),
+        date(2020, 1, 2),
+    ]
+
+
+def test_partition_tables() -> None:
+    """Test the tables are rebuilt as tables partitioned by day."""
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = day_start_timestamp(
+        PARTITION_DAY
+    )
+    today = PARTITION_DAY + timedelta(days=2)
+
+    with patch.object(
+        migration, "get_partitioned_tables", return_value={"events"}
+    ) as get_partitioned_tables:
+        assert migration.partition_tables(lambda: session, today)
+    assert len(get_partitioned_tables.mock_calls) == 1
+
+    statements = [str(call.args[0]) for call in session.execute.mock_calls if call.args]
+    partitions = [
+        statement
+        for statement in statements
+        if "PARTITION OF states_temp_" in statement
+    ]
+    # The default partition and the partitions from the oldest row until ahead
+    assert len(partitions) == 1 + 3 + PARTITIONS_AHEAD_DAYS
+    assert "states_p20200101 PARTITION OF" in partitions[1]
+    assert any(
+        statement.startswith("CREATE TABLE statistics_short_term_temp_")
+        and statement.endswith("PARTITION BY RANGE (start_ts)")
+        for statement in statements
+    )
+    assert not any("events_temp_" in statement for statement in statements)
+    assert any(
+        "SELECT" in statement and "COALESCE(last_updated_ts, 0)" in statement
+        for statement in statements
+    )
+    assert "DROP TABLE states" in statements
+    assert (
+        "ALTER TABLE states ADD CONSTRAINT states_pkey"
+        " PRIMARY KEY (state_id, last_updated_ts)"
+    ) in statements
+
+    # The foreign key on old_state_id is not recreated
+    foreign_keys = [
+        str(call.args[0].element.elements[0].column)
+        for call in session.connection.return_value.execute.mock_calls
+        if call.args
+    ]
+    assert "states.state_id" not in foreign_keys
+    assert "state_attributes.attributes_id" in foreign_keys
+    assert "statistics_meta.id" in foreign_keys
+
+
+def test_partition_tables_fails(caplog: pytest.LogCaptureFixture) -> None:
+    """Test the original tables are kept if partitioning fails."""
+    session = MagicMock()
+    session.execute.side_effect = OperationalError("statement", {}, Exception())
+
+    with patch.object(
+        migration,
+        "get_partitioned_tables",
+        return_value={"events", "statistics_short_term"},
+    ):
+        assert not migration.partition_tables(lambda: session, PARTITION_DAY)
+    assert "Error partitioning PostgreSQL table states" in caplog.text
+
+
+async def test_partitioning_requires_postgresql(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test partitioning is only supported with PostgreSQL."""
+    instance = await async_setup_recorder_instance(hass, {"db_partitioning": True})
+    await async_wait_recording_done(hass)
+    assert (
+        "Partitioning the database tables is only supported with PostgreSQL"
+        in caplog.text
+    )
+    assert instance.partitioned_tables == set()
+
+
+def _get_partition_days(session: Session, table_name: str) -> list[date]:
+    """Return the day of the partition if the table has not been dropped."""
+    if session.execute(
+        text("SELECT name FROM sqlite_master WHERE name = :name"),
+        {"name": f"{table_name}_p20200101"},
+    ).first():
+        return [PARTITION_DAY]
+    return []
+
+
+async def test_purge_drops_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging drops the partitions older than purge_before.
+
+    SQLite does not support partitioned tables, the partitions
+    are tables with the same columns as the partitioned table.
+    """
+    partition_ts = day_start_timestamp(PARTITION_DAY)
+    with session_scope(hass=hass) as session:
+        # The states refer to states in the partitions, which
+        # are not referenced by a foreign key on PostgreSQL
+        session.connection().execute(text("PRAGMA foreign_keys=OFF"))
+    with session_scope(hass=hass) as session:
+        for table_name in ("states", "events", "statistics_short_term"):
+            session.execute(
+                text(
+                    f"CREATE TABLE {table_name}_p20200101 AS"  # noqa: S608
+                    f" SELECT * FROM {table_name} WHERE 0"
+                )
+            )
+        states_meta = StatesMeta(entity_id="sensor.partition")
+        shared_attributes = StateAttributes(shared_attrs="{}", hash=1)
+        dropped_attributes = StateAttributes(shared_attrs='{"old": 1}', hash=2)
+        dropped_data = EventData(shared_data='{"old": 1}', hash=3)
+        session.add_all(
+            (states_meta, shared_attributes, dropped_attributes, dropped_data)
+        )
+        session.flush()
+        for state_id, attributes_id in (
+            (1000, shared_attributes.attributes_id),
+            (1001, dropped_attributes.attributes_id),
+        ):
+            session.execute(
+                text(
+                    "INSERT INTO states_p20200101"
+                    " (state_id, last_updated_ts, attributes_id, metadata_id)"
+                    " VALUES (:state_id, :ts, :attributes_id, :metadata_id)"
+                ),
+                {
+                    "state_id": state_id,
+                    "ts": partition_ts,
+                    "attributes_id": attributes_id,
+                    "metadata_id": states_meta.metadata_id,
+                },
+            )
+        session.execute(
+            text(
+                "INSERT INTO events_p20200101 (event_id, time_fired_ts, data_id)"
+                " VALUES (1000, :ts, :data_id)"
+            ),
+            {"ts": partition_ts, "data_id": dropped_data.data_id},
+        )
+        session.add(
+            States(
+                state="on",
+                last_updated_ts=dt_util.utcnow().timestamp(),
+                old_state_id=1001,
+                attributes_id=shared_attributes.attributes_id,
+                metadata_id=states_meta.metadata_id,
+            )
+        )
+        shared_attributes_id = shared_attributes.attributes_id
+        dropped_data_id = dropped_data.data_id
+
+    recorder_mock.partitioned_tables = {"states", "events", "statistics_short_term"}
+    recorder_mock.states_manager._last_committed_id["sensor.partition"] = 1001
+    with patch(
+        "homeassistant.components.recorder.partition.get_partition_days",
+        side_effect=_get_partition_days,
+    ):
+        purge_before = dt_util.utcnow() - timedelta(days=1)
+        # The partitions are dropped before the rows are purged
+        assert not purge_old_data(recorder_mock, purge_before, repack=False)
+        assert purge_old_data(recorder_mock, purge_before, repack=False)
+
+    assert recorder_mock.states_manager.committed_state_ids == set()
+    with session_scope(hass=hass) as session:
+        assert (
+            session.execute(
+                text("SELECT name FROM sqlite_master WHERE name LIKE '%_p20200101'")
+            ).all()
+            == []
+        )
+        state = session.query(States).one()
+        assert state.old_state_id is None
+        # The attributes that are still used by other states are kept
+        assert [
+            attributes.attributes_id for attributes in session.query(StateAttributes)
+        ] == [shared_attributes_id]
+        assert session.get(EventData, dropped_data_id) is None
+    with session_scope(hass=hass) as session:
+        session.connection().execute(text("PRAGMA foreign_keys=ON"))
@@ -25,7 +25,13 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    DEFAULT_EVENTS_BATCHES_PER_PURGE,
+    DEFAULT_STATES_BATCHES_PER_PURGE,
+    PURGE_SLICE_TARGET_SECONDS,
+    PurgeProgress,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -110,6 +116,57 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_in_slices(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test a purge runs in slices that grow while they are fast."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 12),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 12),
+        patch(
+            "homeassistant.components.recorder.purge.purge_old_data",
+            wraps=purge_old_data,
+        ) as purge_old_data_mock,
+    ):
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        recorder_mock.queue_task(PurgeTask(purge_before, False, False))
+        await async_wait_purge_done(hass)
+
+    assert [
+        call.kwargs["states_batch_size"] for call in purge_old_data_mock.mock_calls
+    ] == [1, 2, 4]
+    progress = recorder_mock.purge_progress
+    assert progress.purge_before == purge_before
+    assert progress.slices == 3
+    assert progress.finished is not None
+    assert progress.remaining_states == 0
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+
+
+def test_purge_progress_batch_size() -> None:
+    """Test the batch size of a purge adapts to the duration of the slices."""
+    progress = PurgeProgress(dt_util.utcnow(), dt_util.utcnow())
+    for _ in range(10):
+        progress.add_slice(0.1)
+    assert progress.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE
+    assert progress.events_batch_size == DEFAULT_EVENTS_BATCHES_PER_PURGE
+    # A slice within the target keeps the batch size
+    progress.add_slice(PURGE_SLICE_TARGET_SECONDS * 0.75)
+    assert progress.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE
+    progress.add_slice(PURGE_SLICE_TARGET_SECONDS * 2)
+    assert progress.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE // 2
+    assert progress.events_batch_size == DEFAULT_EVENTS_BATCHES_PER_PURGE // 2
+    for _ in range(10):
+        progress.add_slice(PURGE_SLICE_TARGET_SECONDS * 2)
+    assert progress.states_batch_size == 1
+    assert progress.events_batch_size == 1
+    assert progress.slices == 22
+    assert progress.last_slice_seconds == PURGE_SLICE_TARGET_SECONDS * 2
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     assert recorder_mock.states_manager.oldest_ts is None
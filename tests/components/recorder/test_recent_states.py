@@ -0,0 +1,192 @@
+"""Test the recent states kept for compiling statistics."""
+
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.recorder.recent_states import RecentStates
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+ATTRIBUTES = {"state_class": "measurement"}
+
+
+def _state_changed(
+    entity_id: str,
+    old_state: State | None,
+    state: str | None,
+    when: datetime,
+    changed: bool = True,
+    attributes: dict[str, str] = ATTRIBUTES,
+) -> Event:
+    """Return a state_changed event."""
+    new_state = None
+    if state is not None:
+        new_state = State(
+            entity_id,
+            state,
+            attributes,
+            last_changed=when
+            if changed or old_state is None
+            else old_state.last_changed,
+            last_updated=when,
+        )
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+        time_fired_timestamp=when.timestamp(),
+    )
+
+
+def _history(
+    history: dict[str, list[State]],
+) -> dict[str, list[tuple[str, datetime, datetime]]]:
+    """Return the states, last_changed and last_updated of the history."""
+    return {
+        entity_id: [
+            (state.state, state.last_changed, state.last_updated) for state in states
+        ]
+        for entity_id, states in history.items()
+    }
+
+
+def _expected(*states: State) -> list[tuple[str, datetime, datetime]]:
+    """Return the states, last_changed and last_updated of states."""
+    return [(state.state, state.last_changed, state.last_updated) for state in states]
+
+
+def test_recent_states(freezer: FrozenDateTimeFactory) -> None:
+    """Test states of a period are served from memory when they are complete."""
+    zero = dt_util.utcnow()
+    before = State(
+        "sensor.one", "0", ATTRIBUTES, last_updated=zero - timedelta(hours=1)
+    )
+    recent_states = RecentStates()
+    recent_states.add(_state_changed("sensor.one", before, "1", zero))
+    recent_states.add_domain("sensor")
+
+    period_start = zero + timedelta(minutes=5)
+    period_end = zero + timedelta(minutes=10)
+    one = State("sensor.one", "5", ATTRIBUTES, last_updated=period_end)
+    two = State("sensor.two", "2", ATTRIBUTES, last_updated=zero - timedelta(hours=1))
+    three = State(
+        "sensor.three", "3", ATTRIBUTES, last_updated=zero - timedelta(hours=1)
+    )
+    light = State("light.kitchen", "on", last_updated=zero - timedelta(hours=1))
+
+    # Nothing is served for a period that started before the domain was kept
+    assert recent_states.get_period(
+        [one, light], zero - timedelta(minutes=5), zero, False
+    ) == ({}, ["sensor.one", "light.kitchen"])
+
+    events = [
+        _state_changed("sensor.one", before, "2", zero + timedelta(minutes=1)),
+        _state_changed("sensor.three", three, None, zero + timedelta(minutes=8)),
+    ]
+    events.append(
+        _state_changed(
+            "sensor.one",
+            events[0].data["new_state"],
+            "3",
+            zero + timedelta(minutes=6),
+        )
+    )
+    events.append(
+        _state_changed(
+            "sensor.one",
+            events[2].data["new_state"],
+            "3",
+            zero + timedelta(minutes=7),
+            changed=False,
+        )
+    )
+    events.append(
+        _state_changed("sensor.one", events[3].data["new_state"], "5", period_end)
+    )
+    for event in events:
+        recent_states.add(event)
+
+    # The state before the start, the state changes during the period and
+    # the current state of entities that did not change are returned
+    history, missing = recent_states.get_period(
+        [one, two, three, light], period_start, period_end, False
+    )
+    assert missing == ["sensor.three", "light.kitchen"]
+    assert _history(history) == {
+        "sensor.one": _expected(
+            events[0].data["new_state"],
+            events[2].data["new_state"],
+            events[3].data["new_state"],
+        ),
+        "sensor.two": _expected(two),
+    }
+    # The attributes are shared with the recorded state
+    assert history["sensor.one"][0].attributes is events[0].data["new_state"].attributes
+    # Only changes of the state are significant
+    history, _ = recent_states.get_period([one], period_start, period_end, True)
+    assert _history(history) == {
+        "sensor.one": _expected(
+            events[0].data["new_state"], events[2].data["new_state"]
+        )
+    }
+
+    # The state changed after the end of the period and
+    # the state change has not been recorded yet
+    two_changed = State("sensor.two", "4", last_updated=period_end)
+    assert recent_states.get_period([two_changed], period_start, period_end, False) == (
+        {},
+        ["sensor.two"],
+    )
+
+    # The next period prunes the states of the previous
+    # period which can no longer be served
+    history, missing = recent_states.get_period(
+        [one], period_end, period_end + timedelta(minutes=5), False
+    )
+    assert _history(history) == {
+        "sensor.one": _expected(
+            events[3].data["new_state"], events[4].data["new_state"]
+        )
+    }
+    assert missing == []
+    assert recent_states.get_period([one], period_start, period_end, False) == (
+        {},
+        ["sensor.one"],
+    )
+
+    # The states are dropped when they may have been lost
+    freezer.move_to(period_end + timedelta(minutes=1))
+    recent_states.reset()
+    assert recent_states.get_period(
+        [one], period_end, period_end + timedelta(minutes=5), False
+    ) == ({}, ["sensor.one"])
+
+
+def test_recent_states_without_state_class() -> None:
+    """Test entities without a state class are served from the database."""
+    zero = dt_util.utcnow()
+    recent_states = RecentStates()
+    recent_states.add_domain("sensor")
+    period_start = zero + timedelta(minutes=5)
+    period_end = zero + timedelta(minutes=10)
+    event = _state_changed("sensor.one", None, "1", period_start, attributes={})
+    recent_states.add(event)
+    one = event.data["new_state"]
+
+    assert recent_states.get_period([one], period_start, period_end, False) == (
+        {},
+        ["sensor.one"],
+    )
+    # The entity is served from memory once it has a state class
+    # from before the start of the period
+    event = _state_changed("sensor.one", one, "2", period_end + timedelta(minutes=1))
+    recent_states.add(event)
+    history, missing = recent_states.get_period(
+        [event.data["new_state"]],
+        period_end + timedelta(minutes=5),
+        period_end + timedelta(minutes=10),
+        False,
+    )
+    assert _history(history) == {"sensor.one": _expected(event.data["new_state"])}
+    assert missing == []
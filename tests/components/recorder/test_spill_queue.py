@@ -0,0 +1,91 @@
+"""Test the recorder spill queue."""
+
+from pathlib import Path
+
+from homeassistant.components.recorder.spill_queue import (
+    SpillQueue,
+    event_to_spill_line,
+    spill_line_to_event,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+
+
+def test_event_round_trip() -> None:
+    """Test events are restored from the spill queue."""
+    context = Context(user_id="abc", parent_id="01J0000000000000000000000")
+    old_state = State("sensor.test", "1", {"unit": "W"})
+    new_state = State("sensor.test", "2", {"unit": "W"}, context=context)
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.test", "old_state": old_state, "new_state": new_state},
+        EventOrigin.remote,
+        1700000000.123456,
+        context,
+    )
+
+    line = event_to_spill_line(event)
+    assert line is not None
+    assert line.endswith(b"\n")
+    restored = spill_line_to_event(line)
+    assert restored is not None
+    assert restored.event_type == EVENT_STATE_CHANGED
+    assert restored.origin is EventOrigin.remote
+    assert restored.time_fired_timestamp == event.time_fired_timestamp
+    assert restored.context.id == context.id
+    assert restored.context.user_id == context.user_id
+    assert restored.context.parent_id == context.parent_id
+    assert restored.data["entity_id"] == "sensor.test"
+    assert restored.data["old_state"].as_dict() == old_state.as_dict()
+    assert restored.data["new_state"].state == "2"
+    assert restored.data["new_state"].attributes == {"unit": "W"}
+    assert (
+        restored.data["new_state"].last_updated_timestamp
+        == new_state.last_updated_timestamp
+    )
+
+    removed = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.test", "old_state": new_state, "new_state": None},
+    )
+    restored = spill_line_to_event(event_to_spill_line(removed))
+    assert restored.data["new_state"] is None
+
+    assert event_to_spill_line(Event("test", {"not_json": object()})) is None
+    assert spill_line_to_event(b'["test", {}, 0') is None
+
+
+def test_spill_queue(tmp_path: Path) -> None:
+    """Test the spill queue keeps order and bounds the disk usage."""
+    path = tmp_path / "spill"
+    spill_queue = SpillQueue(str(path), 100)
+
+    assert spill_queue.read(10) == []
+    assert spill_queue.append([b"1\n", b"2\n", b"3\n"])
+    assert spill_queue.append([b"4\n"])
+    assert spill_queue.depth == 4
+    assert spill_queue.read(3) == [b"1\n", b"2\n", b"3\n"]
+    assert spill_queue.depth == 1
+    assert spill_queue.append([b"5\n"])
+    assert spill_queue.read(3) == [b"4\n", b"5\n"]
+    assert spill_queue.depth == 0
+    # The file is removed once it has been read
+    assert not path.exists()
+
+    assert not spill_queue.append([b"x" * 101])
+    assert spill_queue.full
+    assert not spill_queue.append([b"6\n"])
+    assert spill_queue.depth == 0
+
+    spill_queue = SpillQueue(str(path), 100)
+    assert spill_queue.append([b"1\n", b"2\n", b"3\n"])
+    assert spill_queue.read(1) == [b"1\n"]
+    # Closing drops the lines already read so the next run only
+    # replays the rest of the queue
+    spill_queue.close()
+    assert path.read_bytes() == b"2\n3\n"
+
+    spill_queue = SpillQueue(str(path), 100)
+    assert spill_queue.load() == 2
+    assert spill_queue.read(10) == [b"2\n", b"3\n"]
+    assert not path.exists()
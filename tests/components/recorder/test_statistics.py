@@ -29,6 +29,7 @@ from homeassistant.components.recorder.statistics import (
     get_metadata,
     get_metadata_with_session,
     get_short_term_statistics_run_cache,
+    get_statistics_during_period_cache,
     list_statistic_ids,
     validate_statistics,
 )
@@ -472,6 +473,75 @@ async def test_statistics_during_period_set_back_compat(
     )
 
 
+async def test_statistics_during_period_cache(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test results of statistics_during_period are cached until they change."""
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 01:00:00"))
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        ({"start": period1, "last_reset": None, "state": 0, "sum": 2},),
+    )
+    await async_wait_recording_done(hass)
+    cache = get_statistics_during_period_cache(hass)
+
+    stats = statistics_during_period(
+        hass, period1, statistic_ids={"test:total_energy_import"}
+    )
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [2]
+    assert cache.stats == {"hits": 0, "misses": 1, "size": 1}
+
+    # Callers can modify the result without changing the cached result
+    stats["test:total_energy_import"][0]["sum"] = 100
+    stats = statistics_during_period(
+        hass, period1, statistic_ids={"test:total_energy_import"}
+    )
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [2]
+    assert cache.stats == {"hits": 1, "misses": 1, "size": 1}
+
+    # Importing statistics clears the cache
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        ({"start": period2, "last_reset": None, "state": 1, "sum": 3},),
+    )
+    await async_wait_recording_done(hass)
+    assert cache.stats["size"] == 0
+    stats = statistics_during_period(
+        hass, period1, statistic_ids={"test:total_energy_import"}
+    )
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [2, 3]
+
+    # Compiling statistics only drops the results of periods ending after it
+    statistics_during_period(
+        hass, period1, period2, statistic_ids={"test:total_energy_import"}
+    )
+    assert cache.stats["size"] == 2
+    cache.invalidate_after(period2.timestamp())
+    assert cache.stats["size"] == 1
+    statistics_during_period(
+        hass, period1, period2, statistic_ids={"test:total_energy_import"}
+    )
+    assert cache.stats == {"hits": 2, "misses": 3, "size": 1}
+
+    # Results read before an invalidation are not cached
+    _, generation = cache.get("key")
+    cache.clear()
+    cache.set("key", generation, period2.timestamp(), {})
+    assert cache.stats["size"] == 0
+
+
 async def test_rename_entity_collision(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -1844,6 +1914,76 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize(
+    "factory",
+    [
+        statistics.reduce_day_ts_factory,
+        statistics.reduce_week_ts_factory,
+        statistics.reduce_month_ts_factory,
+    ],
+)
+async def test_reduce_statistics_vectorized(
+    hass: HomeAssistant, timezone: str, factory: Any
+) -> None:
+    """Test reducing statistics with NumPy matches reducing them row by row."""
+    await hass.config.async_set_time_zone(timezone)
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-01-01 00:00:00"))
+    stats: dict[str, list[dict[str, Any]]] = {
+        "sensor.mean": [],
+        "sensor.sum": [],
+    }
+    # A year of hourly statistics with gaps and missing values
+    for hour in range(365 * 24):
+        if hour % 97 in (3, 4, 5):
+            continue
+        hour_start = (start + timedelta(hours=hour)).timestamp()
+        value = None if hour % 13 == 0 else hour % 37 - 10.5
+        stats["sensor.mean"].append(
+            {
+                "start": hour_start,
+                "end": hour_start + 3600,
+                "mean": value,
+                "min": None if value is None else value - 1,
+                "max": None if value is None else value + 1,
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        )
+        if hour % 5:
+            stats["sensor.sum"].append(
+                {
+                    "start": hour_start,
+                    "end": hour_start + 3600,
+                    "mean": None,
+                    "min": None,
+                    "max": None,
+                    "last_reset": None,
+                    "state": hour,
+                    "sum": hour * 0.5,
+                }
+            )
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    same_period, period_start_end = factory()
+
+    expected = statistics._reduce_statistics_per_row(
+        stats, same_period, period_start_end, timedelta(days=31), types
+    )
+    result = statistics._reduce_statistics_vectorized(stats, period_start_end, types)
+
+    assert result.keys() == expected.keys()
+    for statistic_id, rows in expected.items():
+        assert len(result[statistic_id]) == len(rows)
+        for row, expected_row in zip(result[statistic_id], rows, strict=True):
+            expected_mean = expected_row.pop("mean")
+            assert row.pop("mean") == (
+                None if expected_mean is None else pytest.approx(expected_mean)
+            )
+            assert row == expected_row
+    assert statistics._reduce_statistics_vectorized({}, period_start_end, types) == {}
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -13,6 +13,8 @@ import pytest
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
+from homeassistant.components.recorder.pool import READ_ONLY_POOL_SIZE
+from homeassistant.components.recorder.services import SERVICE_PURGE
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     get_last_statistics,
@@ -32,6 +34,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recording_done,
     create_engine_test,
     do_adhoc_statistics,
@@ -2560,11 +2563,55 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "read_only_pool": {
+            "completed": 0,
+            "max_wait": 0,
+            "max_workers": READ_ONLY_POOL_SIZE,
+            "queued": 0,
+            "running": 0,
+        },
         "recording": True,
+        "spill_queue_depth": 0,
+        "statistics_cache": {"hits": 0, "misses": 0, "size": 0},
         "thread_running": True,
     }
 
 
+async def test_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of the last purge."""
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    await hass.services.async_call(
+        recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 0}, blocking=True
+    )
+    await async_wait_purge_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "purge_before": ANY,
+        "started": ANY,
+        "finished": ANY,
+        "slices": ANY,
+        "last_slice_seconds": ANY,
+        "states_batch_size": ANY,
+        "events_batch_size": ANY,
+        "remaining_states": 0,
+        "remaining_events": 0,
+    }
+    assert response["result"]["finished"] is not None
+    assert response["result"]["slices"] > 0
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2654,6 +2701,10 @@ async def test_recorder_info_migration_queue_exhausted(
             async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=2))
             await hass.async_block_till_done()
 
+            # New events are written to the spill queue
+            hass.states.async_set("my.entity", "off", {})
+            await hass.async_block_till_done()
+
             client = await hass_ws_client()
 
             # Check the status
@@ -2661,7 +2712,8 @@ async def test_recorder_info_migration_queue_exhausted(
             response = await client.receive_json()
             assert response["success"]
             assert response["result"]["migration_in_progress"] is True
-            assert response["result"]["recording"] is False
+            assert response["result"]["recording"] is True
+            assert response["result"]["spill_queue_depth"] > 0
             assert response["result"]["thread_running"] is True
 
             # Let migration finish
@@ -2674,6 +2726,7 @@ async def test_recorder_info_migration_queue_exhausted(
             assert response["success"]
             assert response["result"]["migration_in_progress"] is False
             assert response["result"]["recording"] is True
+            assert response["result"]["spill_queue_depth"] == 0
             assert response["result"]["thread_running"] is True
 
 
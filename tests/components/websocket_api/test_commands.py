@@ -17,9 +17,12 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import (
+    async_get_entity_changes_fanout,
+)
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1310,6 +1313,46 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shared_fanout(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test subscribe_entities subscriptions share one listener and frame."""
+    fanout = async_get_entity_changes_fanout(hass)
+    assert async_get_entity_changes_fanout(hass) is fanout
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    first: list[bytes] = []
+    second: list[bytes] = []
+    other_id: list[bytes] = []
+    filtered: list[bytes] = []
+
+    unsubs = [
+        fanout.async_subscribe(first.append, None, None, hass_admin_user, b"7"),
+        fanout.async_subscribe(second.append, None, None, hass_admin_user, b"7"),
+        fanout.async_subscribe(other_id.append, None, None, hass_admin_user, b"9"),
+        fanout.async_subscribe(
+            filtered.append, {"light.other"}, None, hass_admin_user, b"7"
+        ),
+    ]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert len(first) == len(second) == len(other_id) == 1
+    assert filtered == []
+    assert first[0] is second[0]
+    assert json_loads(first[0])["id"] == 7
+    assert json_loads(other_id[0])["id"] == 9
+    assert json_loads(first[0])["event"] == json_loads(other_id[0])["event"]
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(first) == 1
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
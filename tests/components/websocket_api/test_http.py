@@ -3,7 +3,7 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -16,6 +16,7 @@ from homeassistant.components.websocket_api import (
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -46,6 +47,67 @@ async def test_pending_msg_overflow(
     assert msg.type is WSMsgType.CLOSE
 
 
+async def test_subscribe_entities_coalescing(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test pending entity changes are coalesced when the client falls behind."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"coalesce_threshold": 2}}
+    )
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.one", "light.two"}
+
+    # The writer cannot run until we yield so the changes pile up
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.one", "on", {"brightness": 100})
+    hass.states.async_set("light.one", "off", {"brightness": 50})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "a": {
+            "light.one": {
+                "a": {"brightness": 50},
+                "c": ANY,
+                "lc": ANY,
+                "s": "off",
+            }
+        }
+    }
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {"c": {"light.two": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+
+    coalescing = hass.data[const.DATA_COALESCING]
+    assert coalescing.threshold == 2
+    assert coalescing.coalesced_messages == 2
+    assert coalescing.coalescing_connections == 1
+
+    # Below the threshold every change is sent
+    hass.states.async_set("light.two", "off")
+    await hass.async_block_till_done()
+    hass.states.async_set("light.two", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.two": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"light.two": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+    assert coalescing.coalesced_messages == 2
+
+    await websocket_client.close()
+    await hass.async_block_till_done()
+    assert coalescing.coalesced_messages == 2
+    assert coalescing.coalescing_connections == 0
+
+
 async def test_cleanup_on_cancellation(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
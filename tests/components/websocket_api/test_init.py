@@ -11,6 +11,7 @@ from homeassistant.components.websocket_api import (
     messages,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
 
 
 async def test_invalid_message_format(websocket_client) -> None:
@@ -89,3 +90,10 @@ async def test_invalid_vol(hass: HomeAssistant, websocket_client) -> None:
     assert not msg["success"]
     assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
     assert "expected str for dictionary value" in msg["error"]["message"]
+
+
+async def test_setup_without_options(hass: HomeAssistant) -> None:
+    """Test setting up the websocket API with a bare websocket_api key."""
+    assert await async_setup_component(hass, "websocket_api", {"websocket_api": None})
+    coalescing = hass.data[const.DATA_COALESCING]
+    assert coalescing.threshold == const.DEFAULT_COALESCE_THRESHOLD
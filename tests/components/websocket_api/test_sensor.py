@@ -1,9 +1,12 @@
 """Test cases for the API stream sensor."""
 
 from homeassistant.auth.providers.homeassistant import HassAuthProvider
+from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import TYPE_AUTH_REQUIRED
 from homeassistant.components.websocket_api.http import URL
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.setup import async_setup_component
 
 from .test_auth import test_auth_active_with_token
@@ -45,3 +48,31 @@ async def test_websocket_api(
 
     state = hass.states.get("sensor.connected_clients")
     assert state.state == "0"
+
+
+async def test_coalescing_sensors(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the coalescing diagnostic sensors."""
+    await async_setup_component(
+        hass, "sensor", {"sensor": {"platform": "websocket_api"}}
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.coalesced_entity_changes").state == "0"
+    assert hass.states.get("sensor.coalescing_clients").state == "0"
+    assert entity_registry.async_get_entity_id(
+        "sensor", "websocket_api", "websocket_api_coalesced_entity_changes"
+    )
+    assert entity_registry.async_get_entity_id(
+        "sensor", "websocket_api", "websocket_api_coalescing_clients"
+    )
+
+    coalescing = hass.data[const.DATA_COALESCING]
+    coalescing.coalesced_messages = 12
+    coalescing.coalescing_connections = 2
+    await async_update_entity(hass, "sensor.coalesced_entity_changes")
+    await async_update_entity(hass, "sensor.coalescing_clients")
+
+    assert hass.states.get("sensor.coalesced_entity_changes").state == "12"
+    assert hass.states.get("sensor.coalescing_clients").state == "2"
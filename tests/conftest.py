@@ -11,6 +11,7 @@ import gc
 import itertools
 import logging
 import os
+from pathlib import Path
 import reprlib
 from shutil import rmtree
 import sqlite3
@@ -1496,6 +1497,7 @@ async def async_test_recorder(
     enable_migrate_event_type_ids: bool,
     enable_migrate_entity_ids: bool,
     enable_migrate_event_ids: bool,
+    tmp_path: Path,
 ) -> AsyncGenerator[RecorderInstanceGenerator]:
     """Yield context manager to setup recorder instance."""
     # pylint: disable-next=import-outside-toplevel
@@ -1627,6 +1629,11 @@ async def async_test_recorder(
             side_effect=debug_session_scope,
             autospec=True,
         ),
+        # Keep the id caches saved at shutdown out of the shared config dir
+        patch(
+            "homeassistant.components.recorder.core.ID_CACHES_FILENAME",
+            str(tmp_path / "recorder.id_caches"),
+        ),
     ):
 
         @asynccontextmanager
@@ -833,10 +833,15 @@ async def test_setup_source(hass: HomeAssistant) -> None:
             "domain": "test_platform",
         },
     }
+    assert entity.async_get_source_entity_ids(hass, "test_platform") == [
+        "test_domain.platform_config_source",
+        "test_domain.config_entry_source",
+    ]
 
     await platform.async_reset()
 
     assert entity.entity_sources(hass) == {}
+    assert entity.async_get_source_entity_ids(hass, "test_platform") == []
 
 
 async def test_removing_entity_unavailable(hass: HomeAssistant) -> None:
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -29,7 +30,9 @@ from homeassistant.helpers.event import (
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    TrackTemplateResultInfo,
     async_call_later,
+    async_get_shared_template_render_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -1756,6 +1759,171 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_untouched_fields(hass: HomeAssistant) -> None:
+    """Test templates are not re-rendered when fields they did not read change."""
+    hass.states.async_set(
+        "media_player.tv", "playing", {"volume_level": 0.5, "media_position": 1}
+    )
+    template_volume = Template(
+        "{{ state_attr('media_player.tv', 'volume_level') }}", hass
+    )
+    template_state = Template("{{ states('media_player.tv') }}", hass)
+    template_whole = Template(
+        "{{ states.media_player.tv.attributes.media_position }}", hass
+    )
+    for template in (template_volume, template_state, template_whole):
+        async_track_template_result(
+            hass, [TrackTemplate(template, None)], lambda event, updates: None
+        )
+    await hass.async_block_till_done()
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as render_to_info:
+        hass.states.async_set(
+            "media_player.tv", "playing", {"volume_level": 0.5, "media_position": 2}
+        )
+        await hass.async_block_till_done()
+        assert [call.args[0] for call in render_to_info.mock_calls] == [template_whole]
+
+        render_to_info.reset_mock()
+        hass.states.async_set(
+            "media_player.tv", "playing", {"volume_level": 0.6, "media_position": 2}
+        )
+        await hass.async_block_till_done()
+        assert [call.args[0] for call in render_to_info.mock_calls] == [
+            template_volume,
+            template_whole,
+        ]
+
+        render_to_info.reset_mock()
+        hass.states.async_set(
+            "media_player.tv", "paused", {"volume_level": 0.6, "media_position": 2}
+        )
+        await hass.async_block_till_done()
+        assert [call.args[0] for call in render_to_info.mock_calls] == [
+            template_state,
+            template_whole,
+        ]
+
+        # Templates are always re-rendered when the entity is removed
+        render_to_info.reset_mock()
+        hass.states.async_remove("media_player.tv")
+        await hass.async_block_till_done()
+        assert len(render_to_info.mock_calls) == 3
+
+
+async def test_track_template_result_shared_renders(hass: HomeAssistant) -> None:
+    """Test trackers of the same template share the render of a state change."""
+    results: list[tuple[str, str]] = []
+    source = (
+        "{{ states('sensor.outdoor') | float(0) + states('sensor.offset') | float(0) }}"
+    )
+
+    def _track(name: str, variables: dict[str, Any] | None = None) -> None:
+        @ha.callback
+        def _result(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            results.append((name, updates[0].result))
+            if name == "first" and updates[0].result == 10.0:
+                # Changes a state the template read before the others rendered
+                hass.states.async_set("sensor.offset", "1")
+
+        async_track_template_result(
+            hass, [TrackTemplate(Template(source, hass), variables)], _result
+        )
+
+    _track("first")
+    _track("unused_variables", {"this": "sensor.unused"})
+    _track("second")
+    # Templates reading their variables are not shared
+    source_variables = "{{ states('sensor.outdoor') | float(0) + offset }}"
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template(source_variables, hass), {"offset": 0})],
+        lambda event, updates: results.append(("variables", updates[0].result)),
+    )
+    await hass.async_block_till_done()
+    stats = async_get_shared_template_render_stats(hass)
+    assert (stats.renders, stats.shared, stats.ratio) == (0, 0, 0.0)
+
+    hass.states.async_set("sensor.outdoor", "5")
+    await hass.async_block_till_done()
+    assert results == [
+        ("first", 5.0),
+        ("unused_variables", 5.0),
+        ("second", 5.0),
+        ("variables", 5.0),
+    ]
+    assert (stats.renders, stats.shared) == (1, 2)
+    assert stats.ratio == 2 / 3
+
+    results.clear()
+    hass.states.async_set("sensor.outdoor", "10")
+    await hass.async_block_till_done()
+    # The others rendered again with the offset changed by the first
+    assert dict(results) == {
+        "first": 11.0,
+        "unused_variables": 11.0,
+        "second": 11.0,
+        "variables": 10.0,
+    }
+
+
+async def test_track_template_result_shared_renders_not_stale(
+    hass: HomeAssistant,
+) -> None:
+    """Test renders using the time or replayed by the rate limit are not shared."""
+    results: list[tuple[str, Any]] = []
+
+    def _track(name: str, source: str, rate_limit: float | None = None) -> None:
+        info = async_track_template_result(
+            hass,
+            [TrackTemplate(Template(source, hass), None, rate_limit)],
+            lambda event, updates: results.append((name, updates[0].result)),
+        )
+        infos.append(info)
+
+    infos: list[TrackTemplateResultInfo] = []
+    time_source = "{{ states('input_boolean.time') }} {{ now().isoformat() }}"
+    _track("time_first", time_source)
+    _track("time_second", time_source)
+    _track("limited", "{{ states.sensor | count }}", 0.1)
+    await hass.async_block_till_done()
+    stats = async_get_shared_template_render_stats(hass)
+
+    hass.states.async_set("input_boolean.time", "on")
+    await hass.async_block_till_done()
+    assert (stats.renders, stats.shared) == (2, 0)
+
+    results.clear()
+    hass.states.async_set("sensor.outdoor", "10")
+    await hass.async_block_till_done()
+    assert results == [("limited", 1)]
+    assert (stats.renders, stats.shared) == (3, 0)
+
+    # The rate limited tracker replays the event later without sharing
+    hass.states.async_set("sensor.indoor", "20")
+    await hass.async_block_till_done()
+    assert results == [("limited", 1)]
+    next_time = dt_util.utcnow() + timedelta(seconds=0.125)
+    with patch(
+        "homeassistant.helpers.ratelimit.time.time", return_value=next_time.timestamp()
+    ):
+        async_fire_time_changed(hass, next_time)
+        await hass.async_block_till_done()
+    assert results == [("limited", 1), ("limited", 2)]
+    assert (stats.renders, stats.shared) == (3, 0)
+
+    for info in infos:
+        info.async_remove()
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
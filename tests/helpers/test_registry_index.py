@@ -0,0 +1,115 @@
+"""Tests for the reverse indexes of the registries."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.registry_index import async_get_area_entities_index
+
+from tests.common import MockConfigEntry
+
+
+async def test_area_entities_index(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the area entities index follows the entity and device registries."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    kitchen = area_registry.async_create("Kitchen")
+    living_room = area_registry.async_create("Living room")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    assigned = entity_registry.async_get_or_create("light", "hue", "assigned")
+    entity_registry.async_update_entity(assigned.entity_id, area_id=living_room.id)
+
+    index = async_get_area_entities_index(hass)
+    assert index.async_get_entity_ids(living_room.id) == [assigned.entity_id]
+    assert index.async_get_entity_ids(kitchen.id) == []
+
+    # Entities without an area inherit the area of their device
+    inherited = entity_registry.async_get_or_create(
+        "light", "hue", "inherited", device_id=device.id
+    )
+    assert index.async_get_entity_ids(kitchen.id) == [inherited.entity_id]
+
+    device_registry.async_update_device(device.id, area_id=living_room.id)
+    assert index.async_get_entity_ids(kitchen.id) == []
+    assert index.async_get_entity_ids(living_room.id) == [
+        assigned.entity_id,
+        inherited.entity_id,
+    ]
+
+    # Disabled entities don't inherit the area of their device
+    entity_registry.async_update_entity(
+        inherited.entity_id, disabled_by=er.RegistryEntryDisabler.USER
+    )
+    assert index.async_get_entity_ids(living_room.id) == [assigned.entity_id]
+    entity_registry.async_update_entity(inherited.entity_id, disabled_by=None)
+
+    entity_registry.async_update_entity(inherited.entity_id, area_id=kitchen.id)
+    assert index.async_get_entity_ids(kitchen.id) == [inherited.entity_id]
+
+    entity_registry.async_update_entity(
+        inherited.entity_id, new_entity_id="light.renamed"
+    )
+    assert index.async_get_entity_ids(kitchen.id) == ["light.renamed"]
+
+    entity_registry.async_remove("light.renamed")
+    entity_registry.async_remove(assigned.entity_id)
+    assert index.async_get_entity_ids(kitchen.id) == []
+    assert index.async_get_entity_ids(living_room.id) == []
+
+
+async def test_area_entities_index_order(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the entities assigned to an area come before inherited entities."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    kitchen = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    inherited = entity_registry.async_get_or_create(
+        "light", "hue", "inherited", device_id=device.id
+    )
+    assigned = entity_registry.async_get_or_create("light", "hue", "assigned")
+
+    index = async_get_area_entities_index(hass)
+    assert index.async_get_entity_ids(kitchen.id) == [inherited.entity_id]
+
+    entity_registry.async_update_entity(assigned.entity_id, area_id=kitchen.id)
+    assert index.async_get_entity_ids(kitchen.id) == [
+        assigned.entity_id,
+        inherited.entity_id,
+    ]
+
+    # Moving the device away and back keeps the assigned entity first
+    device_registry.async_update_device(device.id, area_id=None)
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    assert index.async_get_entity_ids(kitchen.id) == [
+        assigned.entity_id,
+        inherited.entity_id,
+    ]
+
+    # An inherited entity which is assigned to the area moves to the front
+    entity_registry.async_update_entity(inherited.entity_id, area_id=kitchen.id)
+    entity_registry.async_update_entity(assigned.entity_id, device_id=device.id)
+    entity_registry.async_update_entity(assigned.entity_id, area_id=None)
+    assert index.async_get_entity_ids(kitchen.id) == [
+        inherited.entity_id,
+        assigned.entity_id,
+    ]
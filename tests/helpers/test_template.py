@@ -5607,6 +5607,55 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_entity_fields(hass: HomeAssistant) -> None:
+    """Test the fields read of the entities are kept."""
+    hass.states.async_set("sensor.state", "1", {"unit": "W"})
+    hass.states.async_set("sensor.attribute", "2", {"unit": "W"})
+    hass.states.async_set("sensor.both", "3", {"unit": "W"})
+    hass.states.async_set("sensor.whole", "4", {"unit": "W"})
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.state') }}"
+        "{{ state_attr('sensor.attribute', 'unit') }}"
+        "{{ states.sensor.both.state }}{{ is_state_attr('sensor.both', 'unit', 'W') }}"
+        "{{ state_attr('sensor.whole', 'unit') }}{{ states.sensor.whole.attributes }}"
+        "{{ state_attr('sensor.missing', 'unit') }}",
+    )
+    assert info.entities == {
+        "sensor.state",
+        "sensor.attribute",
+        "sensor.both",
+        "sensor.whole",
+        "sensor.missing",
+    }
+    assert info.entity_fields == {
+        "sensor.state": (True, frozenset()),
+        "sensor.attribute": (False, frozenset({"unit"})),
+        "sensor.both": (True, frozenset({"unit"})),
+        "sensor.missing": (False, frozenset({"unit"})),
+    }
+
+    old_state = hass.states.get("sensor.attribute")
+    hass.states.async_set("sensor.attribute", "5", {"unit": "W", "other": 1})
+    assert not info.fields_changed(
+        "sensor.attribute", old_state, hass.states.get("sensor.attribute")
+    )
+    assert info.fields_changed(
+        "sensor.state", old_state, hass.states.get("sensor.attribute")
+    )
+    assert info.fields_changed(
+        "sensor.whole", old_state, hass.states.get("sensor.attribute")
+    )
+
+    # The whole state of the entities of an iterated domain may be read
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.state') }}{{ states.sensor | list | count }}"
+        "{{ state_attr('light.kitchen', 'brightness') }}",
+    )
+    assert info.entity_fields == {"light.kitchen": (False, frozenset({"brightness"}))}
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -0,0 +1,79 @@
+"""Test the template bytecode cache."""
+
+import marshal
+from pathlib import Path
+from unittest.mock import patch
+
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+import pytest
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import template, template_bytecode
+
+
+async def test_bytecode_reused_after_restart(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test templates are not compiled again after a restart."""
+    hass.config.config_dir = str(tmp_path)
+    await template_bytecode.async_load(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert template.Template("{{ 2 + 2 }}", hass).async_render(limited=True) == 4
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert (tmp_path / ".storage" / template_bytecode.STORAGE_KEY).exists()
+
+    # A new run with new environments
+    for key in (
+        template._ENVIRONMENT,
+        template._ENVIRONMENT_LIMITED,
+        template._ENVIRONMENT_STRICT,
+    ):
+        hass.data.pop(key, None)
+    await template_bytecode.async_load(hass)
+    with patch.object(
+        ImmutableSandboxedEnvironment, "compile", side_effect=AssertionError
+    ):
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+        assert template.Template("{{ 2 + 2 }}", hass).async_render(limited=True) == 4
+
+    # The code is cached per flavor of the environment
+    bytecode_cache = hass.data[template_bytecode.DATA_TEMPLATE_BYTECODE]
+    assert bytecode_cache.get("normal", "{{ 1 + 1 }}") is not None
+    assert bytecode_cache.get("strict", "{{ 1 + 1 }}") is None
+
+
+async def test_bytecode_cache_of_another_version(
+    hass: HomeAssistant, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the code of another version or a broken file is not loaded."""
+    hass.config.config_dir = str(tmp_path)
+    bytecode_cache = template_bytecode.TemplateBytecodeCache(hass)
+    bytecode_cache.set("normal", "{{ 1 }}", compile("1", "<template>", "eval"))
+    with patch.object(template_bytecode, "_BYTECODE_HEADER", "0:other"):
+        bytecode_cache._save(dict(bytecode_cache._bytecode))
+
+    bytecode_cache = template_bytecode.TemplateBytecodeCache(hass)
+    bytecode_cache.load()
+    assert bytecode_cache.get("normal", "{{ 1 }}") is None
+
+    Path(bytecode_cache.path).write_bytes(b"broken")
+    bytecode_cache.load()
+    assert "Could not load the template bytecode cache" in caplog.text
+
+
+def test_bytecode_cache_evicts_least_recently_used(hass: HomeAssistant) -> None:
+    """Test the least recently used code is evicted above the maximum size."""
+    bytecode_cache = template_bytecode.TemplateBytecodeCache(hass)
+    code = compile("1", "<template>", "eval")
+    size = len(marshal.dumps(code))
+    with patch.object(template_bytecode, "MAX_BYTECODE_SIZE", size * 2):
+        bytecode_cache.set("normal", "one", code)
+        bytecode_cache.set("normal", "two", code)
+        assert bytecode_cache.get("normal", "one") == code
+        bytecode_cache.set("normal", "three", code)
+    assert bytecode_cache.get("normal", "two") is None
+    assert bytecode_cache.get("normal", "one") == code
+    assert bytecode_cache.get("normal", "three") == code
@@ -0,0 +1,65 @@
+"""Test the template render profiler."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import template, template_profiler
+from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.trace import trace_id_set
+
+
+async def test_template_profiling(hass: HomeAssistant) -> None:
+    """Test the renders of templates are recorded while profiling."""
+    source = "{{ states('sensor.power') }}"
+    assert template.Template(source, hass).async_render() == "unknown"
+    assert template_profiler.async_get_template_stats(hass) is None
+
+    template_profiler.async_start_template_profiling(hass)
+    assert template.Template(source, hass).async_render() == "unknown"
+    assert (
+        template.Template(source, hass).async_render(
+            {"this": template.TemplateStateFromEntityId(hass, "sensor.template")}
+        )
+        == "unknown"
+    )
+    assert (
+        template.Template(source, hass).async_render_with_possible_json_value(
+            "1", variables={"this": {"entity_id": "sensor.mqtt"}}
+        )
+        == "unknown"
+    )
+    trace_id_set(("automation.kitchen", "1"))
+    assert template.Template(source, hass).async_render() == "unknown"
+
+    stats = template_profiler.async_get_template_stats(hass)[source]
+    assert stats.renders == 4
+    assert stats.total_time >= stats.max_time > 0
+    assert stats.owners == {"sensor.template", "sensor.mqtt", "automation.kitchen"}
+
+    template_profiler.async_stop_template_profiling(hass)
+    assert template_profiler.async_get_template_stats(hass) is None
+
+
+async def test_template_profiling_triggers(hass: HomeAssistant) -> None:
+    """Test the state changes that re-render tracked templates are recorded."""
+    source = "{{ states('sensor.power') }}{{ states('sensor.energy') }}"
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template.Template(source, hass), None)],
+        lambda event, updates: None,
+    )
+    template_profiler.async_start_template_profiling(hass)
+
+    hass.states.async_set("sensor.power", "1")
+    hass.states.async_set("sensor.power", "2")
+    hass.states.async_set("sensor.energy", "3")
+    hass.states.async_set("sensor.other", "4")
+    info.async_refresh()
+    await hass.async_block_till_done()
+
+    stats = template_profiler.async_get_template_stats(hass)[source]
+    assert stats.renders == 4
+    assert stats.triggers == {
+        "sensor.power": 2,
+        "sensor.energy": 1,
+        template_profiler.TRIGGER_REFRESH: 1,
+    }
+    template_profiler.async_stop_template_profiling(hass)
@@ -355,6 +355,7 @@ async def test_async_create_task_schedule_coroutine_with_name() -> None:
 async def test_async_run_eager_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass._job_profiler = None
     calls = []
 
     def job():
@@ -379,6 +380,7 @@ async def test_async_run_eager_hass_job_calls_coro_function() -> None:
 async def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass._job_profiler = None
     calls = []
 
     def job():
@@ -389,6 +391,93 @@ async def test_async_run_hass_job_calls_callback() -> None:
     assert len(hass.async_add_job.mock_calls) == 0
 
 
+async def test_job_profiling(hass: HomeAssistant) -> None:
+    """Test recording the event loop time used by jobs."""
+    calls = []
+
+    @ha.callback
+    def callback_listener(event: ha.Event) -> None:
+        calls.append(event)
+
+    async def coro_listener(event: ha.Event) -> None:
+        calls.append(event)
+
+    def executor_listener(event: ha.Event) -> None:
+        calls.append(event)
+
+    hass.bus.async_listen("test_event", callback_listener)
+    hass.bus.async_listen("test_event", coro_listener)
+    hass.bus.async_listen("test_event", executor_listener)
+
+    assert hass.async_get_job_stats() is None
+    hass.async_start_job_profiling()
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event")
+    hass.async_add_hass_job(ha.HassJob(callback_listener), None)
+    await hass.async_block_till_done()
+    assert len(calls) == 7
+
+    job_stats = hass.async_get_job_stats()
+    prefix = f"{__name__}.test_job_profiling.<locals>"
+    callback_stats = job_stats[f"{prefix}.callback_listener"]
+    assert callback_stats.calls == 3
+    assert callback_stats.integration is None
+    assert callback_stats.total_time >= callback_stats.max_time > 0
+    assert job_stats[f"{prefix}.coro_listener"].calls == 2
+    assert f"{prefix}.executor_listener" not in job_stats
+
+    # Starting again keeps the recorded stats
+    hass.async_start_job_profiling()
+    assert hass.async_get_job_stats() is job_stats
+
+    hass.async_stop_job_profiling()
+    assert hass.async_get_job_stats() is None
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert callback_stats.calls == 3
+
+
+async def test_job_profiling_records_failed_callbacks(hass: HomeAssistant) -> None:
+    """Test callbacks that raise are still recorded."""
+
+    @ha.callback
+    def failing_listener(event: ha.Event) -> None:
+        raise ValueError
+
+    hass.bus.async_listen("test_event", failing_listener)
+    hass.async_start_job_profiling()
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    job_stats = hass.async_get_job_stats()
+    name = f"{__name__}.test_job_profiling_records_failed_callbacks.<locals>"
+    assert job_stats[f"{name}.failing_listener"].calls == 1
+    hass.async_stop_job_profiling()
+
+
+@pytest.mark.parametrize(
+    ("module", "integration"),
+    [
+        ("homeassistant.components.zha.entity", "zha"),
+        ("homeassistant.components.zha", "zha"),
+        ("custom_components.hacs.base", "hacs"),
+        ("homeassistant.helpers.event", None),
+        ("homeassistant.core", None),
+    ],
+)
+def test_hassjob_integration(module: str, integration: str | None) -> None:
+    """Test the integration that owns a job is found from the target module."""
+
+    def target() -> None:
+        """Mock target."""
+
+    target.__module__ = module
+    job = ha.HassJob(functools.partial(target))
+    assert job.profile_name == f"{module}.{target.__qualname__}"
+    assert job.integration == integration
+
+
 async def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
@@ -1560,6 +1649,197 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "off", {"brightness": 10})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events = []
+
+    @ha.callback
+    def reported_listener(event: ha.Event[ha.EventStateReportedData]) -> None:
+        """Record state reported events."""
+        reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        reported_listener,
+        event_filter=ha.callback(lambda event_data: True),
+    )
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 10}),
+            ("switch.ac", "off", None),
+            ("light.bowl", "on", {"brightness": 20}),
+            ("sensor.power", 15, {"unit_of_measurement": "W"}),
+        ],
+        context=context,
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.bowl").attributes == {"brightness": 20}
+    assert hass.states.get("switch.ac").state == "off"
+    assert hass.states.get("sensor.power").state == "15"
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "switch.ac",
+        "light.bowl",
+        "sensor.power",
+    ]
+    assert all(event.context is context for event in events)
+    # Per entity ordering is kept and each write sees the previous one
+    assert events[0].data["old_state"].state == "off"
+    assert events[2].data["old_state"] is events[0].data["new_state"]
+    assert len({event.time_fired_timestamp for event in events}) == 1
+    assert not reported_events
+
+    hass.states.async_set_many([("switch.ac", "off", None)])
+    await hass.async_block_till_done()
+    assert len(events) == 4
+    assert len(reported_events) == 1
+
+
+async def test_statemachine_set_many_own_context(hass: HomeAssistant) -> None:
+    """Test writes of async_set_many get their own context if none is passed."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many([("light.bowl", "on", None), ("light.desk", "on", None)])
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert events[0].context is not events[1].context
+    assert events[0].context.id != events[1].context.id
+
+
+async def test_statemachine_set_many_listeners_see_each_write(
+    hass: HomeAssistant,
+) -> None:
+    """Test listeners see the state machine match the event they handle."""
+    calls: list[tuple[str, bool, bool]] = []
+
+    @ha.callback
+    def listener(event: ha.Event[ha.EventStateChangedData]) -> None:
+        """Record the state machine as seen from the listener."""
+        new_state = event.data["new_state"]
+        calls.append(
+            (
+                new_state.state,
+                hass.states.get("light.bowl") is new_state,
+                hass.states.get("light.desk") is not None,
+            )
+        )
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        listener,
+        event_filter=ha.callback(
+            lambda event_data: event_data["entity_id"] == "light.bowl"
+        ),
+    )
+
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "1", None),
+            ("light.desk", "on", None),
+            ("light.bowl", "2", None),
+        ]
+    )
+    assert calls == [("1", True, False), ("2", True, True)]
+
+
+async def test_statemachine_compact(hass: HomeAssistant) -> None:
+    """Test the state machine in compact mode."""
+    hass.states.async_set("light.existing", "on")
+    hass.states.async_set_compact(True)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    now = dt_util.utcnow()
+
+    with freeze_time(now):
+        hass.states.async_set("light.bowl", "on", {"friendly_name": "Bowl"})
+        hass.states.async_set("light.desk", "on", {"brightness": 10, "color": "red"})
+        hass.states.async_set("light.lamp", "on", {"brightness": 10, "color": "red"})
+    await hass.async_block_till_done()
+
+    assert not isinstance(hass.states.get("light.existing"), ha.CompactState)
+    bowl = hass.states.get("light.bowl")
+    assert isinstance(bowl, ha.CompactState)
+    assert bowl.last_changed == now
+    assert bowl.last_updated == now
+    assert bowl.last_reported == now
+    assert bowl.last_changed_timestamp == now.timestamp()
+    assert bowl.last_reported_timestamp == now.timestamp()
+    assert bowl.last_updated_timestamp == now.timestamp()
+    assert bowl.attributes == {"friendly_name": "Bowl"}
+    assert bowl.name == "Bowl"
+    assert bowl.domain == "light"
+    assert bowl.object_id == "bowl"
+    assert events[0].data["new_state"] is bowl
+    # Identical attributes are interned
+    assert (
+        hass.states.get("light.desk").attributes
+        is hass.states.get("light.lamp").attributes
+    )
+    assert bowl.as_dict()["last_changed"] == now.isoformat()
+    assert ha.State.from_dict(bowl.as_dict()).last_changed == now
+
+    # Only attributes change, last_changed is kept
+    later = now + timedelta(seconds=5)
+    with freeze_time(later):
+        hass.states.async_set("light.bowl", "on", {"friendly_name": "New Bowl"})
+    bowl = hass.states.get("light.bowl")
+    assert bowl.last_changed == now
+    assert bowl.last_updated == later
+    assert bowl.as_compressed_state["lu"] == later.timestamp()
+
+    # Same state and attributes, only last_reported changes
+    reported = later + timedelta(seconds=5)
+    with freeze_time(reported):
+        hass.states.async_set("light.bowl", "on", {"friendly_name": "New Bowl"})
+    assert hass.states.get("light.bowl") is bowl
+    assert bowl.last_reported == reported
+    assert bowl.last_reported_timestamp == reported.timestamp()
+    assert bowl.last_updated == later
+
+    # Equal attributes of different types are not shared
+    hass.states.async_set("light.desk", "on", {"level": True, "range": (1, 2)})
+    hass.states.async_set("light.lamp", "on", {"level": 1, "range": (1, 2)})
+    hass.states.async_set("light.bowl", "on", {"level": 1.0, "range": (1.0, 2)})
+    for entity_id, level, level_range in (
+        ("light.desk", "true", "[1,2]"),
+        ("light.lamp", "1", "[1,2]"),
+        ("light.bowl", "1.0", "[1.0,2]"),
+    ):
+        assert json_dumps(hass.states.get(entity_id).attributes) == (
+            f'{{"level":{level},"range":{level_range}}}'
+        )
+
+    # Unhashable attributes are not interned
+    hass.states.async_set("light.desk", "on", {"effects": ["a", "b"]})
+    hass.states.async_set("light.lamp", "on", {"effects": ["a", "b"]})
+    assert hass.states.get("light.desk").attributes == {"effects": ["a", "b"]}
+    assert (
+        hass.states.get("light.desk").attributes
+        is not hass.states.get("light.lamp").attributes
+    )
+
+    hass.states.async_set_compact(False)
+    hass.states.async_set("light.bowl", "off")
+    assert not isinstance(hass.states.get("light.bowl"), ha.CompactState)
+
+
+async def test_statemachine_compact_invalid_state(hass: HomeAssistant) -> None:
+    """Test compact states are validated."""
+    hass.states.async_set_compact(True)
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set("invalid_entity_format", "on")
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set("light.bowl", "x" * 256)
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
@@ -27,7 +27,7 @@ from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
     __version__,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import CompactState, HomeAssistant, State
 from homeassistant.core_config import (
     _CUSTOMIZE_DICT_SCHEMA,
     CORE_CONFIG_SCHEMA,
@@ -1070,6 +1070,20 @@ async def test_debug_mode_defaults_to_off(hass: HomeAssistant) -> None:
     assert not hass.config.debug
 
 
+async def test_compact_states(hass: HomeAssistant) -> None:
+    """Test compact states are enabled from the core config."""
+    hass.states.async_set("light.regular", "on")
+    await async_process_ha_core_config(hass, {"compact_states": True})
+    hass.states.async_set("light.compact", "on")
+    assert type(hass.states.get("light.regular")) is State
+    assert type(hass.states.get("light.compact")) is CompactState
+
+    # Reloading the core config without the option disables them
+    await async_process_ha_core_config(hass, {})
+    hass.states.async_set("light.compact", "off")
+    assert type(hass.states.get("light.compact")) is State
+
+
 async def test_set_time_zone_deprecated(hass: HomeAssistant) -> None:
     """Test set_time_zone is deprecated."""
     with pytest.raises(